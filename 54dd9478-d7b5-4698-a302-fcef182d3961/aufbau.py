@@ -0,0 +1,73 @@
+from bisect import bisect_left
+from itertools import accumulate
+
+import numpy as np
+
+ORBITAL_ORDER = ['1s', '2s', '2p', '3s', '3p', '4s', '3d', '4p', '5s', '4d',
+                 '5p', '6s', '4f', '5d', '6p', '7s', '5f', '6d', '7p']
+ORBITAL_CAPACITY = {'s': 2, 'p': 6, 'd': 10, 'f': 14}
+MAX_ATOMIC_NUMBER = 118
+
+_SUPERSCRIPTS = str.maketrans("0123456789", "⁰¹²³⁴⁵⁶⁷⁸⁹")
+
+
+def _count(electrons, superscript):
+    return str(electrons).translate(_SUPERSCRIPTS) if superscript else str(electrons)
+
+
+# Built once at import: the atomic number that completes each orbital
+# (2, 4, 10, 12, ...), the block of every atomic number (index 0 unused),
+# and the configuration text of every run of completely filled orbitals
+BOUNDARIES = list(accumulate(ORBITAL_CAPACITY[orbital[-1]] for orbital in ORBITAL_ORDER))
+BLOCK_TABLE = [''] + [ORBITAL_ORDER[bisect_left(BOUNDARIES, z)][-1] for z in range(1, MAX_ATOMIC_NUMBER + 1)]
+_BLOCK_CODES = np.array(BLOCK_TABLE, dtype='<U1')
+_FILLED_PREFIXES = {
+    superscript: list(accumulate(
+        (f"{orbital}{_count(ORBITAL_CAPACITY[orbital[-1]], superscript)} " for orbital in ORBITAL_ORDER), initial=""))
+    for superscript in (False, True)
+}
+
+
+def _check_atomic_number(atomic_number):
+    if isinstance(atomic_number, bool) or not isinstance(atomic_number, (int, np.integer)):
+        raise TypeError(f"Atomic number must be an integer, not {type(atomic_number).__name__}")
+    if not 1 <= atomic_number <= MAX_ATOMIC_NUMBER:
+        raise ValueError(f"Atomic number must be between 1 and {MAX_ATOMIC_NUMBER}, got {atomic_number}")
+
+
+def block(atomic_number):
+    """Block ('s', 'p', 'd' or 'f') of the subshell the last electron fills; O(1)."""
+    _check_atomic_number(atomic_number)
+    return BLOCK_TABLE[atomic_number]
+
+
+def blocks(atomic_numbers):
+    """Blocks of an array of atomic numbers at once, as a '<U1' array of the same shape.
+
+    Empty input gives an empty result of the same shape. Non-integer arrays
+    raise TypeError; any number outside 1-118 raises ValueError naming how
+    many and the first few positions.
+    """
+    atomic_numbers = np.asarray(atomic_numbers)
+    # np.asarray([]) is float64, so an empty batch has to be let through first
+    if atomic_numbers.size == 0:
+        return np.empty(atomic_numbers.shape, dtype='<U1')
+    if atomic_numbers.dtype.kind not in 'iu':
+        raise TypeError(f"Atomic numbers must be integers, not {atomic_numbers.dtype}")
+    invalid = (atomic_numbers < 1) | (atomic_numbers > MAX_ATOMIC_NUMBER)
+    if invalid.any():
+        positions = np.argwhere(invalid)[:5].tolist()
+        raise ValueError(f"{int(invalid.sum())} atomic numbers outside 1-{MAX_ATOMIC_NUMBER}, e.g. at {positions}")
+    return _BLOCK_CODES[atomic_numbers]
+
+
+def electron_configuration(atomic_number, superscript=True):
+    """Aufbau configuration such as '1s² 2s² 2p⁶ 3s¹' (no exceptions applied).
+
+    The completely filled orbitals come from the cached prefix table; only
+    the last, partly filled orbital is formatted per call.
+    """
+    _check_atomic_number(atomic_number)
+    last = bisect_left(BOUNDARIES, atomic_number)
+    electrons = atomic_number - (BOUNDARIES[last - 1] if last else 0)
+    return f"{_FILLED_PREFIXES[superscript][last]}{ORBITAL_ORDER[last]}{_count(electrons, superscript)}"
@@ -0,0 +1,146 @@
+import sys
+import json
+import heapq
+import argparse
+from collections import deque
+
+from trait_stream import decide
+
+
+class Pedigree:
+    """A family tree resolved with traitDecider's dominance rule.
+
+    Founders carry their own traits; everyone else inherits
+    decide(father's traits, mother's traits). Individuals are resolved once,
+    in topological order, and their inherited traits are memoized. Editing a
+    founder re-resolves only its descendants, and stops going down a branch
+    as soon as an individual's traits come out unchanged.
+    """
+
+    def __init__(self):
+        self.founder_traits = {}
+        self.parents = {}
+        self.children = {}
+        self.resolved = {}
+        self._position = None
+
+    @classmethod
+    def from_records(cls, records):
+        """Build from {"id", "traits"} founder records and {"id", "father", "mother"} child records."""
+        pedigree = cls()
+        for record in records:
+            if "traits" in record:
+                pedigree.add_founder(record["id"], record["traits"])
+            else:
+                pedigree.add_child(record["id"], record["father"], record["mother"])
+        return pedigree
+
+    def _add(self, individual):
+        if individual in self.founder_traits or individual in self.parents:
+            raise ValueError(f"Individual {individual!r} is already in the pedigree")
+        self.children.setdefault(individual, [])
+        self._position = None
+
+    def add_founder(self, individual, traits):
+        self._add(individual)
+        self.founder_traits[individual] = dict(traits)
+
+    def add_child(self, individual, father, mother):
+        # Parents may be added later; resolve() checks that they all exist
+        self._add(individual)
+        self.parents[individual] = (father, mother)
+        for parent in {father, mother}:
+            self.children.setdefault(parent, []).append(individual)
+
+    def __len__(self):
+        return len(self.founder_traits) + len(self.parents)
+
+    def topological_order(self):
+        """Kahn's algorithm; raises ValueError on unknown parents or cycles."""
+        missing = sorted({p for pair in self.parents.values() for p in pair
+                          if p not in self.founder_traits and p not in self.parents}, key=str)
+        if missing:
+            raise ValueError(f"Unknown parents: {', '.join(map(str, missing[:10]))}")
+        pending = {individual: len(set(pair)) for individual, pair in self.parents.items()}
+        queue = deque(self.founder_traits)
+        order = []
+        while queue:
+            individual = queue.popleft()
+            order.append(individual)
+            for child in self.children.get(individual, []):
+                pending[child] -= 1
+                if pending[child] == 0:
+                    queue.append(child)
+        if len(order) != len(self):
+            cyclic = sorted((i for i, count in pending.items() if count > 0), key=str)
+            raise ValueError(f"Pedigree has a cycle through: {', '.join(map(str, cyclic[:10]))}")
+        self._position = {individual: i for i, individual in enumerate(order)}
+        return order
+
+    def _compute(self, individual):
+        if individual in self.founder_traits:
+            return decide(self.founder_traits[individual], {})
+        father, mother = self.parents[individual]
+        return decide(self.resolved[father], self.resolved[mother])
+
+    def resolve(self):
+        """Resolve every individual not resolved yet, in one topological pass."""
+        for individual in self.topological_order():
+            if individual not in self.resolved:
+                self.resolved[individual] = self._compute(individual)
+        return self.resolved
+
+    def traits(self, individual):
+        if individual not in self.resolved:
+            self.resolve()
+        return self.resolved[individual]
+
+    def update_traits(self, founder, traits):
+        """Replace a founder's traits; returns the individuals whose traits changed, in order."""
+        if founder not in self.founder_traits:
+            raise ValueError(f"{founder!r} is not a founder")
+        if self._position is None or len(self.resolved) != len(self):
+            self.resolve()
+        self.founder_traits[founder] = dict(traits)
+
+        # Walk the descendants in topological order; a child is only queued
+        # when one of its parents actually changed
+        changed = []
+        queue = [(self._position[founder], founder)]
+        queued = {founder}
+        while queue:
+            _, individual = heapq.heappop(queue)
+            traits = self._compute(individual)
+            if traits == self.resolved[individual]:
+                continue
+            self.resolved[individual] = traits
+            changed.append(individual)
+            for child in self.children.get(individual, []):
+                if child not in queued:
+                    queued.add(child)
+                    heapq.heappush(queue, (self._position[child], child))
+        return changed
+
+
+def read_records_jsonl(path):
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            if line.strip():
+                yield json.loads(line)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Resolve inherited traits across a JSONL pedigree.")
+    parser.add_argument("input", help='JSONL of {"id", "traits"} founders and {"id", "father", "mother"} children')
+    parser.add_argument("-o", "--output", help="JSONL file for the resolved traits (default: stdout)")
+    args = parser.parse_args()
+
+    pedigree = Pedigree.from_records(read_records_jsonl(args.input))
+    resolved = pedigree.resolve()
+    out = open(args.output, 'w', encoding='utf-8') if args.output else sys.stdout
+    try:
+        for individual in pedigree.topological_order():
+            out.write(json.dumps({"id": individual, "traits": resolved[individual]}) + "\n")
+    finally:
+        if out is not sys.stdout:
+            out.close()
@@ -0,0 +1,129 @@
+import os
+import sys
+import json
+import argparse
+from collections import deque
+from functools import lru_cache
+from itertools import islice
+from concurrent.futures import ProcessPoolExecutor
+
+DEFAULT_CHUNK_SIZE = 1000
+TRAIT_CACHE_SIZE = 1 << 16
+
+
+@lru_cache(maxsize=TRAIT_CACHE_SIZE)
+def dominance(value):
+    # (stripped value, number of capital letters), computed once per distinct trait string
+    stripped = value.strip()
+    return stripped, sum(1 for ch in stripped if ch.isupper())
+
+
+def decide(fathers_trait, mothers_trait):
+    """Same result as traitDecider, with the capital counts cached."""
+    for parent, traits in (("father", fathers_trait), ("mother", mothers_trait)):
+        for trait, value in traits.items():
+            if not isinstance(value, str):
+                raise TypeError(f"All trait values must be strings,  but {parent}'s '{trait}' is {type(value).__name__}")
+
+    inherited = {}
+    for trait, value in fathers_trait.items():
+        father_value, father_count = dominance(value)
+        mother_value, mother_count = dominance(mothers_trait.get(trait, ""))
+        # Equal counts keep the father's trait
+        inherited[trait] = mother_value if mother_count > father_count else father_value
+    for trait, value in mothers_trait.items():
+        if trait not in fathers_trait:
+            mother_value, mother_count = dominance(value)
+            inherited[trait] = mother_value if mother_count > 0 else ""
+    return inherited
+
+
+def _pair(item):
+    if isinstance(item, dict):
+        parents = []
+        for parent in ("father", "mother"):
+            key = next((k for k in (parent, f"{parent}s_trait") if k in item), None)
+            if key is None:
+                shown = repr(item)
+                raise ValueError(f"Record has no {parent}'s traits ('{parent}' or '{parent}s_trait'): "
+                                 f"{shown if len(shown) <= 80 else shown[:77] + '...'}")
+            parents.append(item[key])
+        return tuple(parents)
+    father, mother = item
+    return father, mother
+
+
+def read_pairs_jsonl(source):
+    """Yield (father, mother) pairs from a JSONL path or file object, one line at a time.
+
+    Each line is {"father": {...}, "mother": {...}} (or fathers_trait /
+    mothers_trait keys) or [{...}, {...}]. A record missing either parent
+    raises ValueError naming its line.
+    """
+    f = open(source, 'r', encoding='utf-8') if isinstance(source, str) else source
+    try:
+        for number, line in enumerate(f, start=1):
+            if line.strip():
+                try:
+                    pair = _pair(json.loads(line))
+                except ValueError as e:
+                    raise ValueError(f"Line {number}: {e}") from e
+                yield pair
+    finally:
+        if f is not source:
+            f.close()
+
+
+def iter_decide(pairs):
+    """Yield the inherited dict of every (father, mother) pair, lazily."""
+    for item in pairs:
+        yield decide(*_pair(item))
+
+
+def _decide_chunk(chunk):
+    return [decide(father, mother) for father, mother in chunk]
+
+
+def stream_decide(pairs, workers=None, chunk_size=DEFAULT_CHUNK_SIZE, max_in_flight=None):
+    """Like iter_decide, but chunks of pairs are resolved on worker processes.
+
+    Results come out in input order. At most max_in_flight chunks (default
+    twice the workers) are submitted ahead of the consumer, so memory stays
+    bounded however long pairs is. A TypeError from a worker is re-raised
+    when its chunk is reached.
+    """
+    if workers == 1:
+        yield from iter_decide(pairs)
+        return
+    workers = workers or os.cpu_count() or 1
+    max_in_flight = max_in_flight or 2 * workers
+    pairs = (_pair(item) for item in pairs)
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        in_flight = deque()
+        while True:
+            while len(in_flight) < max_in_flight:
+                chunk = list(islice(pairs, chunk_size))
+                if not chunk:
+                    break
+                in_flight.append(executor.submit(_decide_chunk, chunk))
+            if not in_flight:
+                return
+            yield from in_flight.popleft().result()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Resolve inherited traits for a JSONL file of parent pairs.")
+    parser.add_argument("input", help="JSONL file of parent pairs ('-' for stdin)")
+    parser.add_argument("-o", "--output", help="JSONL file for the inherited dicts (default: stdout)")
+    parser.add_argument("-j", "--jobs", type=int, help="worker processes (default: number of CPUs)")
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE)
+    args = parser.parse_args()
+
+    source = sys.stdin if args.input == "-" else args.input
+    out = open(args.output, 'w', encoding='utf-8') if args.output else sys.stdout
+    try:
+        for inherited in stream_decide(read_pairs_jsonl(source), args.jobs, args.chunk_size):
+            out.write(json.dumps(inherited) + "\n")
+    finally:
+        if out is not sys.stdout:
+            out.close()
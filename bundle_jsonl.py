@@ -0,0 +1,124 @@
+import os
+import sys
+import gzip
+import json
+import hashlib
+import argparse
+
+from finish_problem import CSV_HEADER, write_csv
+
+JSONL_FORMAT = "pebble-bundle"
+JSONL_VERSION = 1
+DEFAULT_JSONL_OUTPUT = "bundle.jsonl.gz"
+
+CHUNK_SEPARATOR = "\n\n"
+# Shorter paragraphs are cheaper inline than as a 64-character blob reference
+MIN_BLOB_CHARS = 128
+TEXT_FIELDS = ('prompt', 'solution', 'test')
+
+class JsonlBundleWriter:
+    """Write problem rows (in CSV_HEADER order) to a gzip JSONL bundle as they arrive.
+
+    The first line is a header. With blobs=True, prompt, solution and test
+    are split into paragraphs; each paragraph of MIN_BLOB_CHARS or more is
+    stored once as a {"blob": sha256, "text": ...} line, written just before
+    the first record that uses it, and records refer to it as {"$blob": sha256}.
+    Problems cloned from the same seed then share their boilerplate.
+    """
+
+    def __init__(self, path, blobs=True):
+        self.path = path
+        self.blobs = blobs
+        self.seen = set()
+        self.records = 0
+        self.file = gzip.open(path, 'wt', encoding='utf-8')
+        self._write({'format': JSONL_FORMAT, 'version': JSONL_VERSION, 'blobs': blobs})
+
+    def _write(self, obj):
+        self.file.write(json.dumps(obj, ensure_ascii=False, separators=(',', ':')) + "\n")
+
+    def _chunks(self, text):
+        chunks = []
+        for chunk in text.split(CHUNK_SEPARATOR):
+            if len(chunk) < MIN_BLOB_CHARS:
+                chunks.append(chunk)
+                continue
+            digest = hashlib.sha256(chunk.encode('utf-8')).hexdigest()
+            if digest not in self.seen:
+                self.seen.add(digest)
+                self._write({'blob': digest, 'text': chunk})
+            chunks.append({'$blob': digest})
+        return chunks
+
+    def write_row(self, row):
+        record = dict(zip(CSV_HEADER, row))
+        if self.blobs:
+            for field in TEXT_FIELDS:
+                record[field] = self._chunks(record[field])
+        self._write(record)
+        self.records += 1
+
+    def close(self):
+        self.file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+def read_jsonl_bundle(path):
+    """Yield the rows of a JSONL bundle in CSV_HEADER order, one record at a time."""
+    blobs = {}
+    with gzip.open(path, 'rt', encoding='utf-8') as f:
+        header = json.loads(f.readline() or "{}")
+        if header.get('format') != JSONL_FORMAT or header.get('version') != JSONL_VERSION:
+            raise Exception(f"❌ {path} is not a version {JSONL_VERSION} {JSONL_FORMAT} file")
+        for line_number, line in enumerate(f, start=2):
+            record = json.loads(line)
+            if 'blob' in record:
+                blobs[record['blob']] = record['text']
+                continue
+            for field in TEXT_FIELDS:
+                if isinstance(record[field], list):
+                    try:
+                        record[field] = CHUNK_SEPARATOR.join(
+                            chunk if isinstance(chunk, str) else blobs[chunk['$blob']] for chunk in record[field])
+                    except KeyError as e:
+                        raise Exception(f"❌ {path}:{line_number} refers to missing blob {e}") from e
+            yield [record[column] for column in CSV_HEADER]
+
+def jsonl_to_csv(path, output_file):
+    """Write the rows of a JSONL bundle to output_file as they are read; returns the row count.
+
+    A bundle that turns out to be broken part-way leaves output_file as it was.
+    """
+    count = 0
+    def counted(rows):
+        nonlocal count
+        for row in rows:
+            count += 1
+            yield row
+
+    tmp_path = f"{output_file}.tmp"
+    try:
+        write_csv(tmp_path, counted(read_jsonl_bundle(path)))
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+    os.replace(tmp_path, output_file)
+    return count
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Convert a JSONL bundle back to the submission CSV.")
+    parser.add_argument("input", help=f"gzip JSONL bundle (e.g. {DEFAULT_JSONL_OUTPUT})")
+    parser.add_argument("-o", "--output", default="bundle.csv", help="CSV to write (default: bundle.csv)")
+    args = parser.parse_args()
+
+    try:
+        count = jsonl_to_csv(args.input, args.output)
+    except Exception as e:
+        print(e)
+        sys.exit(1)
+    print(f"✅ Bundle created: {args.output} ({count} problem{'s' if count != 1 else ''})")
@@ -0,0 +1,173 @@
+import os
+import sys
+import argparse
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+DEFAULT_CHUNK_BYTES = 1 << 24
+NEWLINE = ord('\n')
+LOOKAHEAD = 1 << 12
+_POWERS_OF_TEN = 10 ** np.arange(19, dtype=np.int64)
+
+
+def find_faulty_servers(status_codes):
+    """Indices of the status codes in the 500-599 range (the list-based reference)."""
+    return [index for index, code in enumerate(status_codes) if 500 <= code <= 599]
+
+
+def faulty_mask(codes):
+    return (codes >= 500) & (codes <= 599)
+
+
+def _scan_binary_chunk(job):
+    path, first, count = job
+    codes = np.memmap(path, dtype='<u2', mode='r', offset=first * 2, shape=(count,))
+    return np.flatnonzero(faulty_mask(codes)) + first, count, None
+
+
+def _line_start_at_or_after(data, position):
+    # Lines start at 0 and right after every newline
+    if position <= 0:
+        return 0
+    while position - 1 < len(data):
+        window = data[position - 1:position - 1 + LOOKAHEAD]
+        newlines = np.flatnonzero(window == NEWLINE)
+        if len(newlines):
+            return position + int(newlines[0])
+        position += LOOKAHEAD
+    return len(data)
+
+
+def _describe_lines(lines):
+    shown = ", ".join(str(line) for line in lines[:10])
+    return f"{shown} ..." if len(lines) > 10 else shown
+
+
+def _parse_lines(data):
+    # (codes, indices of the lines that are not a status code), both per line
+    if not len(data):
+        return np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.int64)
+    newlines = np.flatnonzero(data == NEWLINE)
+    ends = newlines + 1 if len(newlines) and newlines[-1] == len(data) - 1 else np.r_[newlines + 1, len(data)]
+    starts = np.r_[0, ends[:-1]]
+    is_digit = (data >= ord('0')) & (data <= ord('9'))
+    # Place value of each digit: how many digits follow it on its line
+    digits_before = np.cumsum(is_digit, dtype=np.int32)
+    line_digits = digits_before[ends - 1]
+    line_of_byte = np.repeat(np.arange(len(ends), dtype=np.int32), ends - starts)
+    following = np.minimum(line_digits[line_of_byte] - digits_before, 18)
+    contributions = _POWERS_OF_TEN[following]
+    contributions *= np.where(is_digit, data - ord('0'), 0)
+    codes = np.add.reduceat(contributions, starts)
+
+    # A valid line is exactly one run of digits, padded only by spaces, tabs or '\r'
+    padding = (data == ord(' ')) | (data == ord('\t')) | (data == ord('\r')) | (data == NEWLINE)
+    runs = is_digit.copy()
+    runs[1:] &= ~is_digit[:-1]
+    invalid = (np.add.reduceat(runs.astype(np.int32), starts) != 1) \
+        | (np.add.reduceat((~(is_digit | padding)).astype(np.int32), starts) > 0)
+    return codes, np.flatnonzero(invalid)
+
+
+def parse_status_lines(data):
+    """Status code of every line of a bytes array, vectorized.
+
+    Each line holds one non-negative code, optionally padded with spaces,
+    tabs or '\\r' (so CRLF files parse). A final line without a trailing
+    newline still counts. Blank lines, signs and any other characters raise
+    ValueError naming the first offending lines (1-based).
+    """
+    codes, invalid = _parse_lines(data)
+    if len(invalid):
+        raise ValueError(f"{len(invalid)} lines are not status codes: lines {_describe_lines(invalid + 1)}")
+    return codes
+
+
+def _scan_text_chunk(job):
+    path, start, end = job
+    data = np.memmap(path, dtype=np.uint8, mode='r')
+    # Each line belongs to the chunk its first byte falls in
+    first, last = _line_start_at_or_after(data, start), _line_start_at_or_after(data, end)
+    codes, invalid = _parse_lines(data[first:last])
+    return np.flatnonzero(faulty_mask(codes)), len(codes), invalid[:11]
+
+
+def _ordered(executor, function, jobs, max_in_flight):
+    # Submit ahead of the consumer, but never more than max_in_flight chunks
+    jobs = iter(jobs)
+    in_flight = deque()
+    while True:
+        for job in jobs:
+            in_flight.append(executor.submit(function, job) if executor else function(job))
+            if len(in_flight) >= max_in_flight:
+                break
+        if not in_flight:
+            return
+        result = in_flight.popleft()
+        yield result.result() if executor else result
+
+
+def iter_faulty(path, fmt=None, chunk_bytes=DEFAULT_CHUNK_BYTES, workers=None, max_in_flight=None):
+    """Yield arrays of global faulty indices in a status file, chunk by chunk, in order.
+
+    fmt is "binary" (little-endian uint16 codes) or "text" (one code per
+    line); by default files ending in .bin or .u16 are binary. Chunks are
+    memory-mapped and scanned on a process pool with at most max_in_flight
+    (default twice the workers) chunks pending, so memory stays bounded by
+    the chunk size, not the file size. Text lines follow parse_status_lines;
+    the first chunk with a malformed line raises ValueError with file-wide
+    line numbers, after the indices of the chunks before it were yielded.
+    """
+    fmt = fmt or ("binary" if path.endswith((".bin", ".u16")) else "text")
+    size = os.path.getsize(path)
+    if size == 0:
+        return
+    workers = workers or os.cpu_count() or 1
+    max_in_flight = max_in_flight or 2 * workers
+
+    if fmt == "binary":
+        if size % 2:
+            raise ValueError(f"{path} is not a uint16 file ({size} bytes)")
+        total, per_chunk = size // 2, max(1, chunk_bytes // 2)
+        jobs = ((path, first, min(per_chunk, total - first)) for first in range(0, total, per_chunk))
+        function = _scan_binary_chunk
+    elif fmt == "text":
+        jobs = ((path, start, min(start + chunk_bytes, size)) for start in range(0, size, chunk_bytes))
+        function = _scan_text_chunk
+    else:
+        raise ValueError(f"Unknown status file format {fmt!r}")
+
+    executor = ProcessPoolExecutor(max_workers=workers) if workers > 1 else None
+    try:
+        offset = 0
+        for indices, count, invalid in _ordered(executor, function, jobs, max_in_flight):
+            if invalid is not None and len(invalid):
+                raise ValueError(f"{path}: lines {_describe_lines(invalid + offset + 1)} are not status codes")
+            # Text chunks only know their line count once scanned
+            yield indices if fmt == "binary" else indices + offset
+            offset += count
+    finally:
+        if executor:
+            executor.shutdown(cancel_futures=True)
+
+
+def find_faulty_servers_in_file(path, fmt=None, chunk_bytes=DEFAULT_CHUNK_BYTES, workers=None):
+    """All faulty indices of a status file as one list, matching find_faulty_servers."""
+    return [int(index) for indices in iter_faulty(path, fmt, chunk_bytes, workers) for index in indices]
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Print the indices of faulty (5xx) servers in a status file.")
+    parser.add_argument("path")
+    parser.add_argument("--format", choices=["binary", "text"],
+                        help="binary: little-endian uint16 codes; text: one code per line "
+                             "(default: binary for .bin/.u16 files)")
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_BYTES, metavar="BYTES")
+    parser.add_argument("-j", "--jobs", type=int, help="worker processes (default: number of CPUs)")
+    args = parser.parse_args()
+
+    for indices in iter_faulty(args.path, args.format, args.chunk_size, args.jobs):
+        if len(indices):
+            sys.stdout.write("\n".join(map(str, indices.tolist())) + "\n")
@@ -0,0 +1,156 @@
+import time
+import asyncio
+from collections import OrderedDict, deque
+
+DEFAULT_WINDOW_SECONDS = 300
+DEFAULT_BUCKET_SECONDS = 1
+
+
+def is_faulty(code):
+    return 500 <= code <= 599
+
+
+class FleetHealthMonitor:
+    """Live view of which server slots are faulty, updated one status change at a time.
+
+    update() is O(1): it keeps the current code per slot, the current faulty
+    slots (a dict used as an ordered set), the time each slot last reported a
+    5xx (kept in report order), and per-bucket 5xx counts over the last
+    window_seconds. faulty_servers() after any sequence of updates equals
+    find_faulty_servers over the current codes.
+
+    Every update is stamped with clock(), the same clock recent_faulty() and
+    fault_count() measure their windows against, so report times are always
+    in order and in one time base. clock returns the current time in
+    seconds; pass a fake one in tests.
+    """
+
+    def __init__(self, window_seconds=DEFAULT_WINDOW_SECONDS, bucket_seconds=DEFAULT_BUCKET_SECONDS,
+                 clock=time.monotonic):
+        self.window_seconds = window_seconds
+        self.bucket_seconds = bucket_seconds
+        self.clock = clock
+        self.codes = {}
+        self.faulty = {}
+        self.last_fault = OrderedDict()
+        self.buckets = deque()  # [bucket number, 5xx reports in it], oldest first
+
+    @classmethod
+    def from_status_codes(cls, status_codes, **options):
+        monitor = cls(**options)
+        for slot, code in enumerate(status_codes):
+            monitor.update(slot, code)
+        return monitor
+
+    def _expire(self, now):
+        cutoff = now - self.window_seconds
+        while self.last_fault:
+            reported = next(iter(self.last_fault.values()))
+            if reported >= cutoff:
+                break
+            self.last_fault.popitem(last=False)
+        oldest_bucket = int(cutoff // self.bucket_seconds)
+        while self.buckets and self.buckets[0][0] < oldest_bucket:
+            self.buckets.popleft()
+
+    def update(self, slot, code):
+        """Record the status code a slot now reports, at the current clock time."""
+        now = self.clock()
+        self.codes[slot] = code
+        if is_faulty(code):
+            self.faulty[slot] = None
+            # Re-inserting keeps last_fault ordered by report time
+            self.last_fault.pop(slot, None)
+            self.last_fault[slot] = now
+            bucket = int(now // self.bucket_seconds)
+            if self.buckets and self.buckets[-1][0] == bucket:
+                self.buckets[-1][1] += 1
+            else:
+                self.buckets.append([bucket, 1])
+        else:
+            self.faulty.pop(slot, None)
+        self._expire(now)
+
+    def remove(self, slot):
+        """Forget a slot entirely (e.g. a decommissioned server)."""
+        self.codes.pop(slot, None)
+        self.faulty.pop(slot, None)
+        self.last_fault.pop(slot, None)
+
+    def current_faulty(self):
+        """Slots whose current code is 5xx, in the order they became faulty; O(k)."""
+        return list(self.faulty)
+
+    def faulty_servers(self):
+        """Sorted faulty slots, as find_faulty_servers returns them."""
+        return sorted(self.faulty)
+
+    def recent_faulty(self, seconds=None):
+        """Slots that reported a 5xx in the last seconds (at most window_seconds), newest first.
+
+        Walks back from the newest report, so it costs O(k) for k results.
+        """
+        now = self.clock()
+        self._expire(now)
+        cutoff = now - min(seconds if seconds is not None else self.window_seconds, self.window_seconds)
+        recent = []
+        for slot in reversed(self.last_fault):
+            if self.last_fault[slot] < cutoff:
+                break
+            recent.append(slot)
+        return recent
+
+    def fault_count(self, seconds=None):
+        """5xx reports in the last seconds, at bucket resolution."""
+        now = self.clock()
+        self._expire(now)
+        seconds = min(seconds if seconds is not None else self.window_seconds, self.window_seconds)
+        first_bucket = int((now - seconds) // self.bucket_seconds)
+        total = 0
+        for bucket, count in reversed(self.buckets):
+            if bucket < first_bucket:
+                break
+            total += count
+        return total
+
+    async def consume(self, source):
+        """Apply (slot, code) updates from an async iterable until it ends, each at its arrival time."""
+        async for event in source:
+            self.update(*event)
+
+
+class FakeEventSource:
+    """In-process async stream of status updates, backed by an asyncio.Queue."""
+
+    _CLOSED = object()
+
+    def __init__(self, maxsize=0):
+        self.queue = asyncio.Queue(maxsize)
+
+    async def push(self, slot, code):
+        await self.queue.put((slot, code))
+
+    async def close(self):
+        await self.queue.put(self._CLOSED)
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        event = await self.queue.get()
+        if event is self._CLOSED:
+            raise StopAsyncIteration
+        return event
+
+
+class ManualClock:
+    """A clock that only moves when told to, for driving the time window in tests."""
+
+    def __init__(self, now=0.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+    def advance(self, seconds):
+        self.now += seconds
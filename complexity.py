@@ -0,0 +1,206 @@
+import re
+import sys
+import math
+import time
+import argparse
+import statistics
+
+from stress import DEFAULT_CASES, prepare
+
+# Candidate growth classes, simplest first
+GROWTH_CLASSES = [
+    ('O(1)', lambda n: 1.0),
+    ('O(log n)', lambda n: math.log2(max(n, 2))),
+    ('O(n)', lambda n: float(n)),
+    ('O(n log n)', lambda n: n * math.log2(max(n, 2))),
+    ('O(n²)', lambda n: float(n) ** 2),
+    ('O(n³)', lambda n: float(n) ** 3),
+    ('O(2ⁿ)', lambda n: 2.0 ** n if n < 1000 else math.inf),
+]
+CLASS_RANK = {name: rank for rank, (name, _) in enumerate(GROWTH_CLASSES)}
+
+# This tool's default policy for the slowest growth to accept at each
+# difficulty level. GUIDELINES.md describes the levels by authoring time and
+# kind of work (trivial operations, multi-step logic, algorithm required),
+# not by big-O, so these are only a starting point: pass --max-growth to
+# check against a different limit.
+LEVEL_LIMITS = {1: 'O(n)', 2: 'O(n log n)', 3: 'O(n²)'}
+
+# ASCII spellings accepted by --max-growth
+GROWTH_ALIASES = {'O(n^2)': 'O(n²)', 'O(n^3)': 'O(n³)', 'O(2^n)': 'O(2ⁿ)'}
+
+DEFAULT_MAX_SIZE = 1 << 16
+DEFAULT_SIZE_BUDGET = 2.0
+MIN_TIMING = 0.02
+MIN_POINTS = 4
+
+# A more complex class must beat a simpler one by this factor to be preferred
+SIMPLICITY_MARGIN = 1.1
+# A fit whose growth term adds less than this share of its largest time is
+# a flat line, the same explanation as a slower class
+FLAT_GROWTH_SHARE = 0.05
+
+def time_call(function, kwargs, min_time=MIN_TIMING, repeat=3):
+    """Best per-call time, looping the call until each sample lasts min_time."""
+    loops = 1
+    while True:
+        started = time.perf_counter()
+        for _ in range(loops):
+            function(**kwargs)
+        elapsed = time.perf_counter() - started
+        if elapsed >= min_time or loops >= 1 << 20:
+            break
+        loops *= 2 if elapsed <= 0 else max(2, min(10, int(min_time / elapsed) + 1))
+    best = elapsed / loops
+    for _ in range(repeat - 1):
+        started = time.perf_counter()
+        for _ in range(loops):
+            function(**kwargs)
+        best = min(best, (time.perf_counter() - started) / loops)
+    return best
+
+def measure(function, generator, max_size=DEFAULT_MAX_SIZE, cases=DEFAULT_CASES, size_budget=DEFAULT_SIZE_BUDGET,
+            on_point=None):
+    """Time the entry point over the size ladder; returns [(n, seconds per call)].
+
+    Each size is the median over cases inputs. The ladder stops after the first
+    size that took longer than size_budget seconds in total.
+    """
+    points = []
+    for size in generator.size_ladder(max_size):
+        started = time.perf_counter()
+        timings = []
+        for case in range(cases):
+            timings.append(time_call(function, generator.generate(size, case)))
+        point = (generator.effective_size(size), statistics.median(timings))
+        points.append(point)
+        if on_point:
+            on_point(point)
+        if time.perf_counter() - started > size_budget:
+            break
+    return points
+
+def _weighted_fit(xs, ts):
+    # Least squares of t = a + b·x with weights 1/t², so every size counts by
+    # relative error rather than the largest size dominating. a, b >= 0.
+    ws = [1 / (t * t) for t in ts]
+    sw = sum(ws)
+    sx = sum(w * x for w, x in zip(ws, xs))
+    st = sum(w * t for w, t in zip(ws, ts))
+    sxx = sum(w * x * x for w, x in zip(ws, xs))
+    sxt = sum(w * x * t for w, x, t in zip(ws, xs, ts))
+    det = sw * sxx - sx * sx
+    if det > 0:
+        b = (sw * sxt - sx * st) / det
+        a = (st - b * sx) / sw
+        if a >= 0 and b >= 0:
+            return a, b
+    # Fall back to the better of the two one-parameter fits
+    candidates = [(st / sw, 0.0)]
+    if sxx > 0:
+        candidates.append((0.0, max(0.0, sxt / sxx)))
+    return min(candidates, key=lambda ab: _residual(xs, ts, *ab))
+
+def _residual(xs, ts, a, b):
+    return math.sqrt(sum(((a + b * x - t) / t) ** 2 for x, t in zip(xs, ts)) / len(ts))
+
+def _growth_share(xs, a, b):
+    # Share of the fitted time at the largest size that the growth term adds
+    top = a + b * max(xs)
+    return b * (max(xs) - min(xs)) / top if top > 0 else 0.0
+
+def fit_growth(points):
+    """Fit every growth class to the points.
+
+    Returns (best class, confidence in [0, 1], [(class, relative rms error)]).
+    Confidence compares the best fit with the runner-up: it is high when the
+    runner-up's error is several times larger. A faster-growing class whose
+    fit came out flat is not a rival: it explains the points the same way
+    as the best class (for constant timings every class fits as a constant).
+    """
+    sizes = [n for n, _ in points]
+    times = [max(t, 1e-12) for _, t in points]
+    fits = []
+    flat = set()
+    for name, growth in GROWTH_CLASSES:
+        xs = [growth(n) for n in sizes]
+        if any(math.isinf(x) for x in xs):
+            continue
+        # Scale so the normal equations stay well conditioned for n³ and 2ⁿ
+        scale = max(xs) or 1.0
+        xs = [x / scale for x in xs]
+        a, b = _weighted_fit(xs, times)
+        fits.append((name, _residual(xs, times, a, b)))
+        if _growth_share(xs, a, b) < FLAT_GROWTH_SHARE:
+            flat.add(name)
+
+    best_error = min(error for _, error in fits)
+    best = next(name for name, error in fits if error <= best_error * SIMPLICITY_MARGIN + 1e-9)
+    chosen_error = dict(fits)[best]
+    runner_up = min((error for name, error in fits
+                     if name != best and not (CLASS_RANK[name] > CLASS_RANK[best] and name in flat)),
+                    default=math.inf)
+    confidence = 1.0 if runner_up == math.inf else max(0.0, 1 - (chosen_error + 1e-3) / (runner_up + 1e-3))
+    if len(points) < MIN_POINTS:
+        confidence *= len(points) / MIN_POINTS
+    return best, confidence, fits
+
+def declared_level(prompt_path):
+    with open(prompt_path, 'r', encoding='utf-8') as f:
+        match = re.search(r"\bLevel\s*([123])\b", f.read(), re.IGNORECASE)
+    return int(match.group(1)) if match else None
+
+def parse_growth(text):
+    name = re.sub(r"\s+", " ", text.strip())
+    name = GROWTH_ALIASES.get(name, name)
+    if name not in CLASS_RANK:
+        raise argparse.ArgumentTypeError(f"unknown growth class {text!r} (expected one of {', '.join(CLASS_RANK)})")
+    return name
+
+def exceeds(growth, limit):
+    return CLASS_RANK[growth] > CLASS_RANK[limit]
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Estimate the time complexity of a Python solution empirically.")
+    parser.add_argument("problem_dir")
+    parser.add_argument("--level", type=int, choices=sorted(LEVEL_LIMITS),
+                        help="difficulty level to check against (default: read 'Level N' from prompt.md)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--max-size", type=int, default=DEFAULT_MAX_SIZE)
+    parser.add_argument("--cases", type=int, default=3, help="inputs per size; the median is used (default: 3)")
+    parser.add_argument("--size-budget", type=float, default=DEFAULT_SIZE_BUDGET, metavar="SECONDS",
+                        help="stop growing the input once one size takes this long (default: 2)")
+    parser.add_argument("--max-growth", type=parse_growth, metavar="CLASS",
+                        help="slowest growth to accept, e.g. 'O(n log n)' or 'O(n^2)' "
+                             "(default: this tool's limit for the level, see LEVEL_LIMITS)")
+    parser.add_argument("--fail-on-exceed", action="store_true",
+                        help="exit non-zero when the growth exceeds the accepted limit")
+    args = parser.parse_args()
+
+    record, function, generator = prepare(args.problem_dir, args.seed)
+    points = measure(function, generator, args.max_size, args.cases, args.size_budget,
+                     on_point=lambda p: print(f"n={p[0]:<8} {p[1] * 1000:>12.4f} ms/call", flush=True))
+
+    if len(points) < 2:
+        print("❌ The inputs cannot grow: the declared constraints allow only one size")
+        sys.exit(1)
+
+    growth, confidence, fits = fit_growth(points)
+    print(f"\nBest fit: {growth} (confidence {confidence:.0%})")
+    for name, error in sorted(fits, key=lambda f: f[1]):
+        print(f"   {name:<11} relative rms error {error:.3f}")
+    if len(points) < MIN_POINTS:
+        print(f"⚠️  Only {len(points)} sizes fit in the declared constraints; treat the estimate as rough")
+
+    if args.max_growth:
+        limit, source = args.max_growth, "--max-growth"
+    else:
+        level = args.level or declared_level(record['prompt'])
+        if level is None:
+            print("No difficulty level declared (pass --level or --max-growth to check one)")
+            sys.exit(0)
+        limit, source = LEVEL_LIMITS[level], f"the default limit for Level {level}"
+    if exceeds(growth, limit):
+        print(f"⚠️  The measured growth {growth} exceeds {limit} ({source})")
+        sys.exit(1 if args.fail_on_exceed else 0)
+    print(f"✅ {growth} is within {limit} ({source})")
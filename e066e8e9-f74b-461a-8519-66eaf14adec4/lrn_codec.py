@@ -0,0 +1,143 @@
+import numpy as np
+
+NUM_DIGITS_RANGE = 9999  # From 0001 to 9999
+NUM_LETTERS_IN_ALPHABET = 26  # A-Z
+MAX_POSITION = NUM_LETTERS_IN_ALPHABET * NUM_LETTERS_IN_ALPHABET * NUM_DIGITS_RANGE  # ZZ9999
+PLATE_WIDTH = 6
+RECORD_WIDTH = PLATE_WIDTH + 1  # plate plus newline in a plates file
+
+_DIGIT_WEIGHTS = np.array([1000, 100, 10, 1], dtype=np.int32)
+
+_LETTER, _DIGIT = 1, 2
+_BYTE_KIND = np.zeros(256, dtype=np.uint8)
+_BYTE_KIND[ord('A'):ord('Z') + 1] = _LETTER
+_BYTE_KIND[ord('0'):ord('9') + 1] = _DIGIT
+
+# Entry i holds the bytes of letter pair i (AA, AB, ...) and of number i + 1 (0001, 0002, ...)
+_LETTER_PAIRS = np.frombuffer(bytes(ord('A') + k for i in range(NUM_LETTERS_IN_ALPHABET)
+                                     for j in range(NUM_LETTERS_IN_ALPHABET) for k in (i, j)), dtype=np.uint16)
+_DIGIT_GROUPS = np.frombuffer(b"".join(b"%04d" % i for i in range(1, NUM_DIGITS_RANGE + 1)), dtype=np.uint32)
+_PLATE_RECORD = np.dtype([('letters', np.uint16), ('digits', np.uint32)])
+
+
+def getVehicleIndexNumber(lrn: str) -> int:
+    """1-based odometer position of one LLNNNN plate (AA0001 = 1, ZZ9999 = 6759324)."""
+    first, second, number = ord(lrn[0]) - ord('A'), ord(lrn[1]) - ord('A'), int(lrn[2:])
+    return (first * NUM_LETTERS_IN_ALPHABET + second) * NUM_DIGITS_RANGE + number
+
+
+def _describe_rows(rows):
+    shown = ", ".join(str(row) for row in rows[:10])
+    return f"{shown} ..." if len(rows) > 10 else shown
+
+
+def as_plate_bytes(plates):
+    """View plates as an (N, 6) uint8 array.
+
+    Accepts an S6 array or a flat buffer of 6-byte records (no copy), or any
+    other bytes/str array or sequence. Returns (bytes, length_ok), where
+    length_ok is False for rows longer than 6 characters or with non-ASCII
+    text; shorter rows are padded with zero bytes, which fail validation.
+    """
+    if isinstance(plates, (bytes, bytearray, memoryview)):
+        data = np.frombuffer(plates, dtype=np.uint8)
+        if data.size % PLATE_WIDTH:
+            raise ValueError(f"Plate buffer length {data.size} is not a multiple of {PLATE_WIDTH}")
+        return data.reshape(-1, PLATE_WIDTH), np.ones(data.size // PLATE_WIDTH, dtype=bool)
+    array = np.asarray(plates)
+    if array.dtype.kind not in 'SU':
+        raise TypeError(f"Plates must be strings or bytes, not {array.dtype}")
+    array = np.ascontiguousarray(array.reshape(-1))
+    # Work on the raw code units: 1 byte per character for S, 4 for U
+    width = array.dtype.itemsize // (4 if array.dtype.kind == 'U' else 1)
+    units = array.view(np.uint32 if array.dtype.kind == 'U' else np.uint8).reshape(len(array), width)
+    length_ok = np.ones(len(array), dtype=bool)
+    if width > PLATE_WIDTH:
+        length_ok &= (units[:, PLATE_WIDTH:] == 0).all(axis=1)
+    if width < PLATE_WIDTH:
+        units = np.pad(units, ((0, 0), (0, PLATE_WIDTH - width)))
+    units = units[:, :PLATE_WIDTH]
+    if array.dtype.kind == 'U':
+        # Anything outside ASCII cannot be part of a plate
+        length_ok &= (units < 128).all(axis=1)
+        return units.astype(np.uint8), length_ok
+    return units, length_ok
+
+
+def _valid_rows(data, length_ok):
+    # One table lookup classifies every byte; then each column is checked
+    # against the LLNNNN pattern
+    kinds = _BYTE_KIND[data]
+    ok = length_ok & (kinds[:, 0] == _LETTER) & (kinds[:, 1] == _LETTER)
+    for column in range(2, PLATE_WIDTH):
+        ok &= kinds[:, column] == _DIGIT
+    # Digits OR together to '0' only when all four are '0' (the number 0000)
+    return ok & ((data[:, 2] | data[:, 3] | data[:, 4] | data[:, 5]) != ord('0'))
+
+
+def validate(plates):
+    """Boolean mask of the rows that are well-formed plates (LL, then 0001-9999)."""
+    return _valid_rows(*as_plate_bytes(plates))
+
+
+def encode(plates, strict=True):
+    """Positions (int32) of many plates at once, with no per-string parsing.
+
+    With strict=True any malformed row raises ValueError listing the row
+    indices; with strict=False those rows get position 0.
+    """
+    data, length_ok = as_plate_bytes(plates)
+    valid = _valid_rows(data, length_ok)
+    if strict and not valid.all():
+        rows = np.flatnonzero(~valid)
+        raise ValueError(f"{len(rows)} invalid plates at rows {_describe_rows(rows)}")
+    positions = data[:, 0].astype(np.int32) * NUM_LETTERS_IN_ALPHABET + data[:, 1]
+    positions *= NUM_DIGITS_RANGE
+    for column, weight in enumerate(_DIGIT_WEIGHTS, start=2):
+        positions += data[:, column].astype(np.int32) * weight
+    # Remove the character offsets of all six columns in one go
+    positions -= ((ord('A') * NUM_LETTERS_IN_ALPHABET + ord('A')) * NUM_DIGITS_RANGE + ord('0') * int(_DIGIT_WEIGHTS.sum()))
+    if not strict:
+        positions[~valid] = 0
+    return positions
+
+
+def decode(positions):
+    """Plates (S6 array) for 1-based positions; raises ValueError listing out-of-range rows."""
+    positions = np.asarray(positions)
+    if positions.dtype.kind not in 'iu':
+        raise TypeError(f"Positions must be integers, not {positions.dtype}")
+    positions = positions.reshape(-1).astype(np.int64)
+    invalid = (positions < 1) | (positions > MAX_POSITION)
+    if invalid.any():
+        rows = np.flatnonzero(invalid)
+        raise ValueError(f"{len(rows)} positions outside 1-{MAX_POSITION} at rows {_describe_rows(rows)}")
+    block, number = np.divmod(positions.astype(np.int32) - 1, NUM_DIGITS_RANGE)
+    # Table lookups for the letter pair and the zero-padded digits, moved as
+    # whole 2- and 4-byte words into the two fields of a packed 6-byte record
+    data = np.empty(len(positions), dtype=_PLATE_RECORD)
+    data['letters'] = np.take(_LETTER_PAIRS, block)
+    data['digits'] = np.take(_DIGIT_GROUPS, number)
+    return data.view('S6')
+
+
+def load_plates(path):
+    """Read a file of newline-terminated plates as fixed 7-byte records into an S6 array."""
+    raw = np.fromfile(path, dtype=np.uint8)
+    if raw.size and raw[-1] != ord('\n'):
+        raw = np.append(raw, np.uint8(ord('\n')))
+    if raw.size % RECORD_WIDTH:
+        raise ValueError(f"{path} is not made of {PLATE_WIDTH}-character lines")
+    records = raw.reshape(-1, RECORD_WIDTH)
+    bad = np.flatnonzero(records[:, PLATE_WIDTH] != ord('\n'))
+    if len(bad):
+        raise ValueError(f"{path}: lines {_describe_rows(bad + 1)} are not {PLATE_WIDTH} characters")
+    return np.ascontiguousarray(records[:, :PLATE_WIDTH]).view('S6').reshape(-1)
+
+
+def save_plates(path, plates):
+    data, _ = as_plate_bytes(plates)
+    records = np.empty((len(data), RECORD_WIDTH), dtype=np.uint8)
+    records[:, :PLATE_WIDTH] = data
+    records[:, PLATE_WIDTH] = ord('\n')
+    records.tofile(path)
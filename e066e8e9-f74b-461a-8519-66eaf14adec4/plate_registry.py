@@ -0,0 +1,182 @@
+import os
+
+import numpy as np
+
+from lrn_codec import MAX_POSITION, decode, encode
+
+WORD_BITS = 64
+BLOCK_WORDS = 8  # 512-bit blocks for rank/select
+BLOCK_BITS = WORD_BITS * BLOCK_WORDS
+NUM_WORDS = -(-MAX_POSITION // WORD_BITS)
+NUM_BLOCKS = -(-NUM_WORDS // BLOCK_WORDS)
+
+_POPCOUNT16 = np.array([bin(i).count("1") for i in range(1 << 16)], dtype=np.uint8)
+_FULL_WORD = np.uint64(0xFFFFFFFFFFFFFFFF)
+
+
+def popcount(words):
+    """Set bits per uint64 word, by 16-bit table lookups."""
+    words = np.ascontiguousarray(words, dtype=np.uint64)
+    return _POPCOUNT16[words.view(np.uint16)].reshape(-1, 4).sum(axis=1, dtype=np.int64)
+
+
+def _word_popcount(word):
+    word = int(word)
+    return int(_POPCOUNT16[word & 0xFFFF]) + int(_POPCOUNT16[(word >> 16) & 0xFFFF]) \
+        + int(_POPCOUNT16[(word >> 32) & 0xFFFF]) + int(_POPCOUNT16[word >> 48])
+
+
+def _lowest_bit(word):
+    return (word & -word).bit_length() - 1
+
+
+class PlateRegistry:
+    """Issued plates as one bit per odometer position (AA0001 .. ZZ9999).
+
+    The 6,759,324 bits take 825 KiB of uint64 words, optionally backed by a
+    memory-mapped file. Each 512-bit block keeps its count of issued plates;
+    their prefix sums, rebuilt lazily after changes, answer rank (issued
+    plates before a position) with one lookup plus at most 8 word popcounts.
+
+    Plates may be given as LLNNNN strings or as 1-based positions.
+    """
+
+    def __init__(self, words=None):
+        self.words = np.zeros(NUM_WORDS, dtype=np.uint64) if words is None else words
+        self.block_counts = popcount(np.pad(self.words, (0, NUM_BLOCKS * BLOCK_WORDS - NUM_WORDS))) \
+            .reshape(NUM_BLOCKS, BLOCK_WORDS).sum(axis=1)
+        self._prefix = None
+
+    @classmethod
+    def open(cls, path):
+        """Map the registry file at path, creating an empty one if it does not exist."""
+        mode = 'r+' if os.path.exists(path) else 'w+'
+        if mode == 'r+' and os.path.getsize(path) != NUM_WORDS * 8:
+            raise ValueError(f"{path} is not a plate registry ({os.path.getsize(path)} bytes)")
+        return cls(np.memmap(path, dtype=np.uint64, mode=mode, shape=(NUM_WORDS,)))
+
+    def flush(self):
+        if isinstance(self.words, np.memmap):
+            self.words.flush()
+
+    def save(self, path):
+        # Write to a temporary file first so an interrupted save never leaves a torn registry
+        tmp_path = f"{path}.tmp"
+        self.words.tofile(tmp_path)
+        os.replace(tmp_path, path)
+
+    @staticmethod
+    def _bit(plate):
+        if isinstance(plate, (str, bytes)):
+            return int(encode([plate])[0]) - 1
+        position = int(plate)
+        if not 1 <= position <= MAX_POSITION:
+            raise ValueError(f"Position {position} is outside 1-{MAX_POSITION}")
+        return position - 1
+
+    def _set(self, bit, value):
+        word, mask = bit // WORD_BITS, 1 << (bit % WORD_BITS)
+        current = int(self.words[word])
+        if bool(current & mask) == value:
+            return False
+        self.words[word] = current ^ mask
+        self.block_counts[word // BLOCK_WORDS] += 1 if value else -1
+        self._prefix = None
+        return True
+
+    def issue(self, plate):
+        """Mark a plate issued; returns False if it already was."""
+        return self._set(self._bit(plate), True)
+
+    def revoke(self, plate):
+        """Mark a plate free again; returns False if it was not issued."""
+        return self._set(self._bit(plate), False)
+
+    def is_issued(self, plate):
+        bit = self._bit(plate)
+        return bool(int(self.words[bit // WORD_BITS]) >> (bit % WORD_BITS) & 1)
+
+    __contains__ = is_issued
+
+    def issue_many(self, plates):
+        """Issue an array of positions or plates at once."""
+        plates = np.asarray(plates)
+        positions = encode(plates) if plates.dtype.kind in 'SU' else plates.astype(np.int64)
+        if ((positions < 1) | (positions > MAX_POSITION)).any():
+            raise ValueError(f"Positions must be between 1 and {MAX_POSITION}")
+        # Scatter into one flag per bit and pack them into words (bit 0 first)
+        flags = np.zeros(NUM_WORDS * WORD_BITS, dtype=bool)
+        flags[positions - 1] = True
+        self.words |= np.packbits(flags, bitorder='little').view('<u8').astype(np.uint64)
+        self.block_counts = popcount(np.pad(self.words, (0, NUM_BLOCKS * BLOCK_WORDS - NUM_WORDS))) \
+            .reshape(NUM_BLOCKS, BLOCK_WORDS).sum(axis=1)
+        self._prefix = None
+
+    def __len__(self):
+        return int(self.block_counts.sum())
+
+    def _block_prefix(self):
+        if self._prefix is None:
+            self._prefix = np.concatenate(([0], np.cumsum(self.block_counts)))
+        return self._prefix
+
+    def rank(self, bit):
+        """Issued plates among the first bit positions (0-based, exclusive)."""
+        block, word = bit // BLOCK_BITS, bit // WORD_BITS
+        total = int(self._block_prefix()[block])
+        for w in range(block * BLOCK_WORDS, word):
+            total += _word_popcount(self.words[w])
+        if bit % WORD_BITS:
+            total += _word_popcount(int(self.words[word]) & ((1 << (bit % WORD_BITS)) - 1))
+        return total
+
+    def count(self, first, last):
+        """Issued plates from first to last, both inclusive."""
+        start, end = self._bit(first), self._bit(last)
+        if start > end:
+            return 0
+        return self.rank(end + 1) - self.rank(start)
+
+    def select(self, k):
+        """Position of the k-th issued plate (0-based), or None."""
+        prefix = self._block_prefix()
+        if not 0 <= k < prefix[-1]:
+            return None
+        block = int(np.searchsorted(prefix, k, side='right')) - 1
+        k -= int(prefix[block])
+        for w in range(block * BLOCK_WORDS, min(NUM_WORDS, (block + 1) * BLOCK_WORDS)):
+            word = int(self.words[w])
+            bits = _word_popcount(word)
+            if k < bits:
+                for _ in range(k):
+                    word &= word - 1
+                return w * WORD_BITS + _lowest_bit(word) + 1
+            k -= bits
+
+    def next_free_position(self, plate):
+        """First free position at or after plate, or None when every later plate is issued."""
+        bit = self._bit(plate)
+        word = bit // WORD_BITS
+        free = ~int(self.words[word]) & ((1 << WORD_BITS) - 1) & ~((1 << (bit % WORD_BITS)) - 1)
+        block = word // BLOCK_WORDS
+        # Rest of the current block, word by word
+        while not free:
+            word += 1
+            if word >= min(NUM_WORDS, (block + 1) * BLOCK_WORDS):
+                break
+            free = ~int(self.words[word]) & ((1 << WORD_BITS) - 1)
+        if not free:
+            # Skip whole blocks by their counts
+            open_blocks = np.flatnonzero(self.block_counts[block + 1:] < BLOCK_BITS)
+            if not len(open_blocks):
+                return None
+            words = self.words[(block + 1 + int(open_blocks[0])) * BLOCK_WORDS:]
+            word = (block + 1 + int(open_blocks[0])) * BLOCK_WORDS + int(np.flatnonzero(words != _FULL_WORD)[0])
+            free = ~int(self.words[word]) & ((1 << WORD_BITS) - 1)
+        position = word * WORD_BITS + _lowest_bit(free) + 1
+        return position if position <= MAX_POSITION else None
+
+    def next_free(self, plate):
+        """First free plate at or after plate, as an LLNNNN string, or None."""
+        position = self.next_free_position(plate)
+        return None if position is None else decode(position)[0].decode('ascii')
@@ -0,0 +1,122 @@
+import numpy as np
+
+CANDIDATES = np.arange(-5, 6)
+# Larger than any reachable energy; marks candidates that break gauge invariance
+NO_CANDIDATE = np.iinfo(np.int64).max
+
+
+def _rows(mask):
+    return ", ".join(str(i) for i in np.flatnonzero(mask)[:10]) + (" ..." if mask.sum() > 10 else "")
+
+
+def _per_row(value, batch, name):
+    value = np.asarray(value, dtype=np.int64)
+    if value.ndim == 0:
+        return np.full(batch, value, dtype=np.int64)
+    if value.shape != (batch,):
+        raise ValueError(f"{name} must be a scalar or have one entry per lattice")
+    return value
+
+
+def total_energy(charges, links, background_field, coupling_strength):
+    """Energy of every configuration in the batch, as calculate_total_energy computes it."""
+    coupling = coupling_strength[:, None]
+    site = (charges * background_field).sum(axis=1)
+    # Each link is counted once from each of its two sites
+    pairs = (2 * coupling * charges[:, :-1] * charges[:, 1:] * links).sum(axis=1)
+    return site + pairs + coupling_strength * (links * links).sum(axis=1)
+
+
+def gauge_field_invariance_batch(lattice_charges, background_field, coupling_strength, max_iterations,
+                                 errors="raise"):
+    """Run gauge_field_invariance on a batch of lattices of the same size.
+
+    lattice_charges and background_field are (B, n) arrays; coupling_strength
+    and max_iterations are scalars or (B,) arrays. Every sweep scores the 11
+    candidate values of one link or charge for all B lattices at once, with
+    the same tie-breaking as the scalar loop (the first minimum wins).
+
+    Returns (charges (B, n), links (B, n - 1), energies (B,)), each row equal
+    to the scalar result. Rows that end without a gauge-invariant
+    configuration raise ValueError; with errors="ignore" they are kept and a
+    fourth boolean array marks the valid rows instead.
+    """
+    if errors not in ("raise", "ignore"):
+        raise ValueError("errors must be 'raise' or 'ignore'")
+    charges = np.array(lattice_charges, dtype=np.int64, copy=True)
+    field = np.asarray(background_field, dtype=np.int64)
+    if charges.ndim != 2:
+        raise ValueError("lattice_charges must be a (batch, sites) array")
+    batch, n = charges.shape
+    if not (4 <= n <= 16) or n % 2 != 0:
+        raise ValueError("Lattice size must be even and between 4 and 16")
+    if field.shape != charges.shape:
+        raise ValueError("Background field must match lattice size")
+    coupling = _per_row(coupling_strength, batch, "coupling_strength")
+    iterations = _per_row(max_iterations, batch, "max_iterations")
+
+    bad = (coupling < 1) | (coupling > 10)
+    if bad.any():
+        raise ValueError(f"Coupling strength must be between 1 and 10 (rows {_rows(bad)})")
+    bad = (iterations < 10) | (iterations > 100)
+    if bad.any():
+        raise ValueError(f"Max iterations must be between 10 and 100 (rows {_rows(bad)})")
+    bad = ((charges < -5) | (charges > 5)).any(axis=1)
+    if bad.any():
+        raise ValueError(f"Charges must be between -5 and 5 (rows {_rows(bad)})")
+
+    rows = np.arange(batch)
+    links = np.zeros((batch, n - 1), dtype=np.int64)
+    energy = total_energy(charges, links, field, coupling)
+    flow = np.zeros(batch, dtype=np.int64)
+
+    for iteration in range(int(iterations.max(initial=0))):
+        active = iteration < iterations
+        before = (charges.copy(), links.copy())
+
+        for i in range(n - 1):
+            old = links[:, i]
+            delta = CANDIDATES[None, :] - old[:, None]
+            valid = flow[:, None] + charges[:, i, None] * delta == 0
+            scored = (energy[:, None] + 2 * coupling[:, None] * (charges[:, i] * charges[:, i + 1])[:, None] * delta
+                      + coupling[:, None] * (CANDIDATES[None, :] ** 2 - (old * old)[:, None]))
+            scored = np.where(valid, scored, NO_CANDIDATE)
+            pick = scored.argmin(axis=1)
+            # With no invariant candidate the scalar loop falls back to 0
+            best = np.where(scored[rows, pick] == NO_CANDIDATE, 0, CANDIDATES[pick])
+            best = np.where(active, best, old)
+            step = best - old
+            energy += 2 * coupling * charges[:, i] * charges[:, i + 1] * step + coupling * (best * best - old * old)
+            flow += charges[:, i] * step
+            links[:, i] = best
+
+        for i in range(n):
+            old = charges[:, i]
+            neighbour = field[:, i].copy()
+            if i > 0:
+                neighbour += 2 * coupling * charges[:, i - 1] * links[:, i - 1]
+            if i < n - 1:
+                neighbour += 2 * coupling * charges[:, i + 1] * links[:, i]
+            outgoing = links[:, i] if i < n - 1 else np.zeros(batch, dtype=np.int64)
+            delta = CANDIDATES[None, :] - old[:, None]
+            valid = flow[:, None] + delta * outgoing[:, None] == 0
+            scored = np.where(valid, energy[:, None] + neighbour[:, None] * delta, NO_CANDIDATE)
+            pick = scored.argmin(axis=1)
+            # A charge only moves when it strictly lowers the current energy
+            best = np.where(active & (scored[rows, pick] < energy), CANDIDATES[pick], old)
+            step = best - old
+            energy += neighbour * step
+            flow += step * outgoing
+            charges[:, i] = best
+
+        # A sweep that changes nothing will change nothing on every later iteration too
+        if np.array_equal(before[0], charges) and np.array_equal(before[1], links):
+            break
+
+    energies = total_energy(charges, links, field, coupling)
+    valid = (charges[:, :-1] * links).sum(axis=1) == 0
+    if errors == "ignore":
+        return charges, links, energies, valid
+    if not valid.all():
+        raise ValueError(f"Failed to find valid gauge-invariant configuration (rows {_rows(~valid)})")
+    return charges, links, energies
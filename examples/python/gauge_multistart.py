@@ -0,0 +1,162 @@
+import os
+import time
+import random
+from concurrent.futures import ProcessPoolExecutor
+
+from solution import gauge_sweep
+
+CANDIDATES_PER_SITE = 11
+
+
+def perturbed_charges(lattice_charges, seed, index, perturbation):
+    """Starting charges of start index: start 0 is the input itself."""
+    if index == 0:
+        return list(lattice_charges)
+    rng = random.Random(f"{seed}:{index}")
+    return [rng.randint(-5, 5) if rng.random() < perturbation else charge for charge in lattice_charges]
+
+
+def descend(charges, background_field, coupling_strength, max_iterations, incumbent=None, prune_after=None,
+            max_sweeps=None, deadline=None):
+    """Greedy sweeps from charges (links start at 0) until a fixed point or max_iterations.
+
+    When incumbent is given, the start is abandoned once it has done
+    prune_after sweeps without settling and is still invariant-free or not
+    below the incumbent energy (the incumbent comes from a lower start
+    index, so it wins ties). This is a heuristic: a start that is behind early
+    could still overtake later. max_sweeps caps the sweeps (the start's share
+    of an evaluation budget) and deadline, a time.monotonic() value, is
+    checked after every sweep.
+
+    Returns (charges, links, energy, sweeps, stop) where stop is one of
+    'fixed_point', 'max_iterations', 'pruned', 'max_evaluations' or
+    'time_budget'.
+    """
+    n = len(charges)
+    links = [0] * (n - 1)
+    energy = sum(c * b for c, b in zip(charges, background_field))
+    flow = 0
+    sweeps = 0
+    limit = max_iterations if max_sweeps is None else min(max_iterations, max_sweeps)
+    while sweeps < limit:
+        state = (tuple(charges), tuple(links))
+        energy, flow = gauge_sweep(charges, links, energy, flow, background_field, coupling_strength)
+        sweeps += 1
+        if state == (tuple(charges), tuple(links)):
+            return charges, links, energy, sweeps, "fixed_point"
+        if incumbent is not None and prune_after is not None and sweeps >= prune_after \
+                and (flow != 0 or energy >= incumbent):
+            return charges, links, energy, sweeps, "pruned"
+        if deadline is not None and time.monotonic() >= deadline:
+            return charges, links, energy, sweeps, "time_budget"
+    return charges, links, energy, sweeps, "max_iterations" if limit == max_iterations else "max_evaluations"
+
+
+def sweep_cost(n):
+    """Candidate evaluations in one sweep of an n-site lattice (every link, then every charge)."""
+    return CANDIDATES_PER_SITE * (2 * n - 1)
+
+
+def _run_start(job):
+    index, charges, background_field, coupling_strength, max_iterations, incumbent, prune_after, max_sweeps, \
+        deadline = job
+    charges, links, energy, sweeps, stop = descend(charges, background_field, coupling_strength, max_iterations,
+                                                   incumbent, prune_after, max_sweeps, deadline)
+    valid = stop != "pruned" and sum(charges[i] * links[i] for i in range(len(links))) == 0
+    return index, charges, links, energy, valid, stop, sweeps * sweep_cost(len(charges))
+
+
+def gauge_field_invariance_multistart(
+    lattice_charges: list[int], background_field: list[int], coupling_strength: int, max_iterations: int = 100,
+    starts: int | None = None, workers: int | None = None, seed: int = 0, perturbation: float = 0.3,
+    prune_after: int | None = None, max_evaluations: int | None = None, time_budget: float | None = None,
+    return_diagnostics: bool = False
+) -> tuple[list[int], list[int], int] | tuple[list[int], list[int], int, dict]:
+    """Best greedy result over many perturbed starts, for lattices of any even size >= 4.
+
+    Starts run in rounds of workers starts on a process pool. Start 0 is the
+    unperturbed input; start i re-draws each charge with probability
+    perturbation from an RNG seeded with (seed, i). The only thing shared
+    between starts is the incumbent: the best invariant energy of the rounds
+    already finished. Starts in the same round do not see each other's
+    results, which keeps the search deterministic. With prune_after set, a
+    start that is still behind the incumbent after that many sweeps is
+    pruned. Pruning is a heuristic that can change the returned optimum, so
+    the default (None) runs every start to the end; starts usually settle by
+    their second sweep, so prune_after=1 is the one to opt into for speed.
+
+    The search ends after starts starts (default 4 per worker), once
+    max_evaluations candidate evaluations have been spent, or once
+    time_budget seconds have passed. Both budgets hold inside a round too:
+    the whole sweeps the evaluations left can pay for are split evenly over
+    the round's starts (earlier starts take the remainder), and every start
+    checks the deadline after each sweep. Given seed and workers the result is deterministic
+    unless time_budget cuts the search short. Ties go to the lowest start
+    index.
+    """
+    n = len(lattice_charges)
+    if n < 4 or n % 2 != 0:
+        raise ValueError("Lattice size must be even and at least 4")
+    if n != len(background_field):
+        raise ValueError("Background field must match lattice size")
+    if not (1 <= coupling_strength <= 10):
+        raise ValueError("Coupling strength must be between 1 and 10")
+    if not (10 <= max_iterations <= 100):
+        raise ValueError("Max iterations must be between 10 and 100")
+    if not all(-5 <= charge <= 5 for charge in lattice_charges):
+        raise ValueError("Charges must be between -5 and 5")
+
+    workers = workers or os.cpu_count() or 1
+    starts = starts or 4 * workers
+    cost = sweep_cost(n)
+    deadline = time.monotonic() + time_budget if time_budget is not None else None
+    best = None
+    incumbent = None
+    truncated = False
+    stats = {"starts": 0, "pruned": 0, "evaluations": 0, "best_start": None, "stop_reason": "starts"}
+
+    executor = ProcessPoolExecutor(max_workers=workers) if workers > 1 else None
+    try:
+        for first in range(0, starts, workers):
+            indices = range(first, min(first + workers, starts))
+            shares = [None] * len(indices)
+            if max_evaluations is not None:
+                remaining = max_evaluations - stats["evaluations"]
+                # The first round always runs, if need be with unswept starts
+                if first and remaining < cost:
+                    stats["stop_reason"] = "max_evaluations"
+                    break
+                sweeps = max(remaining, 0) // cost
+                shares = [sweeps // len(indices) + (i < sweeps % len(indices)) for i in range(len(indices))]
+            if first and deadline is not None and time.monotonic() >= deadline:
+                stats["stop_reason"] = "time_budget"
+                break
+            jobs = [(index, perturbed_charges(lattice_charges, seed, index, perturbation), background_field,
+                     coupling_strength, max_iterations, incumbent, prune_after, share, deadline)
+                    for index, share in zip(indices, shares)]
+            results = executor.map(_run_start, jobs) if executor else map(_run_start, jobs)
+            for index, charges, links, energy, valid, stop, evaluations in results:
+                stats["starts"] += 1
+                stats["pruned"] += stop == "pruned"
+                stats["evaluations"] += evaluations
+                if stop == "time_budget":
+                    stats["stop_reason"] = stop
+                truncated = truncated or stop == "max_evaluations"
+                if valid and (best is None or energy < best[2]):
+                    best = (charges, links, energy)
+                    stats["best_start"] = index
+            incumbent = best[2] if best else None
+            if stats["stop_reason"] != "starts":
+                break
+        else:
+            if truncated:
+                stats["stop_reason"] = "max_evaluations"
+    finally:
+        if executor:
+            executor.shutdown()
+
+    if best is None:
+        raise ValueError("Failed to find valid gauge-invariant configuration")
+    if return_diagnostics:
+        return best[0], best[1], best[2], stats
+    return best
@@ -1,8 +1,200 @@
+import math
+
+try:
+    import numpy as np
+except ImportError:  # only method="exact" needs numpy
+    np = None
+
+VALUES = tuple(range(-5, 6))
+# Cost of a (charge, remaining flow) state that no suffix can complete
+UNREACHABLE = (2 ** 63 - 1) // 4
+
+
+def gauge_sweep(
+    charges: list[int], links: list[int], energy: int, charge_flow: int, background_field: list[int], coupling_strength: int
+) -> tuple[int, int]:
+    """One sweep over every link, then every charge, in place.
+
+    energy and charge_flow are the running totals of the current state; every
+    candidate is scored by the change it makes to them, which only involves
+    the neighbouring sites. Returns the totals after the sweep.
+    """
+    n = len(charges)
+    # Update link variables
+    for i in range(n - 1):
+        best_link = 0
+        min_energy = float("inf")
+        old_link = links[i]
+        # Link i couples sites i and i + 1 (counted once from each side)
+        pair_coupling = 2 * coupling_strength * charges[i] * charges[i + 1]
+        for link_val in range(-5, 6):
+            if charge_flow + charges[i] * (link_val - old_link) == 0:
+                current_energy = (energy + pair_coupling * (link_val - old_link)
+                                  + coupling_strength * (link_val * link_val - old_link * old_link))
+                if current_energy < min_energy:
+                    min_energy = current_energy
+                    best_link = link_val
+        energy += (pair_coupling * (best_link - old_link)
+                   + coupling_strength * (best_link * best_link - old_link * old_link))
+        charge_flow += charges[i] * (best_link - old_link)
+        links[i] = best_link
+
+    # Update charges
+    for i in range(n):
+        best_charge = charges[i]
+        min_energy = energy
+        old_charge = charges[i]
+        # Energy per unit of charge at site i: background plus both links
+        neighbour_field = background_field[i]
+        if i > 0:
+            neighbour_field += 2 * coupling_strength * charges[i - 1] * links[i - 1]
+        if i < n - 1:
+            neighbour_field += 2 * coupling_strength * charges[i + 1] * links[i]
+        outgoing_link = links[i] if i < n - 1 else 0
+        for charge in range(-5, 6):
+            if charge_flow + (charge - old_charge) * outgoing_link == 0:
+                current_energy = energy + neighbour_field * (charge - old_charge)
+                if current_energy < min_energy:
+                    min_energy = current_energy
+                    best_charge = charge
+        energy += neighbour_field * (best_charge - old_charge)
+        charge_flow += (best_charge - old_charge) * outgoing_link
+        charges[i] = best_charge
+    return energy, charge_flow
+
+
+class _SuffixTables:
+    """Minimal suffix energies of the chain, one table per site.
+
+    The table of site j holds, for every charge c_j and every flow R that
+    the links from j onward still have to carry, the minimal energy of
+    sites j..n-1 and links j..n-2 given c_j:
+
+        V_j(c, R) = b_j c + min over (l, c') of
+                    2κ c c' l + κ l² + V_{j+1}(c', R - c l)
+
+    The prefix before site j can only carry |flow| <= max|v|² · j, so R is
+    bounded by max|v|² · min(j, n - 1 - j). Only every checkpoint-th table is
+    kept; the others are recomputed one block at a time while walking
+    forward, so memory is O(sqrt(n)) tables instead of n.
+    """
+
+    def __init__(self, background_field, coupling_strength, values):
+        self.field = [int(b) for b in background_field]
+        self.coupling = coupling_strength
+        self.values = np.array(values, dtype=np.int64)
+        self.n = len(self.field)
+        self.bound = int(np.abs(self.values).max()) ** 2
+        self.products = sorted({int(c) * int(l) for c in self.values for l in self.values})
+        self.checkpoint = max(1, math.isqrt(self.n))
+        self.saved = {}
+        self.block = {}
+
+        table = self._last()
+        self.saved[self.n - 1] = table
+        for j in range(self.n - 2, -1, -1):
+            table = self.step(j, table)
+            if j % self.checkpoint == 0:
+                self.saved[j] = table
+
+    def reach(self, j):
+        return self.bound * min(j, self.n - 1 - j)
+
+    def _last(self):
+        return (self.field[-1] * self.values)[:, None].copy()
+
+    def step(self, j, following):
+        reach, next_reach = self.reach(j), self.reach(j + 1)
+        # The coupling term only depends on s = c·l, so minimise over c' once
+        # per s. R ranges up to |s| wider than the next table on either side,
+        # so padding by twice the largest |s| turns every shift into a slice.
+        pad = np.full(2 * self.bound, UNREACHABLE, dtype=np.int64)
+        best_next = {s: np.concatenate((pad, (2 * self.coupling * s * self.values[:, None] + following).min(axis=0), pad))
+                     for s in self.products}
+        size = 2 * reach + 1
+        table = np.empty((len(self.values), size), dtype=np.int64)
+        best = np.empty(size, dtype=np.int64)
+        for ci, c in enumerate(self.values):
+            best.fill(UNREACHABLE)
+            for l in self.values:
+                s = int(c) * int(l)
+                start = 2 * self.bound + next_reach - reach - s
+                np.minimum(best, best_next[s][start:start + size] + self.coupling * int(l) * int(l), out=best)
+            table[ci] = np.where(best >= UNREACHABLE, UNREACHABLE, self.field[j] * c + best)
+        return table
+
+    def table(self, j):
+        if j in self.saved:
+            return self.saved[j]
+        if j not in self.block:
+            # Recompute the block between this site and the next checkpoint
+            end = min(self.n - 1, (j // self.checkpoint + 1) * self.checkpoint)
+            self.block = {}
+            table = self.saved[end]
+            for k in range(end - 1, j - 1, -1):
+                table = self.step(k, table)
+                self.block[k] = table
+        return self.block[j]
+
+    def cost(self, j, ci, flow):
+        reach = self.reach(j)
+        if abs(flow) > reach:
+            return UNREACHABLE
+        return int(self.table(j)[ci, flow + reach])
+
+
+def gauge_field_invariance_exact(background_field, coupling_strength, values=VALUES):
+    """Globally minimal gauge-invariant configuration of a 1D lattice.
+
+    Every charge and link takes a value from values (default -5..5). The
+    energy only couples neighbours along the chain and the charge-flow
+    constraint is a sum, so a suffix DP over (site, charge, remaining flow)
+    is exact: O(n² · |values|²) time.
+
+    Ties are broken by taking the lexicographically smallest sequence
+    (c0, l0, c1, l1, ..., c_{n-1}) among the minimal configurations.
+
+    Returns (charges, links, energy).
+    """
+    values = sorted(values)
+    tables = _SuffixTables(background_field, coupling_strength, values)
+    n = tables.n
+
+    energy = min(tables.cost(0, ci, 0) for ci in range(len(values)))
+    charge_index = next(ci for ci in range(len(values)) if tables.cost(0, ci, 0) == energy)
+    charges, links = [values[charge_index]], []
+    remaining, flow = energy, 0
+    for j in range(n - 1):
+        c = charges[-1]
+        remaining -= tables.field[j] * c
+        done = False
+        for l in values:
+            for ci, following in enumerate(values):
+                rest = tables.cost(j + 1, ci, flow - c * l)
+                if rest < UNREACHABLE and 2 * coupling_strength * c * following * l \
+                        + coupling_strength * l * l + rest == remaining:
+                    links.append(l)
+                    charges.append(following)
+                    remaining, flow = rest, flow - c * l
+                    done = True
+                    break
+            if done:
+                break
+    return charges, links, energy
+
+
 def gauge_field_invariance(
-    lattice_charges: list[int], background_field: list[int], coupling_strength: int, max_iterations: int
-) -> tuple[list[int], list[int], int]:
+    lattice_charges: list[int], background_field: list[int], coupling_strength: int, max_iterations: int,
+    return_diagnostics: bool = False, method: str = "greedy"
+) -> tuple[list[int], list[int], int] | tuple[list[int], list[int], int, dict]:
     # Input validation
-    if not (4 <= len(lattice_charges) <= 16) or len(lattice_charges) % 2 != 0:
+    if method not in ("greedy", "exact"):
+        raise ValueError("Method must be 'greedy' or 'exact'")
+    if method == "exact":
+        # The exact solver is polynomial in the lattice size, so only greedy keeps the cap
+        if len(lattice_charges) < 4 or len(lattice_charges) % 2 != 0:
+            raise ValueError("Lattice size must be even and at least 4")
+    elif not (4 <= len(lattice_charges) <= 16) or len(lattice_charges) % 2 != 0:
         raise ValueError("Lattice size must be even and between 4 and 16")
     if len(lattice_charges) != len(background_field):
         raise ValueError("Background field must match lattice size")
@@ -15,6 +207,15 @@ def gauge_field_invariance(
     if not all(-5 <= charge <= 5 for charge in lattice_charges):
         raise ValueError("Charges must be between -5 and 5")
 
+    if method == "exact":
+        # Global minimum over all charges and links; the starting charges are not used
+        if np is None:
+            raise ImportError("method='exact' needs numpy")
+        charges, links, energy = gauge_field_invariance_exact(background_field, coupling_strength)
+        if return_diagnostics:
+            return charges, links, energy, {"iterations": 0, "stop_reason": "exact", "cycle_length": 0}
+        return charges, links, energy
+
     n = len(lattice_charges)
 
     # Initialize link variables (one less than lattice points due to periodic boundary)
@@ -43,39 +244,39 @@ def gauge_field_invariance(
     # Initialize optimized charges as copy of input
     optimized_charges = lattice_charges.copy()
 
+    # Running totals for gauge_sweep. All terms are integers, so the totals
+    # stay exactly equal to a rescan.
+    energy = calculate_total_energy(optimized_charges, link_variables)
+    charge_flow = sum(optimized_charges[i] * link_variables[i] for i in range(n - 1))
+
+    # A sweep is a deterministic function of (charges, links), so once a state
+    # repeats the remaining sweeps only go around the same cycle again
+    history = [(tuple(optimized_charges), tuple(link_variables))]
+    seen = {history[0]: 0}
+    stop_reason, cycle_length = "max_iterations", 0
+
     for _ in range(max_iterations):
-        # Update link variables
-        for i in range(n - 1):
-            best_link = 0
-            min_energy = float("inf")
-            for link_val in range(-5, 6):
-                old_link = link_variables[i]
-                link_variables[i] = link_val
-                if check_gauge_invariance(optimized_charges, link_variables):
-                    current_energy = calculate_total_energy(optimized_charges, link_variables)
-                    if current_energy < min_energy:
-                        min_energy = current_energy
-                        best_link = link_val
-                link_variables[i] = old_link
-            link_variables[i] = best_link
-
-        # Update charges
-        for i in range(n):
-            best_charge = optimized_charges[i]
-            min_energy = calculate_total_energy(optimized_charges, link_variables)
-            for charge in range(-5, 6):
-                old_charge = optimized_charges[i]
-                optimized_charges[i] = charge
-                if check_gauge_invariance(optimized_charges, link_variables):
-                    current_energy = calculate_total_energy(optimized_charges, link_variables)
-                    if current_energy < min_energy:
-                        min_energy = current_energy
-                        best_charge = charge
-                optimized_charges[i] = old_charge
-            optimized_charges[i] = best_charge
+        energy, charge_flow = gauge_sweep(optimized_charges, link_variables, energy, charge_flow,
+                                          background_field, coupling_strength)
+
+        state = (tuple(optimized_charges), tuple(link_variables))
+        if state in seen:
+            first = seen[state]
+            cycle_length = len(history) - first
+            stop_reason = "fixed_point" if cycle_length == 1 else "cycle"
+            # Jump to the state the remaining sweeps would end on
+            charges, links = history[first + (max_iterations - first) % cycle_length]
+            optimized_charges, link_variables = list(charges), list(links)
+            break
+        seen[state] = len(history)
+        history.append(state)
 
     final_energy = calculate_total_energy(optimized_charges, link_variables)
     if not check_gauge_invariance(optimized_charges, link_variables):
         raise ValueError("Failed to find valid gauge-invariant configuration")
 
+    if return_diagnostics:
+        iterations = len(history) if stop_reason != "max_iterations" else max_iterations
+        return optimized_charges, link_variables, final_energy, {
+            "iterations": iterations, "stop_reason": stop_reason, "cycle_length": cycle_length}
     return optimized_charges, link_variables, final_energy
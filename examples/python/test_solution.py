@@ -1,5 +1,8 @@
+import random
+
 import pytest
-from solution import gauge_field_invariance
+import solution
+from solution import gauge_field_invariance, gauge_sweep
 
 def test_basic_gauge_field():
     assert gauge_field_invariance(
@@ -50,3 +53,117 @@ def test_empty_lattice():
             coupling_strength=5,
             max_iterations=10
         )
+
+def _all_sweeps(charges, background_field, coupling_strength, max_iterations, sweep=gauge_sweep):
+    # Reference: every one of the max_iterations sweeps, no early stopping
+    charges, links = list(charges), [0] * (len(charges) - 1)
+    energy, flow = _energy(charges, links, background_field, coupling_strength), 0
+    for _ in range(max_iterations):
+        energy, flow = sweep(charges, links, energy, flow, background_field, coupling_strength)
+    return charges, links, _energy(charges, links, background_field, coupling_strength)
+
+def _rescan_reference(lattice_charges, background_field, coupling_strength, max_iterations):
+    # The original optimizer: every candidate rescans the whole lattice and
+    # all max_iterations sweeps run
+    n = len(lattice_charges)
+    def total_energy(charges, links):
+        return _energy(charges, links, background_field, coupling_strength)
+    def invariant(charges, links):
+        return sum(charges[i] * links[i] for i in range(n - 1)) == 0
+    charges, links = list(lattice_charges), [0] * (n - 1)
+    for _ in range(max_iterations):
+        for i in range(n - 1):
+            best_link, min_energy = 0, float("inf")
+            for link_val in range(-5, 6):
+                old_link, links[i] = links[i], link_val
+                if invariant(charges, links) and total_energy(charges, links) < min_energy:
+                    min_energy, best_link = total_energy(charges, links), link_val
+                links[i] = old_link
+            links[i] = best_link
+        for i in range(n):
+            best_charge, min_energy = charges[i], total_energy(charges, links)
+            for charge in range(-5, 6):
+                old_charge, charges[i] = charges[i], charge
+                if invariant(charges, links) and total_energy(charges, links) < min_energy:
+                    min_energy, best_charge = total_energy(charges, links), charge
+                charges[i] = old_charge
+            charges[i] = best_charge
+    if not invariant(charges, links):
+        raise ValueError("Failed to find valid gauge-invariant configuration")
+    return charges, links, total_energy(charges, links)
+
+def test_matches_original_rescan_algorithm():
+    rng = random.Random(11)
+    for _ in range(40):
+        n = rng.choice([4, 6, 8, 10])
+        charges = [rng.randint(-5, 5) for _ in range(n)]
+        field = [rng.randint(-20, 20) for _ in range(n)]
+        coupling, iterations = rng.randint(1, 10), rng.randint(10, 20)
+        try:
+            expected = _rescan_reference(charges, field, coupling, iterations)
+        except ValueError:
+            with pytest.raises(ValueError):
+                gauge_field_invariance(charges, field, coupling, iterations)
+            continue
+        assert gauge_field_invariance(charges, field, coupling, iterations) == expected
+
+def _cycling_sweep(period):
+    # Stand-in sweep that steps charge 0 through period values (-5, -4, ...)
+    def sweep(charges, links, energy, flow, background_field, coupling_strength):
+        charges[0] = (charges[0] + 5 + 1) % period - 5
+        return energy, flow
+    return sweep
+
+def test_diagnostics_fixed_point():
+    charges, links, energy, diagnostics = gauge_field_invariance(
+        lattice_charges=[2, -2, 2, -2],
+        background_field=[1, -1, 1, -1],
+        coupling_strength=2,
+        max_iterations=20,
+        return_diagnostics=True
+    )
+    assert (charges, links, energy) == ([-5, 5, -5, 5], [0, 0, 0], -20)
+    assert diagnostics == {"iterations": 2, "stop_reason": "fixed_point", "cycle_length": 1}
+
+def test_early_stop_matches_running_every_sweep():
+    rng = random.Random(3)
+    for _ in range(50):
+        n = rng.choice([4, 8, 16])
+        charges = [rng.randint(-5, 5) for _ in range(n)]
+        field = [rng.randint(-20, 20) for _ in range(n)]
+        coupling, iterations = rng.randint(1, 10), rng.randint(10, 100)
+        result = gauge_field_invariance(charges, field, coupling, iterations)
+        assert result == _all_sweeps(charges, field, coupling, iterations)
+        assert gauge_field_invariance(charges, field, coupling, iterations, return_diagnostics=True)[:3] == result
+
+@pytest.mark.parametrize("max_iterations", [10, 11, 12, 57])
+def test_diagnostics_cycle(monkeypatch, max_iterations):
+    monkeypatch.setattr(solution, "gauge_sweep", _cycling_sweep(3))
+    field = [1, 2, 3, 4]
+    charges, links, energy, diagnostics = gauge_field_invariance(
+        [-5, 0, 0, 0], field, 1, max_iterations, return_diagnostics=True)
+    assert diagnostics == {"iterations": 3, "stop_reason": "cycle", "cycle_length": 3}
+    # Jumping through the cycle lands where running every sweep would
+    assert (charges, links, energy) == _all_sweeps([-5, 0, 0, 0], field, 1, max_iterations, _cycling_sweep(3))
+
+def test_diagnostics_max_iterations(monkeypatch):
+    monkeypatch.setattr(solution, "gauge_sweep", _cycling_sweep(11))
+    charges, links, energy, diagnostics = gauge_field_invariance(
+        [-5, 0, 0, 0], [1, 0, 0, 0], 1, 10, return_diagnostics=True)
+    assert diagnostics == {"iterations": 10, "stop_reason": "max_iterations", "cycle_length": 0}
+    assert (charges, links, energy) == ([5, 0, 0, 0], [0, 0, 0], 5)
+
+def test_invalid_method():
+    with pytest.raises(ValueError):
+        gauge_field_invariance(
+            lattice_charges=[1, -1, 1, -1],
+            background_field=[0, 0, 0, 0],
+            coupling_strength=1,
+            max_iterations=10,
+            method="annealing"
+        )
+
+def _energy(charges, links, background_field, coupling_strength):
+    site = sum(c * b for c, b in zip(charges, background_field))
+    pairs = sum(2 * coupling_strength * charges[i] * charges[i + 1] * links[i] for i in range(len(links)))
+    return site + pairs + coupling_strength * sum(l * l for l in links)
@@ -0,0 +1,430 @@
+import os
+import sys
+import json
+import time
+import shutil
+import signal
+import tempfile
+import importlib
+import selectors
+import threading
+import subprocess
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+DEFAULT_TIMEOUT = 300
+DEFAULT_MEMORY_LIMIT_MB = 2048
+
+# Test commands used by the local backend, which has no image entrypoint to
+# run. {test} is replaced with the problem's test file name and
+# {python} with the interpreter to use.
+LANGUAGE_COMMANDS = {
+    'python': ["{python}", "-m", "pytest", "-q", "-p", "no:cacheprovider", "{test}"],
+    'javascript': ["node", "{test}"],
+    'cpp': ["sh", "-c", "g++ -std=c++17 -O2 -o ./test_binary {test} && ./test_binary"],
+    'java': ["sh", "-c", 'if [ -z "$JUNIT_CONSOLE_JAR" ]; then '
+                         'echo "JUNIT_CONSOLE_JAR must point to junit-platform-console-standalone.jar" >&2; exit 2; fi; '
+                         'mkdir -p ./classes && javac -d ./classes -cp "$JUNIT_CONSOLE_JAR" *.java && '
+                         'java -jar "$JUNIT_CONSOLE_JAR" -cp ./classes --scan-classpath --disable-banner'],
+}
+
+def language_command(language, test_file, python=None):
+    if language not in LANGUAGE_COMMANDS:
+        raise ValueError(f"Unsupported language: {language}")
+    return [part.replace("{test}", test_file).replace("{python}", python or "python")
+            for part in LANGUAGE_COMMANDS[language]]
+
+def _kill(process):
+    try:
+        if os.name == 'posix':
+            os.killpg(process.pid, signal.SIGKILL)
+        else:
+            process.kill()
+    except (ProcessLookupError, PermissionError):
+        pass
+
+def error_result(record, language, message):
+    return {'id': record['id'], 'path': record['path'], 'language': language, 'returncode': None,
+            'status': 'error', 'duration': 0.0, 'output': message}
+
+def run_command(record, language, argv, timeout=DEFAULT_TIMEOUT, cwd=None, env=None, preexec_fn=None):
+    """Run argv and return the result dict shared by every backend."""
+    result = {'id': record['id'], 'path': record['path'], 'language': language}
+
+    started = time.perf_counter()
+    try:
+        process = subprocess.Popen(argv, cwd=cwd, env=env, stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+                                   preexec_fn=preexec_fn, start_new_session=(os.name == 'posix'))
+    except OSError as e:
+        output = str(e).encode()
+        result['returncode'] = None
+        result['status'] = 'error'
+    else:
+        try:
+            output, _ = process.communicate(timeout=timeout)
+            result['returncode'] = process.returncode
+            result['status'] = 'passed' if process.returncode == 0 else 'failed'
+        except subprocess.TimeoutExpired:
+            # Kill the whole process group so compilers and shells die with the test
+            _kill(process)
+            output, _ = process.communicate()
+            result['returncode'] = None
+            result['status'] = 'timeout'
+    result['duration'] = round(time.perf_counter() - started, 3)
+    result['output'] = (output or b'').decode('utf-8', errors='replace')
+    return result
+
+def resource_limits(timeout, memory_limit_mb):
+    """A function that applies the per-run CPU, memory, file size and open file limits, or None off POSIX."""
+    if resource is None:
+        return None
+    cpu_seconds = int(timeout) + 1
+    memory_bytes = memory_limit_mb * 1024 * 1024 if memory_limit_mb else None
+
+    def apply_limits():
+        resource.setrlimit(resource.RLIMIT_CPU, (cpu_seconds, cpu_seconds + 1))
+        if memory_bytes:
+            resource.setrlimit(resource.RLIMIT_AS, (memory_bytes, memory_bytes))
+        resource.setrlimit(resource.RLIMIT_FSIZE, (256 * 1024 * 1024, 256 * 1024 * 1024))
+        resource.setrlimit(resource.RLIMIT_NOFILE, (256, 256))
+    return apply_limits
+
+class DockerBackend:
+    """Starts a fresh coding-workspace-<lang> container per run (the original behaviour)."""
+
+    name = 'docker'
+
+    def command(self, record, language):
+        return ["docker", "run", "--rm", "-v", f"{os.path.abspath(record['path'])}:/app",
+                f"coding-workspace-{language}"]
+
+    def run(self, record, language=None, timeout=DEFAULT_TIMEOUT):
+        language = language or record['language']
+        return run_command(record, language, self.command(record, language), timeout)
+
+    def close(self):
+        pass
+
+class LocalBackend:
+    """Runs tests as local subprocesses; no Docker daemon is needed.
+
+    Every run gets a private copy of the problem directory in a temporary
+    directory, a scrubbed environment and, on POSIX, CPU time, memory, file
+    size and open file limits.
+    """
+
+    name = 'local'
+
+    def __init__(self, memory_limit_mb=DEFAULT_MEMORY_LIMIT_MB, python=None, perf=False):
+        self.memory_limit_mb = memory_limit_mb
+        self.python = python or sys.executable
+        self.perf = perf
+
+    def _limits(self, timeout):
+        return resource_limits(timeout, self.memory_limit_mb)
+
+    def _environment(self, home):
+        env = {key: os.environ[key] for key in ('PATH', 'LANG', 'LC_ALL', 'SYSTEMROOT', 'JUNIT_CONSOLE_JAR')
+               if key in os.environ}
+        env.update({'HOME': home, 'TMPDIR': home, 'PYTHONDONTWRITEBYTECODE': '1', 'PYTHONHASHSEED': '0'})
+        return env
+
+    def run(self, record, language=None, timeout=DEFAULT_TIMEOUT):
+        language = language or record['language']
+        if 'test' not in record:
+            return error_result(record, language, record.get('error', "No test file found"))
+        with tempfile.TemporaryDirectory(prefix="pebble-run-") as sandbox:
+            workdir = os.path.join(sandbox, "app")
+            shutil.copytree(record['path'], workdir,
+                            ignore=shutil.ignore_patterns('__pycache__', '.pytest_cache', '*.csv'))
+            argv = language_command(language, os.path.basename(record['test']), self.python)
+            env = self._environment(sandbox)
+            events_path = os.path.join(sandbox, "events.jsonl")
+            if self.perf and language == 'python':
+                # Load perf_metrics from this checkout as a pytest plugin
+                argv += ["-p", "perf_metrics"]
+                env['PYTHONPATH'] = os.path.dirname(os.path.abspath(__file__))
+                env['PEBBLE_PERF_EVENTS'] = events_path
+            result = run_command(record, language, argv, timeout, cwd=workdir,
+                                 env=env, preexec_fn=self._limits(timeout))
+            if os.path.exists(events_path):
+                with open(events_path, 'r', encoding='utf-8') as f:
+                    result['tests'] = [json.loads(line) for line in f if line.strip()]
+            return result
+
+    def close(self):
+        pass
+
+# Runs inside a warm container: copies the read-only problem directory $1 to
+# a private directory, runs the remaining arguments there and removes it again
+WARM_RUN_SCRIPT = ('dir=$(mktemp -d) && cp -R "$1"/. "$dir" && cd "$dir" || exit 125; shift; '
+                   '"$@"; code=$?; cd / && rm -rf "$dir"; exit $code')
+
+class WarmDockerBackend:
+    """Reuses one long-lived coding-workspace-<lang> container per language.
+
+    The workspace is mounted read-only once and every run is a `docker exec`
+    of the image's own entrypoint and command, so only the first run per
+    language pays for the container start. Each run works on a private copy
+    of the problem directory inside the container (the cold backend mounts
+    it at the image's working directory instead), so build artifacts never
+    reach the user's files and concurrent runs do not share a directory.
+    """
+
+    name = 'warm'
+
+    def __init__(self, workspace="."):
+        self.workspace = os.path.abspath(workspace)
+        self._containers = {}
+        self._commands = {}
+        self._lock = threading.Lock()
+
+    def _image_command(self, image):
+        inspected = subprocess.run(["docker", "image", "inspect", "--format", "{{json .Config}}", image],
+                                   stdout=subprocess.PIPE, stderr=subprocess.STDOUT, check=True)
+        config = json.loads(inspected.stdout)
+        command = (config.get('Entrypoint') or []) + (config.get('Cmd') or [])
+        if not command:
+            raise ValueError(f"Image {image} defines no entrypoint or command to run the tests with")
+        return command
+
+    def _container(self, language):
+        with self._lock:
+            if language not in self._containers:
+                image = f"coding-workspace-{language}"
+                command = self._image_command(image)
+                started = subprocess.run(
+                    ["docker", "run", "-d", "--rm", "--entrypoint", "sleep", "-v", f"{self.workspace}:/workspace:ro",
+                     image, "infinity"],
+                    stdout=subprocess.PIPE, stderr=subprocess.STDOUT, check=True)
+                self._commands[language] = command
+                self._containers[language] = started.stdout.decode().strip()
+            return self._containers[language], self._commands[language]
+
+    def command(self, record, container, image_command):
+        relative = os.path.relpath(os.path.abspath(record['path']), self.workspace).replace(os.sep, '/')
+        return ["docker", "exec", container, "sh", "-c", WARM_RUN_SCRIPT, "sh", f"/workspace/{relative}"] \
+            + image_command
+
+    def run(self, record, language=None, timeout=DEFAULT_TIMEOUT):
+        language = language or record['language']
+        try:
+            container, image_command = self._container(language)
+        except (OSError, ValueError, subprocess.CalledProcessError) as e:
+            output = getattr(e, 'stdout', None) or str(e).encode()
+            return error_result(record, language, output.decode('utf-8', errors='replace'))
+        if 'test' not in record:
+            return error_result(record, language, record.get('error', "No test file found"))
+        return run_command(record, language, self.command(record, container, image_command), timeout)
+
+    def close(self):
+        with self._lock:
+            for container in self._containers.values():
+                subprocess.run(["docker", "rm", "-f", container], stdout=subprocess.DEVNULL,
+                               stderr=subprocess.DEVNULL)
+            self._containers.clear()
+            self._commands.clear()
+
+# Imported once in the fork server parent so that children start with them loaded
+FORK_PRELOAD = ['bisect', 'collections', 'copy', 'dataclasses', 'functools', 'heapq', 'itertools',
+                'json', 'math', 'random', 're', 'string', 'typing']
+
+class _PytestEventStream:
+    """pytest plugin that writes one JSON line per finished test to a pipe."""
+
+    def __init__(self, fd):
+        self.fd = fd
+
+    def pytest_runtest_logreport(self, report):
+        if report.when == 'call' or (report.when != 'call' and report.outcome != 'passed'):
+            event = {'nodeid': report.nodeid, 'when': report.when, 'outcome': report.outcome,
+                     'duration': round(report.duration, 6), 'user_properties': dict(report.user_properties)}
+            os.write(self.fd, (json.dumps(event, default=str) + "\n").encode())
+
+class ForkServerBackend:
+    """Runs Python problems by forking a warm interpreter per problem.
+
+    pytest and common standard-library modules are imported once in this
+    process; each problem then runs in a forked child with its own cwd,
+    sys.path and a fresh `solution` module, the same CPU, memory, file size
+    and open file limits as the local backend, and streams per-test results
+    back over a pipe. Problems in other languages are handed to the local
+    backend. POSIX only.
+    """
+
+    name = 'fork'
+
+    def __init__(self, memory_limit_mb=DEFAULT_MEMORY_LIMIT_MB, preload=FORK_PRELOAD, plugins=(), perf=False):
+        if not hasattr(os, 'fork'):
+            raise RuntimeError("The fork backend needs os.fork (Linux or macOS)")
+        import pytest
+        from _pytest.config import default_plugins
+        for name in list(preload) + [f"_pytest.{plugin}" for plugin in default_plugins]:
+            try:
+                importlib.import_module(name)
+            except ImportError:
+                pass
+        self._pytest = pytest
+        self.plugins = list(plugins)
+        if perf:
+            from perf_metrics import PerfPlugin
+            self.plugins.append(PerfPlugin)
+        self.memory_limit_mb = memory_limit_mb
+        self.fallback = LocalBackend(memory_limit_mb, perf=perf)
+        self._warm_up()
+
+    def _warm_up(self):
+        # One throwaway session pulls in everything pytest imports lazily
+        import io
+        import contextlib
+        cwd = os.getcwd()
+        with tempfile.TemporaryDirectory(prefix="pebble-warm-") as workdir:
+            with open(os.path.join(workdir, "test_warm_up.py"), 'w', encoding='utf-8') as f:
+                f.write("def test_warm_up():\n    assert True\n")
+            try:
+                os.chdir(workdir)
+                with contextlib.redirect_stdout(io.StringIO()), contextlib.redirect_stderr(io.StringIO()):
+                    self._pytest.main(["-q", "-p", "no:cacheprovider", "test_warm_up.py"])
+            finally:
+                os.chdir(cwd)
+                sys.modules.pop("test_warm_up", None)
+
+    def _child(self, record, event_fd, output_fd, timeout):
+        # Never returns: runs one problem's tests and exits with pytest's code
+        code = 3
+        try:
+            os.dup2(output_fd, 1)
+            os.dup2(output_fd, 2)
+            resource_limits(timeout, self.memory_limit_mb)()
+            path = os.path.abspath(record['path'])
+            os.chdir(path)
+            sys.path.insert(0, path)
+            sys.dont_write_bytecode = True
+            for module in ('solution', os.path.splitext(os.path.basename(record['test']))[0]):
+                sys.modules.pop(module, None)
+            plugins = [_PytestEventStream(event_fd)] + [plugin() for plugin in self.plugins]
+            code = int(self._pytest.main(["-q", "-p", "no:cacheprovider", os.path.basename(record['test'])],
+                                         plugins=plugins))
+        except BaseException:
+            import traceback
+            traceback.print_exc()
+        finally:
+            sys.stdout.flush()
+            sys.stderr.flush()
+            os._exit(code)
+
+    def _spawn(self, record, timeout):
+        read_fd, write_fd = os.pipe()
+        output = tempfile.TemporaryFile()
+        sys.stdout.flush()
+        sys.stderr.flush()
+        pid = os.fork()
+        if pid == 0:
+            os.close(read_fd)
+            self._child(record, write_fd, output.fileno(), timeout)
+        os.close(write_fd)
+        return {'record': record, 'pid': pid, 'fd': read_fd, 'output': output, 'buffer': b'', 'tests': [],
+                'started': time.perf_counter(), 'deadline': time.monotonic() + timeout}
+
+    def _finish(self, state, status=None):
+        _, wait_status = os.waitpid(state['pid'], 0)
+        returncode = os.waitstatus_to_exitcode(wait_status) if hasattr(os, 'waitstatus_to_exitcode') \
+            else (os.WEXITSTATUS(wait_status) if os.WIFEXITED(wait_status) else -os.WTERMSIG(wait_status))
+        state['output'].seek(0)
+        record = state['record']
+        result = {'id': record['id'], 'path': record['path'], 'language': 'python',
+                  'returncode': None if status == 'timeout' else returncode,
+                  'status': status or ('passed' if returncode == 0 else 'failed'),
+                  'duration': round(time.perf_counter() - state['started'], 3),
+                  'output': state['output'].read().decode('utf-8', errors='replace'),
+                  'tests': state['tests']}
+        state['output'].close()
+        return result
+
+    def run(self, record, language=None, timeout=DEFAULT_TIMEOUT):
+        return self.run_many([record], language, 1, timeout)[0]
+
+    def run_many(self, records, language=None, jobs=None, timeout=DEFAULT_TIMEOUT, on_result=None):
+        jobs = jobs or os.cpu_count() or 1
+        results = []
+
+        def emit(result):
+            results.append(result)
+            if on_result:
+                on_result(result)
+
+        forked = []
+        others = []
+        for record in records:
+            if (language or record.get('language')) == 'python' and 'test' in record:
+                forked.append(record)
+            else:
+                others.append(record)
+
+        pending = forked[::-1]
+        running = {}
+        with selectors.DefaultSelector() as selector:
+            while pending or running:
+                while pending and len(running) < jobs:
+                    state = self._spawn(pending.pop(), timeout)
+                    running[state['fd']] = state
+                    selector.register(state['fd'], selectors.EVENT_READ, state)
+
+                wait = max(0.0, min(state['deadline'] for state in running.values()) - time.monotonic())
+                for key, _ in selector.select(timeout=wait):
+                    state = key.data
+                    chunk = os.read(state['fd'], 65536)
+                    if chunk:
+                        state['buffer'] += chunk
+                        *lines, state['buffer'] = state['buffer'].split(b"\n")
+                        state['tests'].extend(json.loads(line) for line in lines if line)
+                        continue
+                    selector.unregister(state['fd'])
+                    os.close(state['fd'])
+                    del running[state['fd']]
+                    emit(self._finish(state))
+
+                now = time.monotonic()
+                for fd, state in list(running.items()):
+                    if now >= state['deadline']:
+                        os.kill(state['pid'], signal.SIGKILL)
+                        selector.unregister(fd)
+                        os.close(fd)
+                        del running[fd]
+                        emit(self._finish(state, 'timeout'))
+
+        # Other languages go through the local backend once no more children are forked
+        if others:
+            with ThreadPoolExecutor(max_workers=min(jobs, len(others))) as executor:
+                for result in executor.map(lambda r: self.fallback.run(r, language, timeout), others):
+                    emit(result)
+
+        results.sort(key=lambda r: r['id'])
+        return results
+
+    def close(self):
+        pass
+
+BACKENDS = {
+    'docker': DockerBackend,
+    'local': LocalBackend,
+    'warm': WarmDockerBackend,
+    'fork': ForkServerBackend,
+}
+
+def make_backend(name, **options):
+    if name not in BACKENDS:
+        raise ValueError(f"Unknown backend: {name}. Available: {', '.join(sorted(BACKENDS))}")
+    if name == 'local':
+        return LocalBackend(memory_limit_mb=options.get('memory_limit_mb', DEFAULT_MEMORY_LIMIT_MB),
+                            perf=options.get('perf', False))
+    if name == 'warm':
+        return WarmDockerBackend(options.get('workspace', "."))
+    if name == 'fork':
+        return ForkServerBackend(memory_limit_mb=options.get('memory_limit_mb', DEFAULT_MEMORY_LIMIT_MB),
+                                 perf=options.get('perf', False))
+    return BACKENDS[name]()
@@ -1,14 +1,23 @@
 import sys
 import os
-import csv
 import re
+import csv
+import json
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+
+from workspace_index import WorkspaceIndex, find_solution_file
+
+CSV_HEADER = ['id', 'language', 'prompt', 'solution', 'test', 'username']
 
-LANGUAGE_EXTENSIONS = {
-    'cpp': ['.cpp'],
-    'python': ['.py'],
-    'javascript': ['.mjs'],  
-    'java': ['.java']
-}
+DEFAULT_COMBINED_OUTPUT = "bundle.csv"
+
+MANIFEST_FILE = ".bundle_manifest.json"
+MANIFEST_VERSION = 2
+
+# Problem directories are named by UUID, so an argument shaped like one is a
+# directory even when it does not exist
+PROBLEM_DIR_NAME = re.compile(r"[0-9a-f]{8}(-[0-9a-f]{4}){3}-[0-9a-f]{12}", re.IGNORECASE)
 
 def read_file_content(filepath):
     try:
@@ -17,69 +26,279 @@ def read_file_content(filepath):
     except FileNotFoundError as e:
         raise Exception(f"❌ File not found: {filepath}") from e
 
-def find_solution_file(base_path):
-    for lang, exts in LANGUAGE_EXTENSIONS.items():
-        for ext in exts:
-            solution_path = os.path.join(base_path, f"solution{ext}")
-            
-            # not this one 
-            if not os.path.exists(solution_path):
-                continue
-
-            files = os.listdir(base_path)
-            test_file = next(f for f in files if re.match(rf"test.*{ext}$", f, re.IGNORECASE))
-            #  construct full path
-            test_path = os.path.join(base_path, test_file)
-            
-            return solution_path, test_path, lang
-
-    return None, None, None
-
-def bundle_problem(target_uuid, username):
-    # Define paths
-    base_path = target_uuid
+def problem_id_for(base_path):
+    return os.path.basename(os.path.normpath(base_path))
+
+def locate_problem_files(base_path):
     prompt_path = os.path.join(base_path, "prompt.md")
-    
+
     # Find the correct solution and test files
     solution_path, test_path, lang = find_solution_file(base_path)
-    
+
     if not solution_path:
         raise Exception(f"❌ No solution file found in supported languages")
-    
+
+    return prompt_path, solution_path, test_path, lang
+
+def collect_problem_row(base_path, username, record=None):
+    if record is not None:
+        prompt_path, solution_path, test_path, lang = (record['prompt'], record['solution'],
+                                                       record['test'], record['language'])
+    else:
+        prompt_path, solution_path, test_path, lang = locate_problem_files(base_path)
+
     # Read contents
     prompt = read_file_content(prompt_path)
     solution = read_file_content(solution_path)
     test = read_file_content(test_path)
 
-    # Create CSV
-    output_file = os.path.join(base_path, f"{target_uuid}.csv")
+    return [problem_id_for(base_path), lang, prompt, solution, test, username]
+
+def load_manifest(manifest_path=MANIFEST_FILE):
+    try:
+        with open(manifest_path, 'r', encoding='utf-8') as f:
+            manifest = json.load(f)
+    except (FileNotFoundError, ValueError):
+        return {}
+    if manifest.get('version') != MANIFEST_VERSION:
+        return {}
+    return manifest.get('problems', {})
+
+def save_manifest(problems, manifest_path=MANIFEST_FILE):
+    # Write to a temporary file first so an interrupted run never leaves a torn manifest
+    tmp_path = f"{manifest_path}.tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump({'version': MANIFEST_VERSION, 'problems': problems}, f, indent=1, sort_keys=True)
+    os.replace(tmp_path, manifest_path)
+
+def manifest_key(base_path):
+    return os.path.normpath(base_path)
+
+def _content_signature(entry):
+    return (entry['language'], entry['username'],
+            sorted((name, meta['sha256']) for name, meta in entry['files'].items()))
+
+def prepare_problem(record, username, previous=None, force=False, output_file=None):
+    """Return (manifest_entry, row) for an index record.
+
+    row is None when the prompt, solution and test contents (and username)
+    match the previous manifest entry and output_file, if given, still exists.
+    The entry keeps the row, so an unchanged problem is never read again: a
+    cache hit takes its row from entry['row'].
+    """
+    if 'error' in record:
+        raise Exception(f"❌ {record['error']}")
+
+    entry = {'language': record['language'], 'username': username, 'files': record['files']}
+
+    same_content = previous is not None and _content_signature(previous) == _content_signature(entry)
+    if output_file is None:
+        unchanged = same_content
+        entry['per_dir_csv'] = same_content and previous.get('per_dir_csv', False)
+    else:
+        # The caller writes output_file on a miss, so it is current either way
+        unchanged = same_content and previous.get('per_dir_csv', False) and os.path.exists(output_file)
+        entry['per_dir_csv'] = True
+
+    if unchanged and not force and 'row' in previous:
+        entry['row'] = previous['row']
+        return entry, None
+    entry['row'] = collect_problem_row(record['path'], username, record)
+    return entry, entry['row']
+
+def write_csv(output_file, rows):
     with open(output_file, 'w', newline='', encoding='utf-8') as f:
         writer = csv.writer(f, quoting=csv.QUOTE_ALL)
         # Write header
-        writer.writerow(['id', 'language', 'prompt', 'solution', 'test', 'username'])
+        writer.writerow(CSV_HEADER)
         # Write data
-        writer.writerow([target_uuid, lang, prompt, solution, test, username])
-    
-    print(f"✅ Bundle created: {output_file}")
+        writer.writerows(rows)
 
-if __name__ == "__main__":
-    if len(sys.argv) < 2:
-        print("Usage: python finish_problem.py <target_directory> [username]")
-        sys.exit(1)
-    
-    uuid = sys.argv[1]
-    
-    if not os.path.exists(uuid):
-        print(f"❌ Directory {uuid} not found")
+def bundle_problem(target_uuid, username, force=False, manifest_path=MANIFEST_FILE, index=None):
+    index = index or WorkspaceIndex.load()
+    record = index.lookup(target_uuid)
+    manifest = load_manifest(manifest_path)
+    key = manifest_key(target_uuid)
+    output_file = os.path.join(target_uuid, f"{problem_id_for(target_uuid)}.csv")
+
+    entry, row = prepare_problem(record, username, manifest.get(key), force, output_file)
+    manifest[key] = entry
+
+    if row is None:
+        print(f"♻️  Unchanged since last bundle: {output_file}")
+    else:
+        # Create CSV
+        write_csv(output_file, [row])
+        print(f"✅ Bundle created: {output_file}")
+
+    save_manifest(manifest, manifest_path)
+    index.save()
+    return output_file
+
+def _bundle_worker(job):
+    # Runs in a worker process; errors are returned instead of raised so that
+    # one broken directory does not abort the whole export
+    record, username, per_dir, previous, force = job
+    base_path = record['path']
+    try:
+        per_dir_output = os.path.join(base_path, f"{problem_id_for(base_path)}.csv") if per_dir else None
+        entry, row = prepare_problem(record, username, previous, force, per_dir_output)
+        if row is None:
+            # Unchanged: the combined bundle still needs the row, which the
+            # manifest kept, and the per-dir CSV on disk is already current
+            return base_path, 'cached', entry['row'], entry
+        if per_dir:
+            write_csv(per_dir_output, [row])
+        return base_path, 'bundled', row, entry
+    except Exception as e:
+        return base_path, 'skipped', None, str(e).removeprefix("❌ ")
+
+def bundle_many(records, username, output_file=DEFAULT_COMBINED_OUTPUT, per_dir=False, jobs=None,
+                force=False, manifest_path=MANIFEST_FILE, jsonl_file=None, jsonl_blobs=True):
+    """Bundle workspace index records across a process pool into one combined CSV.
+
+    Only problems whose contents changed since the last run recorded in the
+    manifest have their per-dir CSV rewritten, unless force is set; output_file
+    always receives every problem, in record order as soon as it arrives, and
+    so does the gzip JSONL bundle jsonl_file when one is given.
+    Returns (bundled_count, cached_count, skipped) where skipped is a list of
+    (path, reason).
+    """
+    jobs = jobs or os.cpu_count() or 1
+    manifest = load_manifest(manifest_path)
+    work = [(record, username, per_dir, manifest.get(manifest_key(record['path'])), force) for record in records]
+    bundled = 0
+    cached = 0
+    skipped = []
+    jsonl_writer = None
+    if jsonl_file:
+        from bundle_jsonl import JsonlBundleWriter
+        jsonl_writer = JsonlBundleWriter(jsonl_file, blobs=jsonl_blobs)
+
+    with open(output_file, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.writer(f, quoting=csv.QUOTE_ALL)
+        writer.writerow(CSV_HEADER)
+
+        if jobs == 1 or len(work) <= 1:
+            results = map(_bundle_worker, work)
+            executor = None
+        else:
+            executor = ProcessPoolExecutor(max_workers=min(jobs, len(work)))
+            chunksize = max(1, len(work) // (jobs * 4))
+            results = executor.map(_bundle_worker, work, chunksize=chunksize)
+
+        try:
+            for base_path, status, row, payload in results:
+                if status == 'skipped':
+                    skipped.append((base_path, payload))
+                    continue
+                manifest[manifest_key(base_path)] = payload
+                writer.writerow(row)
+                if jsonl_writer is not None:
+                    jsonl_writer.write_row(row)
+                if status == 'cached':
+                    cached += 1
+                else:
+                    bundled += 1
+        finally:
+            if executor is not None:
+                executor.shutdown()
+            if jsonl_writer is not None:
+                jsonl_writer.close()
+
+    save_manifest(manifest, manifest_path)
+    return bundled, cached, skipped
+
+def positive_int(text):
+    try:
+        value = int(text)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid int value: {text!r}") from None
+    if value < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {value}")
+    return value
+
+def looks_like_directory(text):
+    return (os.path.exists(text) or os.sep in text or (os.altsep and os.altsep in text)
+            or PROBLEM_DIR_NAME.fullmatch(os.path.basename(text)) is not None)
+
+def parse_args(argv):
+    parser = argparse.ArgumentParser(
+        description="Convert problem directories into CSV bundles for submission.",
+        usage="python finish_problem.py <target_directory> [username]\n"
+              "       python finish_problem.py [--all | <dir> <dir> ...] [-u USERNAME] [-o OUTPUT] [--per-dir] [-j JOBS]"
+              " [--jsonl PATH]",
+    )
+    parser.add_argument("targets", nargs="*", help="problem directories to bundle")
+    parser.add_argument("--all", action="store_true", help="bundle every problem directory in the workspace")
+    parser.add_argument("-u", "--username", help="your Shipd username")
+    parser.add_argument("-o", "--output", help=f"combined CSV to write (default: {DEFAULT_COMBINED_OUTPUT})")
+    parser.add_argument("--per-dir", action="store_true", help="also write <uuid>/<uuid>.csv for every problem")
+    parser.add_argument("-j", "--jobs", type=positive_int, help="worker processes (default: number of CPUs)")
+    parser.add_argument("--workspace", default=".", help="workspace root used by --all (default: .)")
+    parser.add_argument("--force", action="store_true", help="re-bundle problems even if they are unchanged")
+    parser.add_argument("--jsonl", metavar="PATH", help="also stream the bundle to a gzip JSONL file (e.g. bundle.jsonl.gz)")
+    parser.add_argument("--no-blobs", action="store_true",
+                        help="store every text inline in the JSONL file instead of sharing repeated paragraphs")
+    args = parser.parse_args(argv)
+
+    # Keep supporting the original `<target_directory> [username]` form. A
+    # second argument that could be a directory stays one, so a mistyped
+    # directory is reported as missing instead of becoming the username.
+    if (not args.all and args.username is None and len(args.targets) == 2
+            and not looks_like_directory(args.targets[1])):
+        args.username = args.targets.pop()
+
+    if not args.all and not args.targets:
+        parser.print_usage()
         sys.exit(1)
-    
-    # Get username from argument or prompt
-    if len(sys.argv) >= 3:
-        username = sys.argv[2]
+    return args
+
+if __name__ == "__main__":
+    args = parse_args(sys.argv[1:])
+
+    for target in args.targets:
+        if not os.path.exists(target):
+            print(f"❌ Directory {target} not found")
+            sys.exit(1)
+
+    index = WorkspaceIndex.load(args.workspace)
+    skipped = []
+    if args.all:
+        records = index.problems()
+        skipped = index.skipped()
+        known = {os.path.normpath(record['path']) for record in records}
+        records += [index.lookup(t) for t in args.targets if os.path.normpath(t) not in known]
     else:
+        records = [index.lookup(t) for t in args.targets]
+    index.save()
+
+    # Get username from argument or prompt
+    username = args.username
+    if not username:
         username = input("Enter your Shipd username: ").strip()
         if not username:
             print("❌ Username cannot be empty")
             sys.exit(1)
-        
-    bundle_problem(uuid, username) 
\ No newline at end of file
+
+    manifest_path = os.path.join(args.workspace, MANIFEST_FILE)
+
+    if len(records) == 1 and not args.all and not args.output and not args.jsonl:
+        bundle_problem(args.targets[0], username, force=args.force, manifest_path=manifest_path, index=index)
+        sys.exit(0)
+
+    output_file = args.output or DEFAULT_COMBINED_OUTPUT
+    bundled, cached, failed = bundle_many(records, username, output_file, per_dir=args.per_dir, jobs=args.jobs,
+                                          force=args.force, manifest_path=manifest_path,
+                                          jsonl_file=args.jsonl, jsonl_blobs=not args.no_blobs)
+
+    written = bundled + cached
+    print(f"✅ Bundle created: {output_file} ({written} problem{'s' if written != 1 else ''})")
+    if args.jsonl:
+        print(f"✅ JSONL bundle created: {args.jsonl}")
+    print(f"♻️  Cache: {cached} hit{'s' if cached != 1 else ''}, {bundled} miss{'es' if bundled != 1 else ''}")
+    for path, reason in skipped + failed:
+        print(f"⚠️  Skipped {path}: {reason}")
+
+    if not bundled and not cached:
+        sys.exit(1)
@@ -0,0 +1,137 @@
+import os
+import json
+import time
+import tracemalloc
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+import pytest
+
+HISTORY_FILE = ".perf_history.json"
+HISTORY_LIMIT = 50
+DEFAULT_THRESHOLD = 1.5
+
+# Below these baseline values a "regression" is just timer or allocator noise
+# (max_rss is the whole pytest process, interpreter included)
+NOISE_FLOORS = {'wall': 0.005, 'cpu': 0.005, 'peak_memory': 64 * 1024, 'max_rss': 64 * 1024 * 1024}
+
+EVENTS_ENV = "PEBBLE_PERF_EVENTS"
+
+def _max_rss_bytes():
+    if resource is None:
+        return None
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS bytes
+    return rss if os.uname().sysname == 'Darwin' else rss * 1024
+
+class PerfPlugin:
+    """pytest plugin that measures every test call.
+
+    Wall time, CPU time, the tracemalloc peak and the process's peak RSS are
+    attached to the test report as the 'perf' user property. tracemalloc
+    slows allocation-heavy code down, but it does so consistently from run to
+    run, which is what regression detection needs.
+    """
+
+    def __init__(self, trace_memory=True):
+        self.trace_memory = trace_memory
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_runtest_call(self, item):
+        if self.trace_memory:
+            if not tracemalloc.is_tracing():
+                tracemalloc.start()
+            tracemalloc.reset_peak()
+            base, _ = tracemalloc.get_traced_memory()
+        wall = time.perf_counter()
+        cpu = time.process_time()
+        yield
+        metrics = {'wall': round(time.perf_counter() - wall, 6), 'cpu': round(time.process_time() - cpu, 6)}
+        if self.trace_memory:
+            _, peak = tracemalloc.get_traced_memory()
+            metrics['peak_memory'] = max(0, peak - base)
+        metrics['max_rss'] = _max_rss_bytes()
+        item.user_properties.append(('perf', metrics))
+
+def pytest_configure(config):
+    # Entry point when loaded with `-p perf_metrics` in a subprocess
+    config.pluginmanager.register(PerfPlugin(), "pebble-perf")
+    if os.environ.get(EVENTS_ENV):
+        # The same per-test JSON lines the fork server streams over its pipe
+        from execution_backends import _PytestEventStream
+        fd = os.open(os.environ[EVENTS_ENV], os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o600)
+        config.pluginmanager.register(_PytestEventStream(fd), "pebble-perf-events")
+
+def problem_key(path, workspace="."):
+    """History key of a problem: its path relative to the workspace, with '/' separators.
+
+    Directory names alone can collide (examples/python and seeds/python).
+    """
+    return os.path.relpath(os.path.abspath(path), os.path.abspath(workspace)).replace(os.sep, '/')
+
+def collect_metrics(results, workspace="."):
+    """Map problem key -> test nodeid -> perf metrics from runner results."""
+    metrics = {}
+    for result in results:
+        for test in result.get('tests', []):
+            perf = test.get('user_properties', {}).get('perf')
+            if perf and test.get('outcome') == 'passed':
+                metrics.setdefault(problem_key(result['path'], workspace), {})[test['nodeid']] = perf
+    return metrics
+
+def load_history(history_path=HISTORY_FILE):
+    try:
+        with open(history_path, 'r', encoding='utf-8') as f:
+            return json.load(f).get('runs', [])
+    except (FileNotFoundError, ValueError):
+        return []
+
+def save_history(runs, history_path=HISTORY_FILE):
+    tmp_path = f"{history_path}.tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump({'runs': runs[-HISTORY_LIMIT:]}, f, indent=1)
+    os.replace(tmp_path, history_path)
+
+def baseline_for(runs, problem_id, nodeid):
+    for run in reversed(runs):
+        metrics = run['metrics'].get(problem_id, {}).get(nodeid)
+        if metrics:
+            return metrics
+    return None
+
+def find_regressions(metrics, runs, threshold=DEFAULT_THRESHOLD):
+    """Compare metrics against the latest recorded baseline of every test.
+
+    Returns a list of (problem_id, nodeid, metric, baseline, current) for
+    every metric that grew past threshold times its baseline.
+    """
+    regressions = []
+    for problem_id, tests in sorted(metrics.items()):
+        for nodeid, current in sorted(tests.items()):
+            baseline = baseline_for(runs, problem_id, nodeid)
+            if baseline is None:
+                continue
+            for metric, floor in NOISE_FLOORS.items():
+                before, now = baseline.get(metric), current.get(metric)
+                if before is None or now is None or max(before, now) < floor:
+                    continue
+                if now > max(before, floor) * threshold:
+                    regressions.append((problem_id, nodeid, metric, before, now))
+    return regressions
+
+def record_run(metrics, history_path=HISTORY_FILE, threshold=DEFAULT_THRESHOLD):
+    """Check metrics for regressions, then append them to the history file."""
+    runs = load_history(history_path)
+    regressions = find_regressions(metrics, runs, threshold)
+    if metrics:
+        runs.append({'timestamp': time.strftime("%Y-%m-%dT%H:%M:%S"), 'metrics': metrics})
+        save_history(runs, history_path)
+    return regressions
+
+def format_value(metric, value):
+    if metric in ('wall', 'cpu'):
+        return f"{value * 1000:.1f}ms"
+    return f"{value / 1024:.0f}KiB"
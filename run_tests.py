@@ -0,0 +1,164 @@
+import sys
+import os
+import json
+import time
+import argparse
+import xml.etree.ElementTree as ET
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from workspace_index import LANGUAGE_EXTENSIONS, WorkspaceIndex
+from execution_backends import BACKENDS, DEFAULT_MEMORY_LIMIT_MB, DEFAULT_TIMEOUT, DockerBackend, make_backend
+
+def run_problem(record, language=None, timeout=DEFAULT_TIMEOUT, backend=None):
+    """Run one problem's test suite and return its result dict."""
+    return (backend or DockerBackend()).run(record, language, timeout)
+
+def run_many(records, language=None, jobs=None, timeout=DEFAULT_TIMEOUT, on_result=None, backend=None):
+    """Run records concurrently on a bounded pool; results are returned sorted by id."""
+    jobs = jobs or os.cpu_count() or 1
+    backend = backend or DockerBackend()
+    if hasattr(backend, 'run_many'):
+        # Backends that schedule their own workers (e.g. the fork server)
+        return backend.run_many(records, language, jobs, timeout, on_result)
+    results = []
+    with ThreadPoolExecutor(max_workers=max(1, min(jobs, len(records) or 1))) as executor:
+        futures = [executor.submit(backend.run, record, language, timeout) for record in records]
+        for future in as_completed(futures):
+            result = future.result()
+            results.append(result)
+            if on_result:
+                on_result(result)
+    results.sort(key=lambda r: r['id'])
+    return results
+
+def summarize(results):
+    summary = {'total': len(results), 'duration': round(sum(r['duration'] for r in results), 3)}
+    for status in ('passed', 'failed', 'timeout', 'error'):
+        summary[status] = sum(1 for r in results if r['status'] == status)
+    return summary
+
+def write_json_report(results, output_file, wall_time=None):
+    report = {'summary': summarize(results), 'results': results}
+    if wall_time is not None:
+        report['summary']['wall_time'] = round(wall_time, 3)
+    with open(output_file, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=2)
+
+def write_junit_report(results, output_file, wall_time=None):
+    summary = summarize(results)
+    suites = ET.Element('testsuites', tests=str(summary['total']), failures=str(summary['failed']),
+                        errors=str(summary['timeout'] + summary['error']),
+                        time=str(round(wall_time, 3) if wall_time is not None else summary['duration']))
+    suite = ET.SubElement(suites, 'testsuite', name='pebble-workbook', tests=str(summary['total']),
+                          failures=str(summary['failed']), errors=str(summary['timeout'] + summary['error']),
+                          time=str(summary['duration']))
+    for result in results:
+        case = ET.SubElement(suite, 'testcase', classname=result['language'], name=result['id'],
+                             time=str(result['duration']))
+        if result['status'] == 'failed':
+            ET.SubElement(case, 'failure', message=f"exit code {result['returncode']}").text = result['output']
+        elif result['status'] != 'passed':
+            ET.SubElement(case, 'error', message=result['status']).text = result['output']
+        else:
+            ET.SubElement(case, 'system-out').text = result['output']
+    ET.ElementTree(suites).write(output_file, encoding='utf-8', xml_declaration=True)
+
+def print_result(result, verbose=False):
+    icon = '✅' if result['status'] == 'passed' else '❌'
+    print(f"{icon} {result['id']} ({result['language']}) {result['status']} in {result['duration']:.2f}s", flush=True)
+    if verbose or result['status'] != 'passed':
+        print(result['output'].rstrip(), flush=True)
+
+def parse_args(argv):
+    parser = argparse.ArgumentParser(description="Run the test suites of many problems concurrently.")
+    parser.add_argument("targets", nargs="*", help="problem directories to test")
+    parser.add_argument("--all", action="store_true", help="test every problem directory in the workspace")
+    parser.add_argument("--language", choices=sorted(LANGUAGE_EXTENSIONS),
+                        help="with --all, only test problems in this language; otherwise, "
+                             "test the given directories as this language")
+    parser.add_argument("--backend", choices=sorted(BACKENDS), default="docker",
+                        help="docker: fresh container per problem (default); local: sandboxed local "
+                             "subprocess, no Docker needed; warm: one reused container per language; "
+                             "fork: Python problems in forked children of a warm pytest process")
+    parser.add_argument("--memory-limit", type=int, default=DEFAULT_MEMORY_LIMIT_MB, metavar="MB",
+                        help=f"address space limit for the local and fork backends (default: {DEFAULT_MEMORY_LIMIT_MB})")
+    parser.add_argument("-j", "--jobs", type=int, help="concurrent runs (default: number of CPUs)")
+    parser.add_argument("--timeout", type=float, default=DEFAULT_TIMEOUT,
+                        help=f"per-problem timeout in seconds (default: {DEFAULT_TIMEOUT})")
+    parser.add_argument("--json", metavar="FILE", help="write an aggregated JSON report")
+    parser.add_argument("--junit", metavar="FILE", help="write an aggregated JUnit XML report")
+    parser.add_argument("--perf", action="store_true",
+                        help="record wall time, CPU time and peak memory of every Python test "
+                             "(local and fork backends) and flag regressions")
+    parser.add_argument("--perf-threshold", type=float, default=1.5, metavar="RATIO",
+                        help="flag a test when a metric exceeds RATIO times its last baseline (default: 1.5)")
+    parser.add_argument("--perf-history", metavar="FILE",
+                        help="perf history file (default: .perf_history.json in the workspace)")
+    parser.add_argument("--fail-on-regression", action="store_true", help="exit non-zero when a regression is flagged")
+    parser.add_argument("-v", "--verbose", action="store_true", help="print the output of passing problems too")
+    parser.add_argument("--workspace", default=".", help="workspace root (default: .)")
+    args = parser.parse_args(argv)
+    if not args.all and not args.targets:
+        parser.print_usage()
+        sys.exit(1)
+    if args.perf and args.backend not in ('local', 'fork'):
+        parser.error("--perf needs --backend local or --backend fork")
+    return args
+
+if __name__ == "__main__":
+    args = parse_args(sys.argv[1:])
+
+    index = WorkspaceIndex.load(args.workspace)
+    index.save()
+
+    override = None
+    if args.all:
+        records = index.problems(args.language)
+        for path, reason in index.skipped():
+            print(f"⚠️  Skipped {path}: {reason}")
+    else:
+        records = []
+        override = args.language
+        for target in args.targets:
+            if not os.path.isdir(target):
+                print(f"❌ Directory {target} not found")
+                sys.exit(1)
+            record = index.lookup(target)
+            if 'error' in record and (not override or args.backend != 'docker'):
+                print(f"❌ {target}: {record['error']}")
+                sys.exit(1)
+            record.setdefault('language', override)
+            records.append(record)
+
+    backend = make_backend(args.backend, memory_limit_mb=args.memory_limit, workspace=args.workspace,
+                           perf=args.perf)
+    started = time.perf_counter()
+    try:
+        results = run_many(records, override, args.jobs, args.timeout,
+                           on_result=lambda r: print_result(r, args.verbose), backend=backend)
+    finally:
+        backend.close()
+    wall_time = time.perf_counter() - started
+
+    summary = summarize(results)
+    print(f"\n{summary['passed']}/{summary['total']} passed in {wall_time:.2f}s "
+          f"({summary['duration']:.2f}s of test time)")
+
+    if args.json:
+        write_json_report(results, args.json, wall_time)
+    if args.junit:
+        write_junit_report(results, args.junit, wall_time)
+
+    regressions = []
+    if args.perf:
+        import perf_metrics
+        history_path = args.perf_history or os.path.join(args.workspace, perf_metrics.HISTORY_FILE)
+        regressions = perf_metrics.record_run(perf_metrics.collect_metrics(results, args.workspace), history_path,
+                                              args.perf_threshold)
+        for problem_id, nodeid, metric, before, now in regressions:
+            print(f"🐢 {problem_id}::{nodeid.split('::')[-1]} {metric} regressed: "
+                  f"{perf_metrics.format_value(metric, before)} -> {perf_metrics.format_value(metric, now)} "
+                  f"({now / before:.1f}x)")
+
+    failed = summary['passed'] != summary['total'] or (regressions and args.fail_on_regression)
+    sys.exit(1 if failed else 0)
@@ -0,0 +1,113 @@
+import os
+import sys
+import csv
+import json
+import uuid
+import shutil
+import argparse
+from functools import lru_cache
+
+SEEDS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "seeds")
+
+# Seed file -> file created in the problem directory, per language
+SEED_FILES = {
+    'java': {'Solution.java': 'Solution.java', 'Test.java': 'Test.java', 'prompt_template.md': 'prompt.md'},
+    'javascript': {'solution.mjs': 'solution.mjs', 'test.solution.mjs': 'test.solution.mjs',
+                   'prompt_template.md': 'prompt.md'},
+    'cpp': {'solution.cpp': 'solution.cpp', 'test.cpp': 'test.cpp', 'prompt_template.md': 'prompt.md'},
+    'python': {'solution.py': 'solution.py', 'test_solution.py': 'test_solution.py', 'prompt_template.md': 'prompt.md'},
+}
+
+@lru_cache(maxsize=None)
+def load_seeds(language, seeds_dir=SEEDS_DIR):
+    """(file name, template text) pairs for a language, read from seeds/<language> once per process."""
+    if language not in SEED_FILES:
+        raise ValueError(f"Unsupported language: {language} (expected one of {', '.join(SEED_FILES)})")
+    language_dir = os.path.join(seeds_dir, language)
+    if not os.path.isdir(language_dir):
+        raise ValueError(f"Seeds directory '{language_dir}' not found")
+    templates = []
+    for seed_name, target_name in SEED_FILES[language].items():
+        with open(os.path.join(language_dir, seed_name), 'r', encoding='utf-8') as f:
+            templates.append((target_name, f.read()))
+    return tuple(templates)
+
+def validate_spec(language, entrypoint, seeds_dir=SEEDS_DIR):
+    load_seeds(language, seeds_dir)
+    if not entrypoint.isidentifier():
+        raise ValueError(f"Entrypoint must be a valid identifier, got {entrypoint!r}")
+
+def create_problem(language, entrypoint, root=".", seeds_dir=SEEDS_DIR):
+    """Create <root>/<uuid4>/ from the language's seeds with {entrypoint} filled in.
+
+    The files are written into a hidden temporary directory that is renamed
+    into place at the end, so a problem directory is either complete or absent.
+    """
+    validate_spec(language, entrypoint, seeds_dir)
+    problem_id = str(uuid.uuid4())
+    problem_dir = os.path.join(root, problem_id)
+    if os.path.exists(problem_dir):
+        raise ValueError(f"Directory '{problem_dir}' already exists")
+    tmp_dir = os.path.join(root, f".{problem_id}.tmp")
+    os.makedirs(tmp_dir)
+    try:
+        for name, template in load_seeds(language, seeds_dir):
+            with open(os.path.join(tmp_dir, name), 'w', encoding='utf-8') as f:
+                f.write(template.replace("{entrypoint}", entrypoint))
+        os.rename(tmp_dir, problem_dir)
+    except BaseException:
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+        raise
+    return problem_dir
+
+def read_spec(path):
+    """[(language, entrypoint)] from a CSV with language,entrypoint columns or a JSON list of objects."""
+    with open(path, 'r', encoding='utf-8', newline='') as f:
+        if path.endswith(".json"):
+            rows = json.load(f)
+        else:
+            rows = list(csv.DictReader(f))
+    try:
+        return [(row['language'].strip().lower(), row['entrypoint'].strip()) for row in rows]
+    except (KeyError, TypeError, AttributeError) as e:
+        raise ValueError(f"{path}: every entry needs a language and an entrypoint") from e
+
+def create_many(specs, root=".", seeds_dir=SEEDS_DIR):
+    """Create one problem per (language, entrypoint); every spec is checked before any directory is made."""
+    for row, (language, entrypoint) in enumerate(specs, start=1):
+        try:
+            validate_spec(language, entrypoint, seeds_dir)
+        except ValueError as e:
+            raise ValueError(f"Entry {row}: {e}") from e
+    return [create_problem(language, entrypoint, root, seeds_dir) for language, entrypoint in specs]
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Create problem directories from the seed templates.",
+        usage="python scaffold.py <python|javascript|cpp|java> <entrypoint>\n"
+              "       python scaffold.py --spec problems.csv|problems.json",
+    )
+    parser.add_argument("language", nargs="?")
+    parser.add_argument("entrypoint", nargs="?")
+    parser.add_argument("--spec", help="CSV (language,entrypoint columns) or JSON list of problems to create")
+    parser.add_argument("--root", default=".", help="directory to create the problems in (default: .)")
+    args = parser.parse_args()
+
+    if args.spec and not os.path.exists(args.spec):
+        print(f"❌ Spec file {args.spec} not found")
+        sys.exit(1)
+    if not args.spec and not (args.language and args.entrypoint):
+        parser.print_usage()
+        sys.exit(1)
+
+    try:
+        specs = read_spec(args.spec) if args.spec else [(args.language.lower(), args.entrypoint)]
+        created = create_many(specs, args.root)
+    except ValueError as e:
+        print(f"❌ {e}")
+        sys.exit(1)
+
+    for (language, _), problem_dir in zip(specs, created):
+        print(f"✅ Project directory '{os.path.normpath(problem_dir)}' created ({language}):")
+        for name, _ in load_seeds(language):
+            print(f"  - {name}")
@@ -0,0 +1,300 @@
+import sys
+import json
+import time
+import argparse
+from bisect import bisect_left, bisect_right
+
+import numpy as np
+
+# Python port of the tree problem in dd2.md / ans.cpp: count the pairs
+# (ancestor, descendant) whose values multiply to a perfect square. Two values
+# do exactly when their square-free parts (the product of the primes with an
+# odd exponent) are equal, so each node adds the number of its ancestors in
+# its own square-free class.
+
+def smallest_prime_factors(limit):
+    """spf[x] for every 0 <= x <= limit (spf[0] = 0, spf[1] = 1)."""
+    spf = np.zeros(limit + 1, dtype=np.int32)
+    spf[1:2] = 1
+    for p in range(2, int(limit ** 0.5) + 1):
+        if spf[p] == 0:
+            multiples = spf[p * p::p]
+            multiples[multiples == 0] = p
+    # Whatever is still unmarked has no factor up to sqrt(limit): a prime
+    unmarked = np.flatnonzero(spf == 0)
+    spf[unmarked[unmarked >= 2]] = unmarked[unmarked >= 2]
+    return spf
+
+def square_free_parts(values, spf):
+    """Square-free part of every value, peeling one smallest prime per pass over the array.
+
+    Primes come out in non-decreasing order, so a prime toggles in or out of
+    the running product: it divides the product exactly when it has appeared
+    an odd number of times so far.
+    """
+    remaining = np.array(values, dtype=np.int64)
+    parts = np.ones_like(remaining)
+    active = np.flatnonzero(remaining > 1)
+    while len(active):
+        primes = spf[remaining[active]].astype(np.int64)
+        remaining[active] //= primes
+        current = parts[active]
+        parts[active] = np.where(current % primes == 0, current // primes, current * primes)
+        active = active[remaining[active] > 1]
+    return parts
+
+def square_free_part(value, spf):
+    """Square-free part of one value; spf must reach value."""
+    part = 1
+    while value > 1:
+        p = int(spf[value])
+        value //= p
+        part = part // p if part % p == 0 else part * p
+    return part
+
+def build_csr(n, edges):
+    """Undirected adjacency as CSR (indptr, indices) arrays."""
+    edges = np.asarray(edges, dtype=np.int64).reshape(-1, 2)
+    if len(edges) and (edges.min() < 0 or edges.max() >= n):
+        raise ValueError(f"Edge endpoints must be between 0 and {n - 1}")
+    sources = np.concatenate((edges[:, 0], edges[:, 1]))
+    targets = np.concatenate((edges[:, 1], edges[:, 0]))
+    order = np.argsort(sources, kind='stable')
+    indptr = np.zeros(n + 1, dtype=np.int64)
+    np.cumsum(np.bincount(sources, minlength=n), out=indptr[1:])
+    return indptr, targets[order]
+
+def compress_classes(values, spf=None):
+    """Dense class ids 0..k-1 (one per distinct square-free part) and k."""
+    values = np.asarray(values, dtype=np.int64)
+    if len(values) and values.min() < 1:
+        raise ValueError("Values must be positive integers")
+    if spf is None:
+        spf = smallest_prime_factors(int(values.max()) if len(values) else 1)
+    parts, classes = np.unique(square_free_parts(values, spf), return_inverse=True)
+    return classes.reshape(-1), len(parts)
+
+def count_pairs_csr(indptr, indices, classes, num_classes, root=0):
+    """Ancestor/descendant pairs in the same class, by an explicit-stack DFS from root.
+
+    counts[c] holds how many nodes of class c are on the current root path;
+    a node adds counts[its class] on the way down and removes itself on the
+    way back up (pushed as ~node). Nodes not reachable from root are ignored,
+    as in ans.cpp.
+    """
+    indptr, indices, classes = indptr.tolist(), indices.tolist(), classes.tolist()
+    counts = [0] * num_classes
+    seen = bytearray(len(classes))
+    seen[root] = 1
+    stack = [root]
+    total = 0
+    while stack:
+        node = stack.pop()
+        if node < 0:
+            counts[classes[~node]] -= 1
+            continue
+        c = classes[node]
+        total += counts[c]
+        counts[c] += 1
+        stack.append(~node)
+        for child in indices[indptr[node]:indptr[node + 1]]:
+            if not seen[child]:
+                seen[child] = 1
+                stack.append(child)
+    return total
+
+def euler_tour(indptr, indices, n, root=0):
+    """Entry time of every node and the last entry time inside its subtree (tin, tout).
+
+    Node u is an ancestor of v (or v itself) exactly when
+    tin[u] <= tin[v] <= tout[u]. Nodes not reachable from root get -1.
+    """
+    indptr, indices = indptr.tolist(), indices.tolist()
+    tin, tout = [-1] * n, [-1] * n
+    seen = bytearray(n)
+    seen[root] = 1
+    stack = [root]
+    timer = 0
+    while stack:
+        node = stack.pop()
+        if node < 0:
+            tout[~node] = timer - 1
+            continue
+        tin[node] = timer
+        timer += 1
+        stack.append(~node)
+        for child in indices[indptr[node]:indptr[node + 1]]:
+            if not seen[child]:
+                seen[child] = 1
+                stack.append(child)
+    return tin, tout
+
+def _fenwick_add(tree, index, delta, size):
+    while index <= size:
+        tree[index] = tree.get(index, 0) + delta
+        index += index & -index
+
+def _fenwick_prefix(tree, index):
+    total = 0
+    while index > 0:
+        total += tree.get(index, 0)
+        index &= index - 1
+    return total
+
+class DynamicSquareFreePairs:
+    """The ans.cpp pair count, kept up to date while node values change.
+
+    Over the Euler tour, the class-c ancestors of v (v included) are the
+    class-c nodes with tin <= tin[v] minus those with tout < tin[v], and its
+    class-c descendants are the class-c tins inside [tin[v], tout[v]]. Each
+    count is a bisect into the sorted (class, tin) / (class, tout) keys of the
+    initial values plus a prefix sum over that class's Fenwick tree of later
+    changes, kept as dicts so only touched positions take memory. update()
+    and total_pairs() are O(log n); the sieve grows when a value outgrows it.
+    """
+
+    def __init__(self, n, val, edges, root=0):
+        values = np.asarray(val[:n], dtype=np.int64)
+        if n and values.min() < 1:
+            raise ValueError("Values must be positive integers")
+        self.n = n
+        self.values = values.tolist()
+        self.spf = smallest_prime_factors(int(values.max()) if n else 1)
+        parts, classes = np.unique(square_free_parts(values, self.spf), return_inverse=True)
+        self.class_of_part = {part: i for i, part in enumerate(parts.tolist())}
+        self.classes = classes.reshape(-1).tolist()
+        self.tin, self.tout = euler_tour(*build_csr(n, edges), n, root) if n else ([], [])
+
+        # Static keys class * stride + time; counts from other classes cancel
+        # out in every difference taken below
+        self.stride = n + 1
+        reachable = np.flatnonzero(np.array(self.tin) >= 0)
+        class_base = classes.reshape(-1)[reachable].astype(np.int64) * self.stride
+        start_keys = np.sort(class_base + np.array(self.tin)[reachable])
+        end_keys = np.sort(class_base + np.array(self.tout)[reachable])
+        self._start_keys, self._end_keys = start_keys.tolist(), end_keys.tolist()
+        self._start_changes, self._end_changes = {}, {}
+
+        tin_keys = class_base + np.array(self.tin)[reachable]
+        ancestors = np.searchsorted(start_keys, tin_keys, side='right') - np.searchsorted(end_keys, tin_keys)
+        self.total = int((ancestors - 1).sum())
+
+    def _starts_upto(self, c, moment):
+        return bisect_right(self._start_keys, c * self.stride + moment) \
+            + _fenwick_prefix(self._start_changes.get(c, {}), moment + 1)
+
+    def _ends_before(self, c, moment):
+        return bisect_left(self._end_keys, c * self.stride + moment) \
+            + _fenwick_prefix(self._end_changes.get(c, {}), moment)
+
+    def _pairs_with(self, c, node):
+        # Class-c ancestors plus class-c descendants; both include node itself
+        tin, tout = self.tin[node], self.tout[node]
+        ancestors = self._starts_upto(c, tin) - self._ends_before(c, tin)
+        descendants = self._starts_upto(c, tout) - self._starts_upto(c, tin - 1)
+        return ancestors + descendants - 2
+
+    def _move(self, c, node, delta):
+        _fenwick_add(self._start_changes.setdefault(c, {}), self.tin[node] + 1, delta, self.n)
+        _fenwick_add(self._end_changes.setdefault(c, {}), self.tout[node] + 1, delta, self.n)
+
+    def _class_for(self, value):
+        if value >= len(self.spf):
+            self.spf = smallest_prime_factors(max(value, 2 * (len(self.spf) - 1)))
+        part = square_free_part(value, self.spf)
+        return self.class_of_part.setdefault(part, len(self.class_of_part))
+
+    def update(self, node, value):
+        """Set node's value; returns the new total."""
+        if value < 1:
+            raise ValueError(f"Values must be positive integers, got {value}")
+        new, old = self._class_for(value), self.classes[node]
+        self.values[node] = value
+        if new != old and self.tin[node] >= 0:
+            self.total -= self._pairs_with(old, node)
+            self._move(old, node, -1)
+            self._move(new, node, 1)
+            self.total += self._pairs_with(new, node)
+        self.classes[node] = new
+        return self.total
+
+    def total_pairs(self):
+        return self.total
+
+def solve(n, val, edges):
+    """Same answer as solve() in ans.cpp, for a tree rooted at node 0."""
+    if n == 0:
+        return 0
+    classes, num_classes = compress_classes(val[:n])
+    indptr, indices = build_csr(n, edges)
+    return count_pairs_csr(indptr, indices, classes, num_classes)
+
+def random_tree(n, max_value, seed=0):
+    """Random rooted tree (each node's parent has a smaller index) with values in 1..max_value."""
+    rng = np.random.default_rng(seed)
+    children = np.arange(1, n)
+    parents = (rng.random(n - 1) * children).astype(np.int64)
+    return rng.integers(1, max_value + 1, n), np.column_stack((parents, children))
+
+def benchmark_updates(val, edges, updates, max_value, seed=0, recomputes=3):
+    """Time a random update stream on DynamicSquareFreePairs against full recomputation.
+
+    Full recomputation runs `recomputes` times, spread over the stream, and
+    each of those totals is checked against the incremental one.
+    """
+    rng = np.random.default_rng(seed)
+    n = len(val)
+    nodes = rng.integers(0, n, updates).tolist()
+    new_values = rng.integers(1, max_value + 1, updates).tolist()
+    checkpoints = set(np.linspace(0, updates - 1, recomputes, dtype=np.int64).tolist()) if updates else set()
+
+    started = time.perf_counter()
+    counter = DynamicSquareFreePairs(n, val, edges)
+    build_seconds = time.perf_counter() - started
+    update_seconds = recompute_seconds = 0.0
+    for step, (node, value) in enumerate(zip(nodes, new_values)):
+        started = time.perf_counter()
+        total = counter.update(node, value)
+        update_seconds += time.perf_counter() - started
+        if step in checkpoints:
+            started = time.perf_counter()
+            expected = solve(n, counter.values, edges)
+            recompute_seconds += time.perf_counter() - started
+            if expected != total:
+                raise AssertionError(f"Update {step}: incremental total {total}, recomputed {expected}")
+    return {'nodes': n, 'updates': updates, 'build_seconds': build_seconds,
+            'update_seconds': update_seconds, 'recompute_seconds': recompute_seconds / max(len(checkpoints), 1)}
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Count ancestor/descendant pairs whose values multiply to a square.")
+    parser.add_argument("input", nargs="?", help='JSON file with "val" and "edges" (node 0 is the root)')
+    parser.add_argument("--random", type=int, metavar="N", help="time a random tree of N nodes instead")
+    parser.add_argument("--max-value", type=int, default=10 ** 6)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--updates", type=int, metavar="U",
+                        help="benchmark U random value updates against full recomputation")
+    args = parser.parse_args()
+
+    if args.random:
+        val, edges = random_tree(args.random, args.max_value, args.seed)
+    elif args.input:
+        with open(args.input, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        val, edges = data["val"], data["edges"]
+    else:
+        parser.error("give an input file or --random N")
+
+    if args.updates is not None:
+        report = benchmark_updates(val, edges, args.updates, args.max_value, args.seed)
+        per_update = report['update_seconds'] / max(report['updates'], 1)
+        print(f"🌳 {report['nodes']} nodes, built in {report['build_seconds']:.2f}s")
+        print(f"⚡ incremental: {per_update * 1e6:.1f} µs/update over {report['updates']} updates")
+        print(f"🐢 full recomputation: {report['recompute_seconds']:.2f} s/update")
+        if per_update:
+            print(f"✅ totals match; {report['recompute_seconds'] / per_update:,.0f}x faster per update")
+        sys.exit(0)
+
+    started = time.perf_counter()
+    total = solve(len(val), val, edges)
+    print(total)
+    print(f"⏱️ {len(val)} nodes in {time.perf_counter() - started:.2f}s", file=sys.stderr)
@@ -0,0 +1,332 @@
+import ast
+import os
+import re
+import sys
+import json
+import time
+import random
+import string
+import argparse
+import contextlib
+import importlib.util
+
+from workspace_index import scan_problem_dir
+
+STRESS_SPEC_FILE = "stress.json"
+DEFAULT_MAX_SIZE = 1 << 12
+DEFAULT_CASES = 5
+
+TYPE_ALIASES = {'List': 'list', 'Dict': 'dict', 'Tuple': 'tuple', 'Set': 'set', 'Sequence': 'list',
+                'Mapping': 'dict', 'Optional': 'optional'}
+
+LENGTH_WORDS = ('site', 'length', 'size', 'element', 'entries', 'item', 'total', 'count of')
+SECTION_HEADERS = ('Returns', 'Raises', 'Examples', 'Example', 'Yields', 'Note')
+
+NUMBER = r"-?\d+(?:\.\d+)?(?:e\d+)?"
+RANGE_PATTERNS = [
+    rf"\[\s*({NUMBER})\s*,\s*({NUMBER})\s*\]",
+    rf"between\s+({NUMBER})\s+and\s+({NUMBER})",
+    rf"({NUMBER})\s*(?:≤|<=)\s*\w*\s*(?:≤|<=)\s*({NUMBER})",
+    rf"\(\s*({NUMBER})\s*-\s*({NUMBER})\s*\)",
+    r"(\d+)\s*-\s*(\d+)",
+]
+
+def _number(text):
+    value = float(text)
+    return int(value) if value.is_integer() else value
+
+def parse_type(node):
+    """Turn an annotation AST (or type string) into a nested tuple such as ('list', ('int',))."""
+    if node is None:
+        return ('any',)
+    if isinstance(node, str):
+        try:
+            node = ast.parse(node.strip(), mode='eval').body
+        except SyntaxError:
+            return ('any',)
+    if isinstance(node, ast.Constant) and isinstance(node.value, str):
+        return parse_type(node.value)
+    if isinstance(node, ast.Name):
+        name = TYPE_ALIASES.get(node.id, node.id)
+        return (name,) if name in ('int', 'float', 'str', 'bool', 'list', 'dict', 'tuple', 'set') else ('any',)
+    if isinstance(node, ast.Attribute):
+        return parse_type(ast.Name(id=node.attr))
+    if isinstance(node, ast.Subscript):
+        base = parse_type(node.value)[0]
+        args = node.slice.elts if isinstance(node.slice, ast.Tuple) else [node.slice]
+        if base == 'optional':
+            return parse_type(args[0])
+        return (base,) + tuple(parse_type(arg) for arg in args)
+    return ('any',)
+
+def _entrypoint_node(source, entrypoint):
+    try:
+        tree = ast.parse(source)
+    except SyntaxError:
+        return None
+    for node in ast.walk(tree):
+        if isinstance(node, ast.FunctionDef) and node.name == entrypoint:
+            return node
+    return None
+
+def _prompt_source(prompt):
+    # The prompt is a fenced python code block holding the signature and docstring
+    match = re.search(r"```(?:py|python)\s*\n(.*?)```", prompt, re.DOTALL)
+    return match.group(1) if match else prompt
+
+def parse_docstring_args(docstring):
+    """Return {name: (type string or None, description)} from a Google-style Args section."""
+    args = {}
+    current = None
+    in_args = False
+    for line in (docstring or "").splitlines():
+        stripped = line.strip()
+        if stripped in ('Args:', 'Arguments:', 'Parameters:'):
+            in_args = True
+            continue
+        if not in_args:
+            continue
+        if any(stripped.startswith(f"{header}:") for header in SECTION_HEADERS):
+            break
+        match = re.match(r"^(\w+)\s*(?:\((.*)\))?\s*:\s*(.*)$", stripped)
+        if match and (current is None or len(line) - len(line.lstrip()) <= current[1]):
+            current = (match.group(1), len(line) - len(line.lstrip()))
+            args[current[0]] = [match.group(2), match.group(3)]
+        elif current and stripped:
+            args[current[0]][1] += " " + stripped
+    return {name: (type_text, description) for name, (type_text, description) in args.items()}
+
+def parse_constraints(description, param_type):
+    """Extract value range, length range, parity and length ties from prose."""
+    constraints = {}
+    collection = param_type[0] in ('list', 'tuple', 'set', 'dict', 'str')
+    for sentence in re.split(r"(?<=\.)\s+|;\s*", description):
+        lowered = sentence.lower()
+        tie = re.search(r"(?:match(?:es)?\s+(?:the\s+)?length\s+of|same\s+length\s+as)\s+`?(\w+)", lowered)
+        if tie:
+            constraints['same_length_as'] = tie.group(1)
+            continue
+        is_length = collection and any(word in lowered for word in LENGTH_WORDS)
+        if is_length and re.search(r"\beven\b", lowered):
+            constraints['even'] = True
+        for pattern in RANGE_PATTERNS:
+            found = re.search(pattern, sentence)
+            if found:
+                low, high = _number(found.group(1)), _number(found.group(2))
+                constraints['length' if is_length else 'range'] = [min(low, high), max(low, high)]
+                break
+    return constraints
+
+def load_signature(record):
+    """Return (entrypoint, [(name, type, constraints)], names of parameters with defaults)."""
+    entrypoint = record.get('entrypoint')
+    with open(record['solution'], 'r', encoding='utf-8') as f:
+        solution_node = _entrypoint_node(f.read(), entrypoint)
+    with open(record['prompt'], 'r', encoding='utf-8') as f:
+        prompt_node = _entrypoint_node(_prompt_source(f.read()), entrypoint)
+    if solution_node is None and prompt_node is None:
+        raise ValueError(f"Cannot find the signature of {entrypoint} in solution.py or prompt.md")
+
+    documented = parse_docstring_args(ast.get_docstring(prompt_node) if prompt_node else None)
+    if solution_node is not None and not documented:
+        documented = parse_docstring_args(ast.get_docstring(solution_node))
+
+    node = solution_node or prompt_node
+    prompt_args = {arg.arg: arg for arg in prompt_node.args.args} if prompt_node else {}
+    positional = node.args.args
+    defaulted = {arg.arg for arg in positional[len(positional) - len(node.args.defaults):]} if node.args.defaults else set()
+    params = []
+    for arg in positional:
+        annotation = arg.annotation or getattr(prompt_args.get(arg.arg), 'annotation', None)
+        type_text, description = documented.get(arg.arg, (None, ""))
+        param_type = parse_type(annotation) if annotation is not None else parse_type(type_text)
+        params.append((arg.arg, param_type, parse_constraints(description, param_type)))
+    return entrypoint, params, defaulted
+
+def load_spec_overrides(record, params, defaulted=()):
+    # stress.json can pin or correct constraints the prose parser gets wrong.
+    # Parameters with defaults (modes, flags) are left to their defaults
+    # unless stress.json names them
+    spec_path = os.path.join(record['path'], STRESS_SPEC_FILE)
+    overrides = {}
+    if os.path.exists(spec_path):
+        with open(spec_path, 'r', encoding='utf-8') as f:
+            overrides = json.load(f).get('params', {})
+    merged = []
+    for name, param_type, constraints in params:
+        if name in defaulted and name not in overrides:
+            continue
+        override = dict(overrides.get(name, {}))
+        if 'type' in override:
+            param_type = parse_type(override.pop('type'))
+        merged.append((name, param_type, {**constraints, **override}))
+    return merged
+
+class InputGenerator:
+    """Seeded random arguments for an entry point, scaled by a size parameter.
+
+    size is the length of collections and strings (clamped to any declared
+    length range). Scalars are drawn from their declared range, or from
+    [0, size] when none is declared.
+    """
+
+    def __init__(self, params, seed=0):
+        self.params = params
+        self.seed = seed
+
+    def rng(self, size, case):
+        return random.Random(f"{self.seed}:{size}:{case}")
+
+    def length_for(self, constraints, size):
+        low, high = constraints.get('length', [0, None])
+        length = max(low, size if high is None else min(size, high))
+        if constraints.get('even') and length % 2:
+            length = length + 1 if high is None or length + 1 <= high else length - 1
+        return length
+
+    def effective_size(self, size):
+        lengths = [self.length_for(c, size) for _, t, c in self.params
+                   if t[0] in ('list', 'tuple', 'set', 'dict', 'str') and 'same_length_as' not in c]
+        return max(lengths) if lengths else size
+
+    def value(self, param_type, constraints, size, rng, length=None):
+        kind = param_type[0]
+        low, high = constraints.get('range', [None, None])
+        if kind == 'bool':
+            return rng.random() < 0.5
+        if kind == 'int':
+            return rng.randint(int(low if low is not None else 0), int(high if high is not None else max(size, 1)))
+        if kind == 'float':
+            return rng.uniform(low if low is not None else 0.0, high if high is not None else float(max(size, 1)))
+        if kind == 'str':
+            n = length if length is not None else self.length_for(constraints, size)
+            return ''.join(rng.choice(string.ascii_letters) for _ in range(n))
+        if kind in ('list', 'tuple', 'set'):
+            n = length if length is not None else self.length_for(constraints, size)
+            element_type = param_type[1] if len(param_type) > 1 else ('int',)
+            element_constraints = {'range': constraints['range']} if 'range' in constraints else {}
+            items = [self.value(element_type, element_constraints, size, rng, 8) for _ in range(n)]
+            return tuple(items) if kind == 'tuple' else set(items) if kind == 'set' else items
+        if kind == 'dict':
+            n = length if length is not None else self.length_for(constraints, size)
+            value_type = param_type[2] if len(param_type) > 2 else ('str',)
+            # Keys come from a pool of 2n names so separate dict arguments overlap
+            keys = rng.sample(range(2 * max(n, 1)), n)
+            return {f"key_{k}": self.value(value_type, {}, size, rng, rng.randint(1, 12)) for k in keys}
+        return rng.randint(0, max(size, 1))
+
+    def generate(self, size, case):
+        rng = self.rng(size, case)
+        kwargs = {}
+        ordered = sorted(self.params, key=lambda p: 'same_length_as' in p[2])
+        for name, param_type, constraints in ordered:
+            tied = constraints.get('same_length_as')
+            length = len(kwargs[tied]) if tied in kwargs else None
+            kwargs[name] = self.value(param_type, constraints, size, rng, length)
+        return {name: kwargs[name] for name, _, _ in self.params}
+
+    def size_ladder(self, max_size=DEFAULT_MAX_SIZE, start=1, factor=2):
+        """Geometric sizes up to max_size, stopping once the inputs stop growing."""
+        sizes = []
+        size = start
+        last_effective = None
+        while size <= max_size:
+            effective = self.effective_size(size)
+            if effective != last_effective:
+                sizes.append(size)
+                last_effective = effective
+            elif sizes and effective == self.effective_size(max_size):
+                break
+            size *= factor
+        return sizes
+
+@contextlib.contextmanager
+def problem_on_path(record):
+    """Put the problem directory on sys.path for the duration of the block.
+
+    Solutions may import sibling modules lazily, inside the entry point, so
+    the directory has to stay on the path for as long as the function runs,
+    not only while it is imported.
+    """
+    path = os.path.abspath(record['path'])
+    sys.path.insert(0, path)
+    try:
+        yield
+    finally:
+        sys.path.remove(path)
+
+def load_entrypoint(record, entrypoint):
+    # A unique module name keeps several problems' solution.py apart in one process
+    module_name = f"_stress_solution_{record['id'].replace('-', '_')}"
+    with problem_on_path(record):
+        spec = importlib.util.spec_from_file_location(module_name, record['solution'])
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+    return getattr(module, entrypoint)
+
+def prepare(problem_dir, seed=0):
+    record = scan_problem_dir(problem_dir)
+    if 'error' in record:
+        raise ValueError(f"{problem_dir}: {record['error']}")
+    if record['language'] != 'python':
+        raise ValueError(f"{problem_dir}: only Python problems can be stress tested")
+    entrypoint, params, defaulted = load_signature(record)
+    params = load_spec_overrides(record, params, defaulted)
+    return record, load_entrypoint(record, entrypoint), InputGenerator(params, seed)
+
+def stress(function, generator, sizes, cases=DEFAULT_CASES, on_size=None):
+    """Run cases inputs per size; returns one report dict per size."""
+    reports = []
+    for size in sizes:
+        report = {'size': size, 'effective_size': generator.effective_size(size), 'cases': cases,
+                  'ok': 0, 'failures': [], 'seconds': 0.0}
+        for case in range(cases):
+            kwargs = generator.generate(size, case)
+            started = time.perf_counter()
+            try:
+                function(**kwargs)
+                report['ok'] += 1
+            except Exception as e:
+                report['failures'].append({'case': case, 'error': f"{type(e).__name__}: {e}"})
+            report['seconds'] += time.perf_counter() - started
+        report['throughput'] = cases / report['seconds'] if report['seconds'] else float('inf')
+        reports.append(report)
+        if on_size:
+            on_size(report)
+    return reports
+
+def print_size_report(report, problem_dir, seed):
+    print(f"n={report['effective_size']:<8} {report['ok']}/{report['cases']} ok  "
+          f"{report['throughput']:>12.1f} calls/s  {report['seconds'] / report['cases'] * 1000:>10.3f} ms/call",
+          flush=True)
+    for failure in report['failures']:
+        print(f"   ❌ case {failure['case']}: {failure['error']}\n"
+              f"      replay: python stress.py {problem_dir} --seed {seed} --replay {report['size']}:{failure['case']}")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Stress a Python solution with seeded random inputs of growing size.")
+    parser.add_argument("problem_dir")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--max-size", type=int, default=DEFAULT_MAX_SIZE)
+    parser.add_argument("--cases", type=int, default=DEFAULT_CASES, help="inputs per size")
+    parser.add_argument("--replay", metavar="SIZE:CASE", help="print and re-run one generated input")
+    parser.add_argument("--show-signature", action="store_true", help="print the parsed parameters and constraints")
+    args = parser.parse_args()
+
+    record, function, generator = prepare(args.problem_dir, args.seed)
+
+    if args.show_signature:
+        for name, param_type, constraints in generator.params:
+            print(f"{name}: {param_type} {constraints}")
+
+    with problem_on_path(record):
+        if args.replay:
+            size, case = (int(part) for part in args.replay.split(":"))
+            kwargs = generator.generate(size, case)
+            print(f"{function.__name__}(**{kwargs!r})")
+            print(repr(function(**kwargs)))
+            sys.exit(0)
+
+        reports = stress(function, generator, generator.size_ladder(args.max_size), args.cases,
+                         on_size=lambda r: print_size_report(r, args.problem_dir, args.seed))
+    sys.exit(1 if any(r['failures'] for r in reports) else 0)
@@ -1,7 +1,7 @@
 #!/bin/bash
 
-if [ "$#" -ne 2 ]; then
-    echo "Usage: $0 <directory_id> <language>"
+if [ "$#" -lt 1 ] || [ "$#" -gt 2 ]; then
+    echo "Usage: $0 <directory_id> [language]"
     exit 1
 fi
 
@@ -15,32 +15,16 @@ if [ ! -d "$ID" ]; then
 fi
 
 case "$LANG" in
-    java)
-        echo "Running Java tests..."
-        docker run --rm \
-            -v "$(pwd)/$ID:/app" \
-            coding-workspace-java
+    java|python|javascript|cpp)
+        echo "Running $LANG tests..."
+        exec python run_tests.py --verbose --language "$LANG" "$ID"
         ;;
-    python)
-        echo "Running Python tests..."
-        docker run --rm \
-            -v "$(pwd)/$ID:/app" \
-            coding-workspace-python
-        ;;
-    javascript)
-        echo "Running JavaScript tests..."
-        docker run --rm \
-            -v "$(pwd)/$ID:/app" \
-            coding-workspace-javascript
-        ;;
-    cpp)
-        echo "Running C++ tests..."
-        docker run --rm \
-            -v "$(pwd)/$ID:/app" \
-            coding-workspace-cpp
+    "")
+        # The language is looked up in the workspace index
+        exec python run_tests.py --verbose "$ID"
         ;;
     *)
         echo "Unsupported language: $LANG. Currently supporting: java, python, javascript, cpp"
         exit 1
         ;;
-esac 
\ No newline at end of file
+esac
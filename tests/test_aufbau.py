@@ -0,0 +1,25 @@
+import os
+import sys
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                                "54dd9478-d7b5-4698-a302-fcef182d3961"))
+
+from aufbau import blocks
+
+@pytest.mark.parametrize("atomic_numbers", [[], np.array([], dtype=np.int64), np.empty((0, 3))])
+def test_blocks_of_an_empty_batch(atomic_numbers):
+    result = blocks(atomic_numbers)
+    assert result.dtype == np.dtype('<U1')
+    assert result.shape == np.shape(atomic_numbers)
+
+def test_blocks_of_a_batch():
+    assert blocks([[1, 2, 5], [21, 57, 118]]).tolist() == [['s', 's', 'p'], ['d', 'f', 'p']]
+
+def test_blocks_rejects_bad_input():
+    with pytest.raises(TypeError):
+        blocks([1.0, 2.0])
+    with pytest.raises(ValueError):
+        blocks([1, 0, 119])
@@ -0,0 +1,48 @@
+import math
+import argparse
+
+import pytest
+
+from complexity import LEVEL_LIMITS, MIN_POINTS, exceeds, fit_growth, parse_growth
+
+def test_max_growth_accepts_unicode_and_ascii_spellings():
+    assert parse_growth("O(n²)") == parse_growth("O(n^2)") == "O(n²)"
+    assert parse_growth(" O(n  log n) ") == "O(n log n)"
+    with pytest.raises(argparse.ArgumentTypeError):
+        parse_growth("O(n!)")
+
+def test_limits():
+    assert exceeds("O(n²)", LEVEL_LIMITS[2])
+    assert not exceeds("O(n log n)", LEVEL_LIMITS[2])
+    assert not exceeds("O(n²)", parse_growth("O(n^3)"))
+
+SIZES = [2 ** k for k in range(2, 14)]
+
+def timings(growth, wobble=0.0):
+    # Deterministic ±wobble relative noise on top of a fixed overhead
+    return [(n, (1e-6 + growth(n)) * (1 + wobble * (-1) ** i)) for i, n in enumerate(SIZES)]
+
+@pytest.mark.parametrize("expected, growth", [
+    ("O(1)", lambda n: 1e-6),
+    ("O(n)", lambda n: 2e-8 * n),
+    ("O(n log n)", lambda n: 2e-9 * n * math.log2(n)),
+    ("O(n²)", lambda n: 1e-10 * n * n),
+])
+@pytest.mark.parametrize("wobble", [0.0, 0.02])
+def test_fit_growth_recognises_synthetic_timings(expected, growth, wobble):
+    best, confidence, fits = fit_growth(timings(growth, wobble))
+    assert best == expected
+    assert confidence > 0.8
+    assert dict(fits)[expected] == min(error for _, error in fits)
+
+def test_constant_timings_are_confidently_constant():
+    # Every class can fit a flat line, which used to tie them at 0% confidence
+    best, confidence, _ = fit_growth([(n, 3e-6) for n in SIZES])
+    assert (best, confidence) == ("O(1)", 1.0)
+
+def test_few_points_lower_the_confidence():
+    points = timings(lambda n: 2e-8 * n)
+    _, full, _ = fit_growth(points[-MIN_POINTS:])
+    best, few, _ = fit_growth(points[-2:])
+    assert best == "O(n)"
+    assert few <= full * 2 / MIN_POINTS
@@ -0,0 +1,121 @@
+import os
+import sys
+import json
+import shutil
+
+import pytest
+
+from execution_backends import ForkServerBackend, LocalBackend, WarmDockerBackend
+from workspace_index import scan_problem_dir
+
+EXAMPLE_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "examples", "python")
+
+LIMITS_TEST = """import resource
+
+def test_limits():
+    assert resource.getrlimit(resource.RLIMIT_AS) == (256 * 1024 * 1024, 256 * 1024 * 1024)
+    assert resource.getrlimit(resource.RLIMIT_CPU) == (31, 32)
+
+def test_runaway_allocation():
+    try:
+        bytearray(1024 * 1024 * 1024)
+    except MemoryError:
+        return
+    raise AssertionError("allocated 1 GiB under a 256 MiB limit")
+"""
+
+@pytest.mark.skipif(not hasattr(os, 'fork'), reason="the fork backend needs os.fork")
+def test_fork_children_run_under_the_resource_limits(tmp_path):
+    for name, text in (("prompt.md", "# Limits\n"), ("solution.py", "def limits():\n    pass\n"),
+                       ("test_solution.py", LIMITS_TEST)):
+        (tmp_path / name).write_text(text, encoding='utf-8')
+    backend = ForkServerBackend(memory_limit_mb=256)
+    try:
+        result = backend.run(scan_problem_dir(str(tmp_path)), timeout=30)
+    finally:
+        backend.close()
+    assert result['status'] == 'passed', result['output']
+    assert [test['outcome'] for test in result['tests']] == ['passed', 'passed']
+
+FAKE_DOCKER = """#!{python}
+# Stand-in for the docker CLI: the warm container is this machine, with
+# /workspace mapped to $FAKE_WORKSPACE
+import os, sys, json, subprocess
+
+args = sys.argv[1:]
+with open(os.environ['FAKE_DOCKER_LOG'], 'a') as log:
+    log.write(json.dumps(args) + "\\n")
+if args[:2] == ['image', 'inspect']:
+    print(json.dumps({{'Entrypoint': None, 'Cmd': [sys.executable, '-m', 'pytest', '-q', '-p', 'no:cacheprovider'],
+                      'WorkingDir': '/app'}}))
+elif args[0] == 'run':
+    print('warm-container')
+elif args[0] == 'exec':
+    command = [arg.replace('/workspace', os.environ['FAKE_WORKSPACE'], 1) if arg.startswith('/workspace') else arg
+               for arg in args[2:]]
+    sys.exit(subprocess.call(command))
+"""
+
+def copy_example(workspace, name):
+    shutil.copytree(EXAMPLE_DIR, workspace / name, ignore=shutil.ignore_patterns('__pycache__', '.pytest_cache'))
+    return scan_problem_dir(str(workspace / name))
+
+def listing(path):
+    return sorted(os.path.relpath(os.path.join(root, name), path)
+                  for root, dirs, files in os.walk(path) for name in dirs + files)
+
+def test_local_backend_runs_a_private_copy(tmp_path):
+    record = copy_example(tmp_path, "problem")
+    before = listing(record['path'])
+    result = LocalBackend().run(record, timeout=120)
+    assert result['status'] == 'passed', result['output']
+    assert listing(record['path']) == before
+
+def test_local_backend_reports_failures_and_timeouts(tmp_path):
+    record = copy_example(tmp_path, "problem")
+    with open(record['test'], 'a', encoding='utf-8') as f:
+        f.write("\ndef test_broken():\n    assert False\n")
+    assert LocalBackend().run(record, timeout=120)['status'] == 'failed'
+
+    with open(record['test'], 'a', encoding='utf-8') as f:
+        f.write("\ndef test_slow():\n    import time\n    time.sleep(30)\n")
+    result = LocalBackend().run(record, timeout=2)
+    assert result['status'] == 'timeout'
+    assert result['duration'] < 20
+
+@pytest.fixture
+def fake_docker(tmp_path, monkeypatch):
+    bin_dir = tmp_path / "bin"
+    bin_dir.mkdir()
+    docker = bin_dir / "docker"
+    docker.write_text(FAKE_DOCKER.format(python=sys.executable), encoding='utf-8')
+    docker.chmod(0o755)
+    log = tmp_path / "docker.log"
+    log.touch()
+    monkeypatch.setenv("PATH", f"{bin_dir}{os.pathsep}{os.environ['PATH']}")
+    monkeypatch.setenv("FAKE_DOCKER_LOG", str(log))
+    return log
+
+def test_warm_backend_runs_the_image_command_on_a_container_copy(tmp_path, fake_docker, monkeypatch):
+    workspace = tmp_path / "workspace"
+    workspace.mkdir()
+    monkeypatch.setenv("FAKE_WORKSPACE", str(workspace))
+    records = [copy_example(workspace, name) for name in ("problem-a", "problem-b")]
+    before = [listing(record['path']) for record in records]
+
+    backend = WarmDockerBackend(str(workspace))
+    try:
+        results = [backend.run(record, timeout=120) for record in records]
+    finally:
+        backend.close()
+    assert [result['status'] for result in results] == ['passed', 'passed'], results[0]['output']
+    # The problem directories were only read
+    assert [listing(record['path']) for record in records] == before
+
+    with open(fake_docker, encoding='utf-8') as f:
+        calls = [json.loads(line) for line in f]
+    assert [call[0] for call in calls] == ['image', 'run', 'exec', 'exec', 'rm']
+    assert f"{workspace}:/workspace:ro" in calls[1]
+    # The image's own command, not a guessed one
+    assert calls[2][1:3] == ['warm-container', 'sh']
+    assert calls[2][6:] == ["/workspace/problem-a", sys.executable, '-m', 'pytest', '-q', '-p', 'no:cacheprovider']
@@ -0,0 +1,67 @@
+import os
+import sys
+import random
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                                "c155a9c4-d930-4957-a556-2df241179354"))
+
+from fault_scan import find_faulty_servers, find_faulty_servers_in_file, parse_status_lines
+
+def random_codes(seed, count):
+    rng = random.Random(seed)
+    edges = [0, 200, 404, 499, 500, 501, 550, 598, 599, 600, 65535]
+    return [rng.choice(edges) if rng.random() < 0.5 else rng.randint(0, 999) for _ in range(count)]
+
+def write_text(path, codes, newline="\n", final_newline=True, padded=False):
+    lines = [f" {code}\t" if padded and i % 3 == 0 else str(code) for i, code in enumerate(codes)]
+    text = newline.join(lines) + (newline if final_newline else "")
+    with open(path, 'wb') as f:
+        f.write(text.encode())
+    return str(path)
+
+CHUNKS_AND_WORKERS = [(1, 1), (5, 1), (64, 2), (4096, 1), (4096, 3), (1 << 24, 2)]
+
+@pytest.mark.parametrize("chunk_bytes, workers", CHUNKS_AND_WORKERS)
+def test_binary_matches_the_reference(tmp_path, chunk_bytes, workers):
+    codes = random_codes(chunk_bytes, 300 if chunk_bytes < 64 else 5000)
+    path = str(tmp_path / "status.bin")
+    np.array(codes, dtype='<u2').tofile(path)
+    assert find_faulty_servers_in_file(path, chunk_bytes=chunk_bytes, workers=workers) == find_faulty_servers(codes)
+
+@pytest.mark.parametrize("chunk_bytes, workers", CHUNKS_AND_WORKERS)
+@pytest.mark.parametrize("newline, final_newline, padded", [
+    ("\n", True, False),
+    ("\n", False, True),
+    ("\r\n", True, True),
+    ("\r\n", False, False),
+])
+def test_text_matches_the_reference(tmp_path, chunk_bytes, workers, newline, final_newline, padded):
+    codes = random_codes(chunk_bytes, 300 if chunk_bytes < 64 else 5000)
+    path = write_text(tmp_path / "status.txt", codes, newline, final_newline, padded)
+    assert find_faulty_servers_in_file(path, chunk_bytes=chunk_bytes, workers=workers) == find_faulty_servers(codes)
+
+def test_empty_files(tmp_path):
+    for name in ("status.bin", "status.txt"):
+        (tmp_path / name).write_bytes(b"")
+        assert find_faulty_servers_in_file(str(tmp_path / name)) == []
+
+@pytest.mark.parametrize("line", [b"", b"  ", b"\r", b"-500", b"+500", b"5 00", b"50O", b"500 # down"])
+def test_malformed_lines_are_rejected(line):
+    with pytest.raises(ValueError, match="lines 2$"):
+        parse_status_lines(np.frombuffer(b"200\n" + line + b"\n503\n", dtype=np.uint8))
+
+def test_padding_and_leading_zeros_are_accepted():
+    data = np.frombuffer(b"500\r\n 501 \n\t0599\n42", dtype=np.uint8)
+    assert parse_status_lines(data).tolist() == [500, 501, 599, 42]
+
+@pytest.mark.parametrize("chunk_bytes, workers", [(7, 1), (64, 2), (1 << 24, 1)])
+def test_file_errors_use_file_wide_line_numbers(tmp_path, chunk_bytes, workers):
+    codes = random_codes(1, 200)
+    path = tmp_path / "status.txt"
+    path.write_bytes(("\n".join(map(str, codes[:150])) + "\n-500\n\n" + "\n".join(map(str, codes[150:])) + "\n").encode())
+    with pytest.raises(ValueError, match="lines 151, 152 are not status codes"):
+        find_faulty_servers_in_file(str(path), chunk_bytes=chunk_bytes, workers=workers)
@@ -0,0 +1,174 @@
+import os
+import sys
+import csv
+import shutil
+import subprocess
+
+import pytest
+
+from finish_problem import CSV_HEADER, bundle_many, parse_args
+from workspace_index import WorkspaceIndex
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+EXAMPLE_DIR = os.path.join(REPO_ROOT, "examples", "python")
+PROBLEM_FILES = ("prompt.md", "solution.py", "test_solution.py")
+
+@pytest.fixture
+def workspace(tmp_path):
+    for name in ("problem-a", "problem-b"):
+        os.makedirs(tmp_path / name)
+        for filename in PROBLEM_FILES:
+            shutil.copy(os.path.join(EXAMPLE_DIR, filename), tmp_path / name / filename)
+    return tmp_path
+
+def export(workspace, output_name, **kwargs):
+    index = WorkspaceIndex.load(str(workspace), str(workspace / ".index.json"))
+    index.save()
+    records = index.problems()
+    output_file = str(workspace / output_name)
+    counts = bundle_many(records, "bob", output_file, jobs=1,
+                         manifest_path=str(workspace / ".manifest.json"), **kwargs)
+    with open(output_file, newline='', encoding='utf-8') as f:
+        return counts, list(csv.reader(f))
+
+def test_second_export_still_contains_every_problem(workspace):
+    (bundled, cached, skipped), first = export(workspace, "b1.csv")
+    assert (bundled, cached, skipped) == (2, 0, [])
+    assert first[0] == CSV_HEADER
+    assert sorted(row[0] for row in first[1:]) == ["problem-a", "problem-b"]
+
+    (bundled, cached, skipped), second = export(workspace, "b1.csv")
+    assert (bundled, cached, skipped) == (0, 2, [])
+    assert second == first
+
+    # A fresh output path gets the full bundle too
+    _, other = export(workspace, "b2.csv")
+    assert other == first
+
+def test_edited_problem_is_re_bundled_alongside_cached_ones(workspace):
+    export(workspace, "b1.csv")
+    with open(workspace / "problem-b" / "prompt.md", 'a', encoding='utf-8') as f:
+        f.write("\nOne more line.\n")
+
+    (bundled, cached, _), rows = export(workspace, "b1.csv")
+    assert (bundled, cached) == (1, 1)
+    prompts = {row[0]: row[2] for row in rows[1:]}
+    assert prompts["problem-b"].endswith("One more line.")
+    assert not prompts["problem-a"].endswith("One more line.")
+
+@pytest.mark.parametrize("blobs", [True, False])
+def test_jsonl_round_trips_with_a_warm_manifest(workspace, blobs):
+    from bundle_jsonl import jsonl_to_csv
+
+    export(workspace, "b1.csv", jsonl_file=str(workspace / "b1.jsonl.gz"), jsonl_blobs=blobs)
+    (bundled, cached, _), rows = export(workspace, "b2.csv", jsonl_file=str(workspace / "b2.jsonl.gz"),
+                                        jsonl_blobs=blobs)
+    assert (bundled, cached) == (0, 2)
+
+    assert jsonl_to_csv(str(workspace / "b2.jsonl.gz"), str(workspace / "rt.csv")) == 2
+    with open(workspace / "b2.csv", 'rb') as expected, open(workspace / "rt.csv", 'rb') as actual:
+        assert actual.read() == expected.read()
+
+def test_broken_jsonl_bundle_leaves_the_csv_untouched(tmp_path):
+    import gzip
+    import json
+    from bundle_jsonl import JSONL_FORMAT, JSONL_VERSION, jsonl_to_csv
+
+    good = dict(zip(CSV_HEADER, ["p1", "python", "prompt", "solution", "test", "bob"]))
+    broken = dict(good, id="p2", prompt=[{"$blob": "0" * 64}])
+    with gzip.open(tmp_path / "broken.jsonl.gz", 'wt', encoding='utf-8') as f:
+        for obj in ({'format': JSONL_FORMAT, 'version': JSONL_VERSION, 'blobs': True}, good, broken):
+            f.write(json.dumps(obj) + "\n")
+    (tmp_path / "out.csv").write_text("previous\n", encoding='utf-8')
+
+    with pytest.raises(Exception, match="broken.jsonl.gz:3 refers to missing blob"):
+        jsonl_to_csv(str(tmp_path / "broken.jsonl.gz"), str(tmp_path / "out.csv"))
+    assert (tmp_path / "out.csv").read_text(encoding='utf-8') == "previous\n"
+    assert sorted(os.listdir(tmp_path)) == ["broken.jsonl.gz", "out.csv"]
+
+def test_jsonl_to_csv_does_not_hold_every_row(tmp_path, monkeypatch):
+    import tracemalloc
+    import bundle_jsonl
+
+    rows = 50000
+    def read_jsonl_bundle(path):
+        for i in range(rows):
+            yield [f"p{i}", "python", "prompt " * 10, "solution " * 10, "test " * 10, "bob"]
+    monkeypatch.setattr(bundle_jsonl, "read_jsonl_bundle", read_jsonl_bundle)
+
+    tracemalloc.start()
+    try:
+        assert bundle_jsonl.jsonl_to_csv("unused", str(tmp_path / "out.csv")) == rows
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    # A list of every row would take tens of MiB
+    assert peak < 2 * 1024 * 1024
+
+def test_unchanged_problem_files_are_not_opened_again(workspace, monkeypatch):
+    _, first = export(workspace, "b1.csv")
+
+    opened = []
+    real_open = open
+    def tracking_open(file, *args, **kwargs):
+        opened.append(os.path.abspath(str(file)))
+        return real_open(file, *args, **kwargs)
+    monkeypatch.setattr("builtins.open", tracking_open)
+
+    (bundled, cached, _), second = export(workspace, "b1.csv")
+    assert (bundled, cached) == (0, 2)
+    assert second == first
+    problem_dirs = tuple(str(workspace / name) + os.sep for name in ("problem-a", "problem-b"))
+    assert not [path for path in opened if path.startswith(problem_dirs)]
+
+PROBLEM_ID = "0b6f3c1e-8d1a-4c53-9a7e-2f4d5b6c7d8e"
+
+def test_legacy_form_takes_the_second_argument_as_the_username():
+    args = parse_args(["examples/python", "bob"])
+    assert (args.targets, args.username) == (["examples/python"], "bob")
+
+def test_flag_form_keeps_every_target():
+    args = parse_args(["examples/python", "examples", "-u", "bob", "-j", "2", "-o", "out.csv"])
+    assert (args.targets, args.username, args.jobs, args.output) == (["examples/python", "examples"], "bob", 2, "out.csv")
+
+@pytest.mark.parametrize("second", [PROBLEM_ID, "examples/pyhton"])
+def test_mistyped_directory_is_not_taken_for_a_username(second):
+    args = parse_args(["examples/python", second])
+    assert (args.targets, args.username) == (["examples/python", second], None)
+
+@pytest.mark.parametrize("jobs", ["0", "-1", "two"])
+def test_jobs_must_be_a_positive_int(jobs, capsys):
+    with pytest.raises(SystemExit):
+        parse_args(["--all", "-j", jobs])
+    assert "-j/--jobs" in capsys.readouterr().err
+
+def test_parallel_export_keeps_record_order_and_reports_broken_dirs(workspace):
+    for name in ("problem-c", "problem-d"):
+        shutil.copytree(workspace / "problem-a", workspace / name)
+    os.remove(workspace / "problem-d" / "test_solution.py")
+    index = WorkspaceIndex.load(str(workspace), str(workspace / ".index.json"))
+    records = index.problems() + [index.lookup(str(workspace / "problem-d"))]
+
+    output_file = str(workspace / "all.csv")
+    bundled, cached, skipped = bundle_many(records, "bob", output_file, jobs=3,
+                                           manifest_path=str(workspace / ".manifest.json"))
+    assert (bundled, cached) == (3, 0)
+    assert skipped == [(str(workspace / "problem-d"), f"No test file found for python in {workspace / 'problem-d'}")]
+    with open(output_file, newline='', encoding='utf-8') as f:
+        rows = list(csv.reader(f))
+    assert [row[0] for row in rows[1:]] == ["problem-a", "problem-b", "problem-c"]
+    assert {row[5] for row in rows[1:]} == {"bob"}
+
+def test_all_flag_bundles_the_workspace_in_parallel(workspace):
+    os.makedirs(workspace / "notes")
+    script = os.path.join(REPO_ROOT, "finish_problem.py")
+    command = [sys.executable, script, "--all", "-u", "bob", "-j", "2", "-o", "all.csv", "--workspace", "."]
+    first = subprocess.run(command, cwd=workspace, capture_output=True, text=True)
+    assert first.returncode == 0, first.stdout + first.stderr
+    assert "(2 problems)" in first.stdout
+    assert "Skipped notes: no prompt.md" in first.stdout
+    with open(workspace / "all.csv", newline='', encoding='utf-8') as f:
+        assert [row[0] for row in list(csv.reader(f))[1:]] == ["problem-a", "problem-b"]
+
+    second = subprocess.run(command, cwd=workspace, capture_output=True, text=True)
+    assert "Cache: 2 hits, 0 misses" in second.stdout
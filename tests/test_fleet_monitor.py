@@ -0,0 +1,67 @@
+import os
+import sys
+import asyncio
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                                "c155a9c4-d930-4957-a556-2df241179354"))
+
+from fleet_monitor import FakeEventSource, FleetHealthMonitor, ManualClock
+
+async def drain(source):
+    # The consumer applies an event in the same step that takes it off the queue
+    while not source.queue.empty():
+        await asyncio.sleep(0)
+
+def test_windows_follow_the_injected_clock():
+    async def scenario():
+        clock = ManualClock(1000.0)
+        monitor = FleetHealthMonitor(window_seconds=10, clock=clock)
+        source = FakeEventSource()
+        consumer = asyncio.create_task(monitor.consume(source))
+
+        await source.push(1, 500)
+        await drain(source)
+        clock.advance(6)
+        await source.push(2, 503)
+        await source.push(3, 200)
+        await drain(source)
+        assert monitor.recent_faulty() == [2, 1]
+        assert monitor.recent_faulty(5) == [2]
+        assert monitor.fault_count() == 2
+
+        clock.advance(5)
+        # Slot 1 reported 11s ago: out of the window, though still faulty now
+        assert monitor.recent_faulty() == [2]
+        assert monitor.fault_count() == 1
+        assert monitor.faulty_servers() == [1, 2]
+
+        await source.push(1, 200)
+        await source.close()
+        await consumer
+        assert monitor.faulty_servers() == [2]
+
+    asyncio.run(scenario())
+
+def test_reports_are_stamped_with_the_clock_at_arrival():
+    async def scenario():
+        clock = ManualClock(1000.0)
+        monitor = FleetHealthMonitor(window_seconds=10, clock=clock)
+        source = FakeEventSource()
+        consumer = asyncio.create_task(monitor.consume(source))
+
+        await source.push(1, 500)
+        await drain(source)
+        clock.advance(2.5)
+        await source.push(2, 502)
+        await source.push(3, 200)
+        await drain(source)
+        clock.advance(1)
+        # A repeat report moves the slot to the newest stamp
+        await source.push(1, 504)
+        await source.close()
+        await consumer
+        return monitor
+
+    monitor = asyncio.run(scenario())
+    assert list(monitor.last_fault.items()) == [(2, 1002.5), (1, 1003.5)]
+    assert [list(bucket) for bucket in monitor.buckets] == [[1000, 1], [1002, 1], [1003, 1]]
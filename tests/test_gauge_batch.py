@@ -0,0 +1,62 @@
+import os
+import sys
+import random
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "examples", "python"))
+
+from gauge_batch import gauge_field_invariance_batch
+from solution import gauge_field_invariance
+
+def scalar_or_none(charges, field, coupling, iterations):
+    try:
+        return gauge_field_invariance(charges, field, coupling, iterations)
+    except ValueError:
+        return None
+
+def random_batch(seed, batch, n):
+    rng = random.Random(seed)
+    charges = [[rng.randint(-5, 5) for _ in range(n)] for _ in range(batch)]
+    field = [[rng.randint(-20, 20) for _ in range(n)] for _ in range(batch)]
+    coupling = [rng.randint(1, 10) for _ in range(batch)]
+    iterations = [rng.randint(10, 100) for _ in range(batch)]
+    return charges, field, coupling, iterations
+
+@pytest.mark.parametrize("seed, n", [(0, 4), (1, 6), (2, 8), (3, 12), (4, 16)])
+def test_batch_matches_scalar_rows(seed, n):
+    charges, field, coupling, iterations = random_batch(seed, 40, n)
+    out_charges, out_links, energies, valid = gauge_field_invariance_batch(charges, field, coupling, iterations,
+                                                                           errors="ignore")
+    for row in range(40):
+        expected = scalar_or_none(charges[row], field[row], coupling[row], iterations[row])
+        assert valid[row] == (expected is not None)
+        if expected is not None:
+            assert (out_charges[row].tolist(), out_links[row].tolist(), int(energies[row])) == expected
+
+def test_batch_matches_scalar_with_scalar_parameters():
+    charges, field, _, _ = random_batch(5, 10, 8)
+    expected = [scalar_or_none(c, f, 3, 25) for c, f in zip(charges, field)]
+    assert all(expected)
+    out_charges, out_links, energies = gauge_field_invariance_batch(charges, field, 3, 25)
+    assert [(c.tolist(), l.tolist(), int(e)) for c, l, e in zip(out_charges, out_links, energies)] == expected
+
+@pytest.mark.parametrize("charges, field, iterations", [
+    ([], [], 10),                                # empty lattice
+    ([3], [1], 10),                              # single charge
+    ([1, -1, 1, -1], [0, 0, 0, 0], 0),           # no iterations
+    ([1, -1, 1, -1, 1], [0, 0, 0, 0, 0], 10),    # odd size
+    ([6, -1, 1, -1], [0, 0, 0, 0], 10),          # charge out of range
+])
+def test_batch_rejects_what_scalar_rejects(charges, field, iterations):
+    with pytest.raises(ValueError):
+        gauge_field_invariance(charges, field, 1, iterations)
+    with pytest.raises(ValueError):
+        gauge_field_invariance_batch([charges], [field], 1, iterations)
+
+def test_empty_batch():
+    charges, links, energies = gauge_field_invariance_batch(np.zeros((0, 4), dtype=int), np.zeros((0, 4), dtype=int),
+                                                            1, 10)
+    assert charges.shape == (0, 4) and links.shape == (0, 3) and energies.shape == (0,)
@@ -0,0 +1,98 @@
+import os
+import sys
+import random
+import itertools
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "examples", "python"))
+
+from solution import gauge_field_invariance, gauge_field_invariance_exact, gauge_sweep
+
+def _energy(charges, links, background_field, coupling_strength):
+    site = sum(c * b for c, b in zip(charges, background_field))
+    pairs = sum(2 * coupling_strength * charges[i] * charges[i + 1] * links[i] for i in range(len(links)))
+    return site + pairs + coupling_strength * sum(l * l for l in links)
+
+def _brute_force_4(background_field, coupling_strength):
+    # Every (charges, links) of a 4-site lattice; returns the minimal energy
+    # and the lexicographically smallest (c0, l0, c1, l1, c2, l2, c3) reaching it
+    values = np.arange(-5, 6)
+    rest = np.array(list(itertools.product(values, repeat=3)))    # c1, c2, c3
+    links = np.array(list(itertools.product(values, repeat=3)))   # l0, l1, l2
+    best = None
+    for c0 in values:
+        charges = np.column_stack((np.full(len(rest), c0), rest))
+        pairs = charges[:, :-1] * charges[:, 1:]
+        energy = ((charges * background_field).sum(axis=1)[:, None]
+                  + 2 * coupling_strength * pairs @ links.T
+                  + coupling_strength * (links * links).sum(axis=1)[None, :])
+        flow = charges[:, :-1] @ links.T
+        energy = np.where(flow == 0, energy, np.iinfo(np.int64).max)
+        low = energy.min()
+        for ci, li in zip(*np.nonzero(energy == low)):
+            c, l = charges[ci].tolist(), links[li].tolist()
+            key = (int(low), [c[0], l[0], c[1], l[1], c[2], l[2], c[3]])
+            if best is None or key < best:
+                best = key
+    energy, sequence = best
+    return sequence[0::2], sequence[1::2], energy
+
+def test_exact_hand_verified_optimum():
+    # With values -1..1, no field and κ = 1 a link costs 2·c·c'·l + l²: -1 when
+    # l = -c·c', otherwise 0 (l = 0) or more. A link at -1 adds c·l = -c' to
+    # the flow, and three of them cannot sum to zero, so the optimum is -2:
+    # two such links and one l = 0. The smallest (c0, l0, c1, l1, ...) among
+    # those is c0 = l0 = c1 = -1, l1 = 0, c2 = -1, l2 = 1, c3 = 1.
+    assert gauge_field_invariance_exact([0, 0, 0, 0], 1, values=(-1, 0, 1)) == \
+        ([-1, -1, -1, 1], [-1, 0, 1], -2)
+
+@pytest.mark.parametrize("background_field, coupling_strength", [
+    ([0, 0, 0, 0], 1),
+    ([1, -1, 1, -1], 2),
+    ([3, 0, -2, 5], 7),
+])
+def test_exact_matches_brute_force(background_field, coupling_strength):
+    # Also pins the documented tie-break: the brute force picks the
+    # lexicographically smallest (c0, l0, c1, l1, ...) among the optima
+    result = gauge_field_invariance(
+        lattice_charges=[0, 0, 0, 0],
+        background_field=background_field,
+        coupling_strength=coupling_strength,
+        max_iterations=10,
+        method="exact"
+    )
+    assert result == _brute_force_4(background_field, coupling_strength)
+
+def test_exact_never_worse_than_greedy():
+    rng = random.Random(7)
+    for _ in range(20):
+        n = rng.choice([4, 6, 8, 12, 16])
+        charges = [rng.randint(-5, 5) for _ in range(n)]
+        field = [rng.randint(-10, 10) for _ in range(n)]
+        coupling = rng.randint(1, 10)
+        greedy = gauge_field_invariance(charges, field, coupling, 50)
+        exact = gauge_field_invariance(charges, field, coupling, 50, method="exact")
+        assert exact[2] <= greedy[2]
+        assert exact[2] == _energy(exact[0], exact[1], field, coupling)
+
+def test_exact_beyond_sixteen_sites():
+    n = 24
+    field = [(-1) ** i * (i % 5) for i in range(n)]
+    charges, links, energy = gauge_field_invariance([1] * n, field, 3, 10, method="exact")
+    assert len(charges) == n and len(links) == n - 1
+    assert all(-5 <= v <= 5 for v in charges + links)
+    assert sum(c * l for c, l in zip(charges, links)) == 0
+    assert energy == _energy(charges, links, field, 3)
+
+    # Greedy sweeps still run without the 16-site cap when called directly
+    sweep_charges, sweep_links = [1] * n, [0] * (n - 1)
+    sweep_energy, flow = _energy(sweep_charges, sweep_links, field, 3), 0
+    for _ in range(50):
+        sweep_energy, flow = gauge_sweep(sweep_charges, sweep_links, sweep_energy, flow, field, 3)
+    assert energy <= sweep_energy
+
+    with pytest.raises(ValueError):
+        gauge_field_invariance([1] * n, field, 3, 10)
@@ -0,0 +1,45 @@
+import os
+import sys
+import random
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "examples", "python"))
+
+from gauge_multistart import descend, gauge_field_invariance_multistart, sweep_cost
+
+def lattice(n, seed=0):
+    rng = random.Random(seed)
+    return [rng.randint(-5, 5) for _ in range(n)], [rng.randint(-10, 10) for _ in range(n)]
+
+@pytest.mark.parametrize("max_evaluations", [1, 50000, 200000])
+@pytest.mark.parametrize("workers", [1, 3])
+def test_evaluation_budget_is_never_exceeded(max_evaluations, workers):
+    charges, field = lattice(400)
+    *result, stats = gauge_field_invariance_multistart(charges, field, 3, starts=12, workers=workers,
+                                                      max_evaluations=max_evaluations, return_diagnostics=True)
+    assert stats["evaluations"] <= max_evaluations
+    assert max_evaluations - stats["evaluations"] < sweep_cost(400) or stats["stop_reason"] == "starts"
+    assert sum(c * l for c, l in zip(result[0], result[1])) == 0
+
+def test_deadline_is_checked_after_every_sweep():
+    charges, field = lattice(400)
+    # An expired deadline stops each start after its first sweep
+    assert descend(list(charges), field, 3, 100, deadline=0)[3:] == (1, "time_budget")
+    stats = gauge_field_invariance_multistart(charges, field, 3, starts=50, workers=1, time_budget=0,
+                                              return_diagnostics=True)[3]
+    assert stats["stop_reason"] == "time_budget"
+    assert stats["evaluations"] == stats["starts"] * sweep_cost(400)
+
+def test_pruning_is_opt_in():
+    charges, field = lattice(64, seed=1)
+    stats = gauge_field_invariance_multistart(charges, field, 4, starts=8, workers=2, return_diagnostics=True)[3]
+    assert stats["pruned"] == 0
+
+def test_pruning_fires_without_changing_the_result():
+    charges, field = lattice(64, seed=1)
+    *pruned_result, stats = gauge_field_invariance_multistart(charges, field, 4, starts=8, workers=2,
+                                                              prune_after=1, return_diagnostics=True)
+    assert stats["pruned"] > 0
+    unpruned = gauge_field_invariance_multistart(charges, field, 4, starts=8, workers=2)
+    assert tuple(pruned_result) == unpruned
@@ -0,0 +1,54 @@
+import os
+import sys
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                                "e066e8e9-f74b-461a-8519-66eaf14adec4"))
+
+from lrn_codec import MAX_POSITION, decode, encode, getVehicleIndexNumber, load_plates, save_plates, validate
+
+BOUNDARY_PLATES = ["AA0001", "AA0999", "AA1000", "AA9999", "AB0001", "AE8017", "AZ9999", "BA0001",
+                   "ZY0500", "ZZ0001", "ZZ9998", "ZZ9999"]
+
+def test_encode_matches_the_scalar_formula():
+    positions = encode(BOUNDARY_PLATES)
+    assert positions.tolist() == [getVehicleIndexNumber(plate) for plate in BOUNDARY_PLATES]
+    assert positions[0] == 1 and positions[-1] == MAX_POSITION
+
+@pytest.mark.parametrize("plates", [BOUNDARY_PLATES, np.array(BOUNDARY_PLATES, dtype='S6'),
+                                    "".join(BOUNDARY_PLATES).encode()])
+def test_round_trip_at_boundary_plates(plates):
+    positions = encode(plates)
+    assert decode(positions).astype('U6').tolist() == BOUNDARY_PLATES
+    assert encode(decode(positions)).tolist() == positions.tolist()
+
+def test_round_trip_of_every_thousandth_position():
+    positions = np.arange(1, MAX_POSITION + 1, 997)
+    assert encode(decode(positions)).tolist() == positions.tolist()
+
+def test_high_digits_do_not_overflow():
+    # 9 * 1000 in the thousands column needs more than int16
+    assert encode(["AA9000", "ZZ9000"]).tolist() == [9000, MAX_POSITION - 999]
+
+BAD_PLATES = ["AA0000", "aa0001", "A10001", "AA00011", "AA001", "AAA001", "ÄA0001", ""]
+
+def test_strict_mode_rejects_malformed_rows():
+    plates = ["AA0001"] + BAD_PLATES
+    assert validate(plates).tolist() == [True] + [False] * len(BAD_PLATES)
+    with pytest.raises(ValueError, match=f"{len(BAD_PLATES)} invalid plates at rows 1, 2"):
+        encode(plates)
+    assert encode(plates, strict=False).tolist() == [1] + [0] * len(BAD_PLATES)
+
+def test_decode_rejects_out_of_range_positions():
+    with pytest.raises(ValueError):
+        decode([1, 0, MAX_POSITION + 1])
+    with pytest.raises(TypeError):
+        decode([1.5])
+
+def test_plates_file_round_trip(tmp_path):
+    path = str(tmp_path / "plates.txt")
+    save_plates(path, BOUNDARY_PLATES)
+    assert load_plates(path).astype('U6').tolist() == BOUNDARY_PLATES
@@ -0,0 +1,91 @@
+import os
+import sys
+import random
+import importlib.util
+
+import pytest
+
+PROBLEM_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                           "9a1f8a44-50ef-4115-8607-556c5af01cb1")
+sys.path.insert(0, PROBLEM_DIR)
+
+import pedigree as pedigree_module
+from pedigree import Pedigree
+
+# Other problems have a solution module too, so load this one under its own name
+_spec = importlib.util.spec_from_file_location("trait_decider_solution", os.path.join(PROBLEM_DIR, "solution.py"))
+_solution = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(_solution)
+traitDecider = _solution.traitDecider
+
+TRAITS = ["hair_color", "eye_color", "vision", "blood_type", "height"]
+VALUES = ["Blue", "BlAcK", " brown ", "GREEN", "normal", "NoRmaL", "O-PosiTive", "tall", "", "AB"]
+
+def random_traits(rng):
+    return {trait: rng.choice(VALUES) for trait in rng.sample(TRAITS, rng.randint(0, len(TRAITS)))}
+
+def random_records(rng, founders, children):
+    records = [{"id": f"f{i}", "traits": random_traits(rng)} for i in range(founders)]
+    for i in range(children):
+        known = [record["id"] for record in records]
+        father, mother = rng.choice(known), rng.choice(known)
+        records.append({"id": f"c{i}", "father": father, "mother": mother})
+    # Children may come before their parents
+    rng.shuffle(records)
+    return records
+
+def reference(records):
+    # Resolve everyone straight from traitDecider, parents first
+    by_id = {record["id"]: record for record in records}
+    resolved = {}
+    def traits_of(individual):
+        if individual not in resolved:
+            record = by_id[individual]
+            if "traits" in record:
+                resolved[individual] = traitDecider(record["traits"], {})
+            else:
+                resolved[individual] = traitDecider(traits_of(record["father"]), traits_of(record["mother"]))
+        return resolved[individual]
+    return {individual: traits_of(individual) for individual in by_id}
+
+@pytest.mark.parametrize("seed", range(20))
+def test_resolve_matches_trait_decider(seed):
+    rng = random.Random(seed)
+    records = random_records(rng, rng.randint(1, 8), rng.randint(0, 60))
+    assert Pedigree.from_records(records).resolve() == reference(records)
+
+@pytest.mark.parametrize("seed", range(20))
+def test_founder_updates_match_trait_decider(seed):
+    rng = random.Random(seed)
+    records = random_records(rng, rng.randint(1, 8), rng.randint(0, 60))
+    pedigree = Pedigree.from_records(records)
+    before = reference(records)
+    pedigree.resolve()
+    founders = [record for record in records if "traits" in record]
+    for _ in range(10):
+        founder = rng.choice(founders)
+        founder["traits"] = random_traits(rng)
+        changed = pedigree.update_traits(founder["id"], founder["traits"])
+        after = reference(records)
+        assert pedigree.resolved == after
+        assert set(changed) == {individual for individual in after if after[individual] != before[individual]}
+        before = after
+
+def test_update_only_recomputes_descendants(monkeypatch):
+    # A chain hanging off one founder plus many unrelated families
+    records = [{"id": "root", "traits": {"eye_color": "blue"}}, {"id": "partner", "traits": {}}]
+    records += [{"id": f"line{i}", "father": f"line{i - 1}" if i else "root", "mother": "partner"} for i in range(5)]
+    for family in range(200):
+        records += [{"id": f"a{family}", "traits": {"eye_color": "Brown"}},
+                    {"id": f"b{family}", "traits": {"eye_color": "green"}},
+                    {"id": f"k{family}", "father": f"a{family}", "mother": f"b{family}"}]
+    pedigree = Pedigree.from_records(records)
+    pedigree.resolve()
+
+    calls = []
+    real_decide = pedigree_module.decide
+    monkeypatch.setattr(pedigree_module, "decide", lambda *pair: calls.append(pair) or real_decide(*pair))
+    changed = pedigree.update_traits("root", {"eye_color": "BLUE"})
+    assert changed == ["root"] + [f"line{i}" for i in range(5)]
+    assert len(calls) == 6
+    assert pedigree.traits("line4") == {"eye_color": "BLUE"}
@@ -0,0 +1,83 @@
+import os
+import json
+
+import pytest
+
+from execution_backends import ForkServerBackend, LocalBackend
+from perf_metrics import (NOISE_FLOORS, PerfPlugin, collect_metrics, find_regressions, load_history, problem_key,
+                          record_run)
+from workspace_index import scan_problem_dir
+
+MiB = 1024 * 1024
+
+def perf(wall=0.1, cpu=0.1, peak_memory=MiB, max_rss=200 * MiB):
+    return {'wall': wall, 'cpu': cpu, 'peak_memory': peak_memory, 'max_rss': max_rss}
+
+def test_every_recorded_metric_has_a_noise_floor():
+    assert set(NOISE_FLOORS) == {'wall', 'cpu', 'peak_memory', 'max_rss'}
+
+@pytest.mark.parametrize("metric", sorted(NOISE_FLOORS))
+def test_each_metric_is_checked(metric):
+    runs = [{'metrics': {'p': {'t': perf()}}}]
+    grown = perf(**{metric: perf()[metric] * 2})
+    assert find_regressions({'p': {'t': grown}}, runs) == [('p', 't', metric, perf()[metric], grown[metric])]
+    assert find_regressions({'p': {'t': perf(**{metric: perf()[metric] * 1.4})}}, runs) == []
+
+def test_growth_below_the_noise_floor_is_ignored():
+    runs = [{'metrics': {'p': {'t': perf(wall=0.001, max_rss=30 * MiB)}}}]
+    assert find_regressions({'p': {'t': perf(wall=0.004, max_rss=60 * MiB)}}, runs) == []
+    # Growth past the floor still counts once it clears threshold times the floor
+    assert [r[2] for r in find_regressions({'p': {'t': perf(wall=0.001, max_rss=100 * MiB)}}, runs)] == ['max_rss']
+
+def test_latest_baseline_wins_and_history_is_appended(tmp_path):
+    path = str(tmp_path / "history.json")
+    assert record_run({'p': {'t': perf(wall=0.1)}}, path) == []
+    assert record_run({'p': {'t': perf(wall=1.0)}}, path) != []
+    # 1.0 is now the baseline
+    assert record_run({'p': {'t': perf(wall=1.2)}}, path) == []
+    assert [run['metrics']['p']['t']['wall'] for run in load_history(path)] == [0.1, 1.0, 1.2]
+
+def test_history_is_keyed_by_path_not_directory_name(tmp_path):
+    results = [{'id': 'python', 'path': str(tmp_path / "examples" / "python"),
+                'tests': [{'nodeid': 't', 'outcome': 'passed', 'user_properties': {'perf': perf()}}]},
+               {'id': 'python', 'path': str(tmp_path / "seeds" / "python"),
+                'tests': [{'nodeid': 't', 'outcome': 'passed', 'user_properties': {'perf': perf(wall=9.0)}}]}]
+    metrics = collect_metrics(results, str(tmp_path))
+    assert metrics == {'examples/python': {'t': perf()}, 'seeds/python': {'t': perf(wall=9.0)}}
+    assert problem_key("./examples/python/", ".") == problem_key(os.path.abspath("examples/python"), ".")
+
+PERF_TEST = """def test_allocates():
+    data = [0] * 200000
+    assert len(data) == 200000
+
+def test_fails():
+    assert False
+"""
+
+def perf_problem(tmp_path):
+    for name, text in (("prompt.md", "# Perf\n"), ("solution.py", "def perf():\n    pass\n"),
+                       ("test_solution.py", PERF_TEST)):
+        (tmp_path / name).write_text(text, encoding='utf-8')
+    return scan_problem_dir(str(tmp_path))
+
+def check_perf_events(result):
+    assert result['status'] == 'failed'
+    outcomes = {test['nodeid'].split('::')[-1]: test for test in result['tests']}
+    assert outcomes['test_fails']['outcome'] == 'failed'
+    metrics = outcomes['test_allocates']['user_properties']['perf']
+    assert set(metrics) == set(NOISE_FLOORS)
+    assert metrics['peak_memory'] >= 200000 * 8
+    assert metrics['max_rss'] > 0
+    assert list(collect_metrics([result])[problem_key(result['path'])]) == [outcomes['test_allocates']['nodeid']]
+
+def test_local_backend_records_perf_events(tmp_path):
+    check_perf_events(LocalBackend(perf=True).run(perf_problem(tmp_path), timeout=60))
+
+@pytest.mark.skipif(not hasattr(os, 'fork'), reason="the fork backend needs os.fork")
+def test_fork_backend_records_perf_events(tmp_path):
+    backend = ForkServerBackend(perf=True)
+    try:
+        check_perf_events(backend.run(perf_problem(tmp_path), timeout=60))
+    finally:
+        backend.close()
+    assert backend.plugins == [PerfPlugin]
@@ -0,0 +1,82 @@
+import os
+import sys
+import random
+from bisect import bisect_left, bisect_right
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                                "e066e8e9-f74b-461a-8519-66eaf14adec4"))
+
+from lrn_codec import MAX_POSITION, decode
+from plate_registry import BLOCK_BITS, PlateRegistry
+
+def reference_next_free(issued, position):
+    while position in issued:
+        position += 1
+    return position if position <= MAX_POSITION else None
+
+def interesting_positions(rng, count):
+    # Word and block edges, the ends of the range, and anything in between
+    edges = [1, 2, 63, 64, 65, BLOCK_BITS, BLOCK_BITS + 1, MAX_POSITION - 1, MAX_POSITION]
+    return [rng.choice(edges) + rng.randint(-3, 3) if rng.random() < 0.5 else rng.randint(1, MAX_POSITION)
+            for _ in range(count)]
+
+def check(registry, issued, rng):
+    ordered = sorted(issued)
+    assert len(registry) == len(ordered)
+    for _ in range(30):
+        first, last = sorted(min(max(p, 1), MAX_POSITION) for p in interesting_positions(rng, 2))
+        assert registry.count(first, last) == bisect_right(ordered, last) - bisect_left(ordered, first)
+        position = min(max(interesting_positions(rng, 1)[0], 1), MAX_POSITION)
+        assert registry.next_free_position(position) == reference_next_free(issued, position)
+    for k in rng.sample(range(-1, len(ordered) + 1), min(20, len(ordered) + 2)):
+        assert registry.select(k) == (ordered[k] if 0 <= k < len(ordered) else None)
+
+@pytest.mark.parametrize("seed", range(5))
+def test_registry_matches_a_set(seed):
+    rng = random.Random(seed)
+    registry, issued = PlateRegistry(), set()
+    for _ in range(6):
+        for position in interesting_positions(rng, 200):
+            position = min(max(position, 1), MAX_POSITION)
+            if rng.random() < 0.7:
+                assert registry.issue(position) == (position not in issued)
+                issued.add(position)
+            else:
+                assert registry.revoke(position) == (position in issued)
+                issued.discard(position)
+        check(registry, issued, rng)
+
+def test_issue_many_and_plate_strings():
+    rng = random.Random(7)
+    positions = np.array(sorted(set(interesting_positions(rng, 500)) & set(range(1, MAX_POSITION + 1))))
+    registry = PlateRegistry()
+    registry.issue_many(decode(positions))
+    issued = set(positions.tolist())
+    check(registry, issued, rng)
+    plate = decode([positions[0]])[0].decode('ascii')
+    assert plate in registry and registry.count(plate, plate) == 1
+
+def test_next_free_skips_full_blocks_and_stops_at_the_end():
+    registry = PlateRegistry()
+    registry.issue_many(np.arange(100, 100 + 5 * BLOCK_BITS))
+    assert registry.next_free_position(100) == 100 + 5 * BLOCK_BITS
+    assert registry.next_free(100) == decode([100 + 5 * BLOCK_BITS])[0].decode('ascii')
+
+    registry.issue_many(np.arange(MAX_POSITION - 2 * BLOCK_BITS, MAX_POSITION + 1))
+    assert registry.next_free_position(MAX_POSITION - 2 * BLOCK_BITS) is None
+    assert registry.next_free("ZZ9999") is None
+    registry.revoke(MAX_POSITION)
+    assert registry.next_free("ZZ9990") == "ZZ9999"
+
+def test_memory_mapped_registry_persists(tmp_path):
+    path = str(tmp_path / "plates.bits")
+    registry = PlateRegistry.open(path)
+    registry.issue("AE8017")
+    registry.flush()
+    del registry
+    reopened = PlateRegistry.open(path)
+    assert "AE8017" in reopened and len(reopened) == 1
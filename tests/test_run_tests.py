@@ -0,0 +1,60 @@
+import os
+import json
+import shutil
+import xml.etree.ElementTree as ET
+
+import pytest
+
+from execution_backends import LocalBackend
+from run_tests import parse_args, run_many, write_json_report, write_junit_report
+from workspace_index import WorkspaceIndex
+
+EXAMPLE_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "examples", "python")
+
+@pytest.fixture(scope="module")
+def results(tmp_path_factory):
+    # One run of the pool shared by the report tests
+    tmp_path = tmp_path_factory.mktemp("workspace")
+    for name in ("problem-a", "problem-b", "problem-c"):
+        shutil.copytree(EXAMPLE_DIR, tmp_path / name, ignore=shutil.ignore_patterns('__pycache__', '.pytest_cache'))
+    with open(tmp_path / "problem-b" / "test_solution.py", 'a', encoding='utf-8') as f:
+        f.write("\ndef test_broken():\n    assert False\n")
+    records = WorkspaceIndex.load(str(tmp_path), str(tmp_path / ".index.json")).problems()
+
+    seen = []
+    results = run_many(records, jobs=3, timeout=120, on_result=seen.append, backend=LocalBackend())
+    assert sorted(r['id'] for r in seen) == [r['id'] for r in results]
+    return results
+
+def test_thread_pool_runs_every_problem_sorted_by_id(results):
+    assert [(r['id'], r['language'], r['status']) for r in results] == [
+        ("problem-a", "python", "passed"), ("problem-b", "python", "failed"), ("problem-c", "python", "passed")]
+    assert "test_broken" in results[1]['output']
+
+def test_json_report(results, tmp_path):
+    write_json_report(results, str(tmp_path / "report.json"), wall_time=1.23456)
+    with open(tmp_path / "report.json", encoding='utf-8') as f:
+        report = json.load(f)
+    summary = report['summary']
+    assert {key: summary[key] for key in ('total', 'passed', 'failed', 'timeout', 'error', 'wall_time')} == {
+        'total': 3, 'passed': 2, 'failed': 1, 'timeout': 0, 'error': 0, 'wall_time': 1.235}
+    assert summary['duration'] == round(sum(r['duration'] for r in results), 3)
+    assert report['results'] == results
+
+def test_junit_report(results, tmp_path):
+    write_junit_report(results, str(tmp_path / "report.xml"), wall_time=1.5)
+    suites = ET.parse(tmp_path / "report.xml").getroot()
+    assert (suites.tag, suites.get('tests'), suites.get('failures'), suites.get('errors'), suites.get('time')) == (
+        'testsuites', '3', '1', '0', '1.5')
+    cases = suites.findall('testsuite/testcase')
+    assert [(case.get('classname'), case.get('name')) for case in cases] == [
+        ("python", "problem-a"), ("python", "problem-b"), ("python", "problem-c")]
+    failure = cases[1].find('failure')
+    assert failure.get('message') == "exit code 1"
+    assert "test_broken" in failure.text
+    assert cases[0].find('failure') is None and cases[0].find('system-out') is not None
+
+def test_perf_needs_a_local_or_fork_backend():
+    assert parse_args(["--all", "--backend", "local", "--perf"]).perf
+    with pytest.raises(SystemExit):
+        parse_args(["--all", "--perf"])
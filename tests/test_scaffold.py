@@ -0,0 +1,77 @@
+import os
+import json
+
+import pytest
+
+from scaffold import SEED_FILES, create_many, create_problem, load_seeds, read_spec, validate_spec
+from workspace_index import WorkspaceIndex, scan_problem_dir
+
+@pytest.mark.parametrize("language", sorted(SEED_FILES))
+def test_scaffolded_problem_is_a_complete_problem_directory(tmp_path, language):
+    problem_dir = create_problem(language, "countIslands", str(tmp_path))
+    assert os.listdir(tmp_path) == [os.path.basename(problem_dir)]
+    assert sorted(os.listdir(problem_dir)) == sorted(SEED_FILES[language].values())
+    for name in os.listdir(problem_dir):
+        with open(os.path.join(problem_dir, name), encoding='utf-8') as f:
+            assert "{entrypoint}" not in f.read()
+
+    record = scan_problem_dir(problem_dir)
+    assert 'error' not in record
+    assert record['language'] == language
+
+def test_python_entrypoint_is_detected_by_the_index(tmp_path):
+    problem_dir = create_problem("python", "count_islands", str(tmp_path))
+    index = WorkspaceIndex.load(str(tmp_path), str(tmp_path / ".index.json"))
+    assert index.get(problem_dir)['entrypoint'] == "count_islands"
+
+@pytest.mark.parametrize("language, entrypoint, message", [
+    ("rust", "solve", "Unsupported language"),
+    ("python", "count-islands", "valid identifier"),
+    ("python", "2sum", "valid identifier"),
+])
+def test_invalid_spec_is_rejected(language, entrypoint, message):
+    with pytest.raises(ValueError, match=message):
+        validate_spec(language, entrypoint)
+
+def test_batch_with_a_bad_entry_creates_nothing(tmp_path):
+    with pytest.raises(ValueError, match="Entry 2"):
+        create_many([("python", "solve"), ("python", "not valid"), ("java", "Solver")], str(tmp_path))
+    assert os.listdir(tmp_path) == []
+
+    created = create_many([("python", "solve"), ("java", "Solver")], str(tmp_path))
+    assert sorted(os.listdir(tmp_path)) == sorted(os.path.basename(path) for path in created)
+
+def test_read_spec_accepts_csv_and_json(tmp_path):
+    (tmp_path / "spec.csv").write_text("language,entrypoint\nPython, solve\njava,Solver\n", encoding='utf-8')
+    (tmp_path / "spec.json").write_text(json.dumps([{"language": "python", "entrypoint": "solve"},
+                                                    {"language": "Java", "entrypoint": "Solver"}]), encoding='utf-8')
+    expected = [("python", "solve"), ("java", "Solver")]
+    assert read_spec(str(tmp_path / "spec.csv")) == read_spec(str(tmp_path / "spec.json")) == expected
+
+    (tmp_path / "bad.csv").write_text("language,name\npython,solve\n", encoding='utf-8')
+    with pytest.raises(ValueError, match="needs a language and an entrypoint"):
+        read_spec(str(tmp_path / "bad.csv"))
+
+def test_seeds_are_read_once_per_language(tmp_path, monkeypatch):
+    seeds_dir = tmp_path / "seeds"
+    (seeds_dir / "python").mkdir(parents=True)
+    for seed_name in SEED_FILES['python']:
+        (seeds_dir / "python" / seed_name).write_text(f"# {seed_name}: {{entrypoint}}\n", encoding='utf-8')
+    root = tmp_path / "problems"
+    root.mkdir()
+
+    opened = []
+    real_open = open
+    def tracking_open(file, *args, **kwargs):
+        opened.append(str(file))
+        return real_open(file, *args, **kwargs)
+    monkeypatch.setattr("builtins.open", tracking_open)
+    try:
+        create_many([("python", "first"), ("python", "second")], str(root), str(seeds_dir))
+    finally:
+        load_seeds.cache_clear()
+    assert len([path for path in opened if path.startswith(str(seeds_dir))]) == len(SEED_FILES['python'])
+
+def test_missing_seeds_directory(tmp_path):
+    with pytest.raises(ValueError, match="not found"):
+        load_seeds("python", str(tmp_path))
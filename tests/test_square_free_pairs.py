@@ -0,0 +1,98 @@
+import math
+import random
+from collections import deque
+
+import pytest
+
+pytest.importorskip("numpy")
+
+from square_free_pairs import DynamicSquareFreePairs, solve
+
+def random_tree_edges(n, rng):
+    # Random labels and edge directions, so node 0 is not always an end of the order
+    labels = list(range(n))
+    rng.shuffle(labels)
+    edges = []
+    for child in range(1, n):
+        u, v = labels[rng.randrange(child)], labels[child]
+        edges.append([u, v] if rng.random() < 0.5 else [v, u])
+    rng.shuffle(edges)
+    return edges
+
+def brute_force(n, val, edges):
+    # Walk up from every node to the root and test each product directly
+    adjacent = [[] for _ in range(n)]
+    for u, v in edges:
+        adjacent[u].append(v)
+        adjacent[v].append(u)
+    parent = [None] * n
+    parent[0] = -1
+    queue = deque([0])
+    while queue:
+        node = queue.popleft()
+        for child in adjacent[node]:
+            if parent[child] is None:
+                parent[child] = node
+                queue.append(child)
+    total = 0
+    for node in range(n):
+        if parent[node] is None:
+            continue
+        ancestor = parent[node]
+        while ancestor != -1:
+            product = val[node] * val[ancestor]
+            total += math.isqrt(product) ** 2 == product
+            ancestor = parent[ancestor]
+    return total
+
+@pytest.mark.parametrize("seed", range(30))
+def test_solve_matches_brute_force(seed):
+    rng = random.Random(seed)
+    n = rng.randint(1, 40)
+    max_value = rng.choice([4, 12, 50, 1000])
+    val = [rng.randint(1, max_value) for _ in range(n)]
+    edges = random_tree_edges(n, rng)
+    assert solve(n, val, edges) == brute_force(n, val, edges)
+
+def test_solve_on_a_deep_chain():
+    # Far deeper than the recursion limit; 2 and 8 share a class, 3 and 12 another
+    n = 200_000
+    rng = random.Random(0)
+    order = list(range(1, n))
+    rng.shuffle(order)
+    path = [0] + order
+    edges = [[path[i], path[i + 1]] for i in range(n - 1)]
+    val = [0] * n
+    for depth, node in enumerate(path):
+        val[node] = (2, 8, 3, 12)[depth % 4]
+    half = n // 2
+    assert solve(n, val, edges) == 2 * (half * (half - 1) // 2)
+
+@pytest.mark.parametrize("seed", range(30))
+def test_updates_match_brute_force(seed):
+    rng = random.Random(seed)
+    n = rng.randint(1, 30)
+    max_value = rng.choice([4, 12, 50])
+    val = [rng.randint(1, max_value) for _ in range(n)]
+    edges = random_tree_edges(n, rng)
+    counter = DynamicSquareFreePairs(n, val, edges)
+    assert counter.total_pairs() == brute_force(n, val, edges)
+    for _ in range(40):
+        node = rng.randrange(n)
+        # Now and then a value past the initial sieve, which has to grow
+        val[node] = rng.randint(1, max_value * (20 if rng.random() < 0.1 else 1))
+        assert counter.update(node, val[node]) == brute_force(n, val, edges)
+    assert counter.values == val
+
+def test_updates_on_a_deep_chain():
+    n = 50_000
+    edges = [[i, i + 1] for i in range(n - 1)]
+    val = [2] * n
+    counter = DynamicSquareFreePairs(n, val, edges)
+    assert counter.total_pairs() == n * (n - 1) // 2
+    rng = random.Random(1)
+    for _ in range(200):
+        node = rng.randrange(n)
+        val[node] = rng.choice([2, 3, 8, 18, 5])
+        counter.update(node, val[node])
+    assert counter.total_pairs() == solve(n, val, edges)
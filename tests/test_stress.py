@@ -0,0 +1,64 @@
+import os
+import sys
+import json
+import shutil
+import subprocess
+
+from stress import prepare, problem_on_path, stress
+
+EXAMPLE_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "examples", "python")
+
+def test_example_solution_survives_the_stress_ladder():
+    record, function, generator = prepare(EXAMPLE_DIR, seed=0)
+    names = [name for name, _, _ in generator.params]
+    assert names == ['lattice_charges', 'background_field', 'coupling_strength', 'max_iterations']
+
+    reports = stress(function, generator, generator.size_ladder(256), cases=3)
+    assert [r['effective_size'] for r in reports] == [4, 8, 16]
+    assert all(r['failures'] == [] and r['ok'] == 3 for r in reports)
+
+def test_stress_json_can_opt_a_defaulted_parameter_in(tmp_path):
+    problem_dir = tmp_path / "gauge"
+    shutil.copytree(EXAMPLE_DIR, problem_dir)
+    with open(problem_dir / "stress.json", 'w', encoding='utf-8') as f:
+        json.dump({'params': {'return_diagnostics': {'type': 'bool'}}}, f)
+
+    _, function, generator = prepare(str(problem_dir), seed=0)
+    assert 'return_diagnostics' in [name for name, _, _ in generator.params]
+    assert 'method' not in [name for name, _, _ in generator.params]
+    reports = stress(function, generator, [4, 8], cases=4)
+    assert all(r['failures'] == [] for r in reports)
+
+LAZY_SOLUTION = '''def scaled(nums: list[int], factor: int) -> list[int]:
+    """
+    Args:
+        nums (List[int]): Values between 1 and 100.
+        factor (int): Multiplier between 1 and 10.
+    """
+    # Imported on first call, like an optional solver mode
+    from stress_lazy_helper import scale
+    return [scale(x, factor) for x in nums]
+'''
+
+def lazy_problem(tmp_path):
+    (tmp_path / "prompt.md").write_text("# Scaled\n", encoding='utf-8')
+    (tmp_path / "solution.py").write_text(LAZY_SOLUTION, encoding='utf-8')
+    (tmp_path / "stress_lazy_helper.py").write_text("def scale(x, factor):\n    return x * factor\n",
+                                                    encoding='utf-8')
+    (tmp_path / "test_solution.py").write_text("from solution import scaled\n", encoding='utf-8')
+    return str(tmp_path)
+
+def test_lazy_sibling_imports_resolve_while_stressing(tmp_path):
+    record, function, generator = prepare(lazy_problem(tmp_path), seed=0)
+    with problem_on_path(record):
+        reports = stress(function, generator, [1, 8, 64], cases=2)
+    assert all(r['failures'] == [] and r['ok'] == 2 for r in reports)
+    assert os.path.abspath(record['path']) not in sys.path
+
+def test_cli_keeps_the_problem_on_path(tmp_path):
+    problem_dir = lazy_problem(tmp_path)
+    stress_py = os.path.join(os.path.dirname(EXAMPLE_DIR), os.pardir, "stress.py")
+    for extra in ([], ["--replay", "8:1"]):
+        completed = subprocess.run([sys.executable, stress_py, problem_dir, "--max-size", "16", "--cases", "2"] + extra,
+                                   stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True)
+        assert completed.returncode == 0, completed.stdout
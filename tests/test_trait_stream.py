@@ -0,0 +1,68 @@
+import io
+import os
+import sys
+import json
+import random
+import importlib.util
+
+import pytest
+
+PROBLEM_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                           "9a1f8a44-50ef-4115-8607-556c5af01cb1")
+sys.path.insert(0, PROBLEM_DIR)
+
+from trait_stream import iter_decide, read_pairs_jsonl, stream_decide
+
+# Other problems have a solution module too, so load this one under its own name
+_spec = importlib.util.spec_from_file_location("trait_decider_solution", os.path.join(PROBLEM_DIR, "solution.py"))
+_solution = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(_solution)
+traitDecider = _solution.traitDecider
+
+TRAITS = ["hair_color", "eye_color", "vision", "blood_type", "height"]
+VALUES = ["Blue", "BlAcK", " brown ", "GREEN", "normal", "NoRmaL", "O-PosiTive", "tall", "", "AB", "  "]
+
+def random_pairs(seed, count):
+    rng = random.Random(seed)
+    def traits():
+        return {trait: rng.choice(VALUES) for trait in rng.sample(TRAITS, rng.randint(0, len(TRAITS)))}
+    return [(traits(), traits()) for _ in range(count)]
+
+def as_jsonl(pairs):
+    # Alternate the three accepted record shapes
+    lines = []
+    for i, (father, mother) in enumerate(pairs):
+        record = ({"father": father, "mother": mother}, {"fathers_trait": father, "mothers_trait": mother},
+                  [father, mother])[i % 3]
+        lines.append(json.dumps(record) + "\n")
+    return io.StringIO("".join(lines))
+
+def test_iter_decide_matches_trait_decider():
+    pairs = random_pairs(0, 2000)
+    assert list(iter_decide(pairs)) == [traitDecider(father, mother) for father, mother in pairs]
+
+@pytest.mark.parametrize("workers, chunk_size, max_in_flight", [(1, 1000, None), (2, 1, 3), (2, 7, None),
+                                                                 (3, 500, 1)])
+def test_streaming_from_jsonl_matches_trait_decider(workers, chunk_size, max_in_flight):
+    pairs = random_pairs(workers * chunk_size, 1500)
+    streamed = stream_decide(read_pairs_jsonl(as_jsonl(pairs)), workers, chunk_size, max_in_flight)
+    assert list(streamed) == [traitDecider(father, mother) for father, mother in pairs]
+
+def test_type_errors_surface_like_trait_decider():
+    pairs = random_pairs(1, 20) + [({"height": 180}, {})]
+    with pytest.raises(TypeError):
+        traitDecider(*pairs[-1])
+    with pytest.raises(TypeError):
+        list(stream_decide(pairs, workers=2, chunk_size=4))
+
+@pytest.mark.parametrize("record, missing", [
+    ({"father": {"eye_color": "Blue"}}, "mother"),
+    ({"mothers_trait": {}}, "father"),
+    ({}, "father"),
+])
+def test_records_without_parent_keys_are_rejected(record, missing):
+    with pytest.raises(ValueError, match=f"no {missing}'s traits"):
+        list(iter_decide([record]))
+    source = io.StringIO(json.dumps({"father": {}, "mother": {}}) + "\n" + json.dumps(record) + "\n")
+    with pytest.raises(ValueError, match="^Line 2: "):
+        list(read_pairs_jsonl(source))
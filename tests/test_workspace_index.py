@@ -0,0 +1,142 @@
+import os
+import json
+import shutil
+
+import pytest
+
+import workspace_index
+from workspace_index import WorkspaceIndex
+
+EXAMPLE_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "examples", "python")
+PROBLEM_FILES = ("prompt.md", "solution.py", "test_solution.py")
+
+def make_problem(path, files=PROBLEM_FILES):
+    os.makedirs(path)
+    for filename in files:
+        shutil.copy(os.path.join(EXAMPLE_DIR, filename), os.path.join(path, filename))
+
+def bump_mtime(path):
+    # Move the mtime well past the recorded one, whatever the filesystem's resolution
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 2_000_000_000))
+
+@pytest.fixture
+def workspace(tmp_path):
+    for name in ("problem-a", "problem-b"):
+        make_problem(tmp_path / name)
+    return tmp_path
+
+@pytest.fixture
+def counted(monkeypatch):
+    calls = {'hash': [], 'scan': []}
+    real_hash, real_scan = workspace_index.hash_file, workspace_index.scan_problem_dir
+    def hash_file(path):
+        calls['hash'].append(os.path.basename(path))
+        return real_hash(path)
+    def scan_problem_dir(path, previous=None):
+        calls['scan'].append(os.path.basename(path))
+        return real_scan(path, previous)
+    monkeypatch.setattr(workspace_index, "hash_file", hash_file)
+    monkeypatch.setattr(workspace_index, "scan_problem_dir", scan_problem_dir)
+    return calls
+
+def load(workspace):
+    index = WorkspaceIndex.load(str(workspace), str(workspace / ".index.json"))
+    index.save()
+    return index
+
+def ids(index):
+    return [record['id'] for record in index.problems()]
+
+def load_record_mtime(workspace, name):
+    with open(workspace / ".index.json", encoding='utf-8') as f:
+        return json.load(f)['problems'][name]['dir_mtime_ns']
+
+def test_unchanged_workspace_is_neither_rescanned_nor_rehashed(workspace, counted):
+    first = load(workspace)
+    assert ids(first) == ["problem-a", "problem-b"]
+    assert first.get("problem-a")['entrypoint'] == "gauge_field_invariance"
+
+    counted['hash'].clear()
+    counted['scan'].clear()
+    second = load(workspace)
+    assert second.records == first.records
+    assert counted == {'hash': [], 'scan': []}
+    assert not second._dirty
+
+def test_new_directory_is_picked_up(workspace, counted):
+    load(workspace)
+    make_problem(workspace / "problem-c")
+
+    counted['hash'].clear()
+    counted['scan'].clear()
+    index = load(workspace)
+    assert ids(index) == ["problem-a", "problem-b", "problem-c"]
+    assert counted['scan'] == ["problem-c"]
+    with open(workspace / ".index.json", encoding='utf-8') as f:
+        assert "problem-c" in json.load(f)['problems']
+
+def test_edited_file_is_the_only_one_rehashed(workspace, counted):
+    before = load(workspace).get("problem-b")['files']
+    solution = workspace / "problem-b" / "solution.py"
+    with open(solution, 'a', encoding='utf-8') as f:
+        f.write("\n# tweaked\n")
+    bump_mtime(solution)
+
+    counted['hash'].clear()
+    counted['scan'].clear()
+    after = load(workspace).get("problem-b")['files']
+    assert counted == {'hash': ["solution.py"], 'scan': []}
+    assert after['solution.py']['sha256'] != before['solution.py']['sha256']
+    assert after['prompt.md'] == before['prompt.md']
+
+def test_edited_test_file_re_detects_the_entrypoint(workspace):
+    load(workspace)
+    test_file = workspace / "problem-a" / "test_solution.py"
+    with open(test_file, encoding='utf-8') as f:
+        source = f.read()
+    with open(test_file, 'w', encoding='utf-8') as f:
+        f.write(source.replace("from solution import gauge_field_invariance,", "from solution import gauge_sweep,"))
+    bump_mtime(test_file)
+
+    index = load(workspace)
+    assert index.get("problem-a")['entrypoint'] == "gauge_sweep"
+    assert index.get("problem-b")['entrypoint'] == "gauge_field_invariance"
+
+def test_deleted_directory_is_dropped(workspace):
+    load(workspace)
+    shutil.rmtree(workspace / "problem-a")
+
+    index = load(workspace)
+    assert ids(index) == ["problem-b"]
+    assert index.get("problem-a") is None
+    with open(workspace / ".index.json", encoding='utf-8') as f:
+        assert "problem-a" not in json.load(f)['problems']
+
+def test_deleted_file_of_a_known_problem_is_rescanned(workspace):
+    load(workspace)
+    os.remove(workspace / "problem-a" / "test_solution.py")
+    # Keep the directory mtime as recorded so only the missing file can tell
+    os.utime(workspace / "problem-a", ns=(0, load_record_mtime(workspace, "problem-a")))
+
+    index = WorkspaceIndex.load(str(workspace), str(workspace / ".index.json"))
+    assert ids(index) == ["problem-b"]
+    assert index.skipped() == [(str(workspace / "problem-a"), "No test file found for python in "
+                                + str(workspace / "problem-a"))]
+
+def test_erroring_directory_is_skipped_until_its_listing_changes(workspace, counted):
+    make_problem(workspace / "draft", files=("solution.py", "test_solution.py"))
+    index = load(workspace)
+    assert ids(index) == ["problem-a", "problem-b"]
+    assert index.skipped() == [(str(workspace / "draft"), "no prompt.md")]
+
+    counted['hash'].clear()
+    counted['scan'].clear()
+    load(workspace)
+    assert counted == {'hash': [], 'scan': []}
+
+    shutil.copy(os.path.join(EXAMPLE_DIR, "prompt.md"), workspace / "draft" / "prompt.md")
+    bump_mtime(workspace / "draft")
+    index = load(workspace)
+    assert ids(index) == ["draft", "problem-a", "problem-b"]
+    assert index.skipped() == []
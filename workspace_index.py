@@ -0,0 +1,267 @@
+import sys
+import os
+import re
+import json
+import hashlib
+import argparse
+
+LANGUAGE_EXTENSIONS = {
+    'cpp': ['.cpp'],
+    'python': ['.py'],
+    'javascript': ['.mjs'],
+    'java': ['.java']
+}
+
+# How the entry point name can be recovered from a problem's files, in order
+# of preference. Each pattern is tried against (file role, regex).
+ENTRYPOINT_PATTERNS = {
+    'python': [('test', r"^from\s+solution\s+import\s+(\w+)"), ('solution', r"^def\s+(\w+)")],
+    'javascript': [('solution', r"^export\s+function\s+(\w+)")],
+    'cpp': [('solution', r"^class\s+(\w+)")],
+    'java': [('solution', r"^\s*(?:public\s+)?class\s+(\w+)")],
+}
+
+INDEX_FILE = ".workspace_index.json"
+INDEX_VERSION = 1
+
+def find_solution_file(base_path, files=None):
+    # List the directory once; names are matched case-insensitively so that
+    # e.g. Solution.java is found on case-sensitive filesystems too
+    files = sorted(os.listdir(base_path) if files is None else files)
+    by_lower_name = {f.lower(): f for f in files}
+
+    for lang, exts in LANGUAGE_EXTENSIONS.items():
+        for ext in exts:
+            solution_file = by_lower_name.get(f"solution{ext}")
+
+            # not this one
+            if solution_file is None:
+                continue
+
+            test_file = next((f for f in files if re.match(rf"test.*{re.escape(ext)}$", f, re.IGNORECASE)), None)
+            if test_file is None:
+                raise Exception(f"❌ No test file found for {lang} in {base_path}")
+
+            #  construct full paths
+            solution_path = os.path.join(base_path, solution_file)
+            test_path = os.path.join(base_path, test_file)
+
+            return solution_path, test_path, lang
+
+    return None, None, None
+
+def hash_file(filepath):
+    digest = hashlib.sha256()
+    with open(filepath, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 16), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+def fingerprint_files(paths, previous=None):
+    # Only re-hash a file when its mtime or size moved since the last run
+    previous = previous or {}
+    fingerprint = {}
+    for path in paths:
+        name = os.path.basename(path)
+        stat = os.stat(path)
+        known = previous.get(name)
+        if known and known['mtime_ns'] == stat.st_mtime_ns and known['size'] == stat.st_size:
+            fingerprint[name] = known
+        else:
+            fingerprint[name] = {'mtime_ns': stat.st_mtime_ns, 'size': stat.st_size, 'sha256': hash_file(path)}
+    return fingerprint
+
+def detect_entrypoint(lang, solution_path, test_path):
+    paths = {'solution': solution_path, 'test': test_path}
+    for role, pattern in ENTRYPOINT_PATTERNS.get(lang, []):
+        try:
+            with open(paths[role], 'r', encoding='utf-8') as f:
+                match = re.search(pattern, f.read(), re.MULTILINE)
+        except (OSError, UnicodeDecodeError):
+            continue
+        if match:
+            return match.group(1)
+    return None
+
+def scan_problem_dir(path, previous=None):
+    """Build the index record for one directory.
+
+    Directories that are not valid problems get a record with an 'error'
+    reason so they are not rescanned until their listing changes.
+    """
+    problem_id = os.path.basename(os.path.normpath(path))
+    record = {'id': problem_id, 'path': path, 'dir_mtime_ns': os.stat(path).st_mtime_ns}
+
+    files = [entry.name for entry in os.scandir(path) if entry.is_file()]
+    if "prompt.md" not in files:
+        record['error'] = "no prompt.md"
+        return record
+
+    try:
+        solution_path, test_path, lang = find_solution_file(path, files)
+    except Exception as e:
+        record['error'] = str(e).removeprefix("❌ ")
+        return record
+    if not solution_path:
+        record['error'] = "No solution file found in supported languages"
+        return record
+
+    record.update({
+        'language': lang,
+        'prompt': os.path.join(path, "prompt.md"),
+        'solution': solution_path,
+        'test': test_path,
+    })
+    return _refresh_files(record, previous)
+
+def _refresh_files(record, previous=None):
+    paths = [record['prompt'], record['solution'], record['test']]
+    known = previous.get('files') if previous else None
+    record['files'] = fingerprint_files(paths, known)
+
+    # The entry point only needs re-detecting when the solution or test changed
+    if previous and previous.get('entrypoint') and known and all(
+            known.get(os.path.basename(p), {}).get('sha256') == record['files'][os.path.basename(p)]['sha256']
+            for p in paths[1:]):
+        record['entrypoint'] = previous['entrypoint']
+    else:
+        record['entrypoint'] = detect_entrypoint(record['language'], record['solution'], record['test'])
+    return record
+
+class WorkspaceIndex:
+    """Persistent index of the problem directories directly under root.
+
+    A directory is only re-listed when its mtime changes; the files of known
+    problems are re-stat'ed on every refresh and re-hashed only when their
+    mtime or size moved. Lookups by id or language are dictionary reads.
+    """
+
+    def __init__(self, root=".", index_path=None):
+        self.root = root
+        self.index_path = index_path or os.path.join(root, INDEX_FILE)
+        self.records = {}
+        self._by_language = {}
+        self._dirty = False
+
+    @classmethod
+    def load(cls, root=".", index_path=None, refresh=True):
+        index = cls(root, index_path)
+        try:
+            with open(index.index_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if data.get('version') == INDEX_VERSION:
+                index.records = data.get('problems', {})
+        except (FileNotFoundError, ValueError):
+            pass
+        if refresh:
+            index.refresh()
+        else:
+            index._rebuild_language_map()
+        return index
+
+    def _path_for(self, name):
+        return name if self.root == "." else os.path.join(self.root, name)
+
+    def refresh(self):
+        seen = set()
+        with os.scandir(self.root) as entries:
+            for entry in entries:
+                if entry.name.startswith(('.', '__')) or not entry.is_dir():
+                    continue
+                seen.add(entry.name)
+                previous = self.records.get(entry.name)
+                mtime_ns = entry.stat().st_mtime_ns
+
+                if previous and previous['dir_mtime_ns'] == mtime_ns:
+                    if 'error' in previous:
+                        continue
+                    try:
+                        record = _refresh_files(dict(previous), previous)
+                    except OSError:
+                        record = scan_problem_dir(self._path_for(entry.name), previous)
+                else:
+                    record = scan_problem_dir(self._path_for(entry.name), previous)
+
+                if record != previous:
+                    self.records[entry.name] = record
+                    self._dirty = True
+
+        for name in set(self.records) - seen:
+            del self.records[name]
+            self._dirty = True
+
+        self._rebuild_language_map()
+        return self
+
+    def _rebuild_language_map(self):
+        self._by_language = {}
+        for name in sorted(self.records):
+            record = self.records[name]
+            if 'error' not in record:
+                self._by_language.setdefault(record['language'], []).append(record)
+
+    def save(self):
+        if not self._dirty and os.path.exists(self.index_path):
+            return
+        # Write to a temporary file first so an interrupted run never leaves a torn index
+        tmp_path = f"{self.index_path}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({'version': INDEX_VERSION, 'problems': self.records}, f, indent=1, sort_keys=True)
+        os.replace(tmp_path, self.index_path)
+        self._dirty = False
+
+    def get(self, problem_id):
+        record = self.records.get(os.path.basename(os.path.normpath(problem_id)))
+        if record is None or 'error' in record:
+            return None
+        return record
+
+    def lookup(self, path):
+        """Return the record for path, scanning it directly if it lives outside root."""
+        path = os.path.normpath(path)
+        if os.path.normpath(os.path.dirname(path) or ".") == os.path.normpath(self.root):
+            record = self.records.get(os.path.basename(path))
+            if record is not None:
+                return record
+        return scan_problem_dir(path)
+
+    def problems(self, language=None):
+        if language is not None:
+            return list(self._by_language.get(language, []))
+        return [record for records in self._by_language.values() for record in records]
+
+    def skipped(self):
+        return sorted((record['path'], record['error']) for record in self.records.values() if 'error' in record)
+
+def load_index(root=".", index_path=None):
+    index = WorkspaceIndex.load(root, index_path)
+    index.save()
+    return index
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="List the problems in this workspace.")
+    parser.add_argument("--language", metavar="ID", help="print the language of problem ID and exit")
+    parser.add_argument("--filter", metavar="LANG", help="only list problems written in LANG")
+    parser.add_argument("--json", action="store_true", help="print the index records as JSON")
+    parser.add_argument("--rebuild", action="store_true", help="discard the saved index and rescan everything")
+    parser.add_argument("--workspace", default=".", help="workspace root (default: .)")
+    args = parser.parse_args()
+
+    if args.rebuild and os.path.exists(os.path.join(args.workspace, INDEX_FILE)):
+        os.remove(os.path.join(args.workspace, INDEX_FILE))
+    index = load_index(args.workspace)
+
+    if args.language:
+        record = index.get(args.language)
+        if record is None:
+            print(f"❌ {args.language} is not an indexed problem directory", file=sys.stderr)
+            sys.exit(1)
+        print(record['language'])
+        sys.exit(0)
+
+    problems = index.problems(args.filter)
+    if args.json:
+        print(json.dumps(problems, indent=1, sort_keys=True))
+    else:
+        for record in problems:
+            print(f"{record['id']}  {record['language']:<10}  {record['entrypoint'] or '-'}")